@@ -0,0 +1,38 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/__init__.py
+
+This file ensures benchmarks is a package.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .benchmark_code_request import BenchmarkCodeRequest
+from .cache_memory_benchmark import CacheMemoryBenchmark
+from .import_time_benchmark import ImportTimeBenchmark
+from .in_memory_nix_flake_repo import InMemoryNixFlakeRepo
+from .nix_flake_benchmark import NixFlakeBenchmark
+from .null_event_emitter import NullEventEmitter
+from .nix_flake_benchmark_suite import NixFlakeBenchmarkSuite
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
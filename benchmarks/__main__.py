@@ -0,0 +1,142 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/__main__.py
+
+This file runs the benchmarks: python -m benchmarks --help
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+from benchmarks import (
+    CacheMemoryBenchmark,
+    ImportTimeBenchmark,
+    InMemoryNixFlakeRepo,
+    NixFlakeBenchmark,
+    NixFlakeBenchmarkSuite,
+)
+import json
+import sys
+
+
+def main(args) -> int:
+    """
+    Runs the benchmarks.
+    :param args: The command-line arguments.
+    :type args: List[str]
+    :return: The exit code.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks flake resolution and factory throughput",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=NixFlakeBenchmarkSuite.SCENARIOS,
+        help="The scenarios to run (default: all)",
+    )
+    parser.add_argument(
+        "--dependencies",
+        default="1,10,100,1000",
+        help="Comma-separated dependency counts (default: 1,10,100,1000)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        default="1,8,32",
+        help="Comma-separated concurrency levels (default: 1,8,32)",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--traced",
+        type=int,
+        default=3,
+        help="Operations traced to count allocations, 0 to skip (default: 3)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0005,
+        help="Mean latency of each repository call, in seconds (default: 0.0005)",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.0002,
+        help="Maximum deviation from the latency, in seconds (default: 0.0002)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the reports to this file")
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="Measure the import time of the package instead",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Measure the memory of cached flakes vs flake references instead",
+    )
+    parser.add_argument(
+        "--entries",
+        type=int,
+        default=100000,
+        help="Cached entries measured by --memory (default: 100000)",
+    )
+    options = parser.parse_args(args)
+    if options.imports:
+        reports = ImportTimeBenchmark(options.iterations).run()
+        print(ImportTimeBenchmark.format(reports))
+        if options.json:
+            with open(options.json, "w") as output:
+                json.dump(reports, output, indent=2)
+        return 0
+    if options.memory:
+        reports = CacheMemoryBenchmark(options.entries).run()
+        print(CacheMemoryBenchmark.format(reports))
+        if options.json:
+            with open(options.json, "w") as output:
+                json.dump(reports, output, indent=2)
+        return 0
+    suite = NixFlakeBenchmarkSuite(
+        InMemoryNixFlakeRepo(options.latency, options.jitter, options.seed),
+        NixFlakeBenchmark(options.iterations, options.warmup, options.traced),
+    )
+    reports = suite.run(
+        options.scenario or NixFlakeBenchmarkSuite.SCENARIOS,
+        [int(count) for count in options.dependencies.split(",")],
+        [int(level) for level in options.concurrency.split(",")],
+    )
+    print(NixFlakeBenchmarkSuite.format(reports))
+    if options.json:
+        with open(options.json, "w") as output:
+            json.dump(reports, output, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,104 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/benchmark_code_request.py
+
+This file defines the BenchmarkCodeRequest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+from pythoneda.shared.code_requests import Dependency, PythonedaDependency
+from pythoneda.shared.nix.flake import NixFlakeSpec
+from typing import List
+
+
+class BenchmarkCodeRequest:
+    """
+    A synthetic code request with a given number of dependencies.
+
+    Class name: BenchmarkCodeRequest
+
+    Responsibilities:
+        - Provides what the factories and NixFlakePackage read from code requests.
+        - Has a distinct identity, so its flakes are never served from caches.
+
+    Collaborators:
+        - pythoneda.shared.code_requests.Dependency
+        - pythoneda.shared.code_requests.PythonedaDependency
+    """
+
+    def __init__(self, id: int, dependencyCount: int, pythonedaRatio: float = 0.1):
+        """
+        Creates a new BenchmarkCodeRequest instance.
+        :param id: The identity of the request.
+        :type id: int
+        :param dependencyCount: The number of dependencies.
+        :type dependencyCount: int
+        :param pythonedaRatio: The fraction of dependencies on PythonEDA packages.
+        :type pythonedaRatio: float
+        """
+        super().__init__()
+        self.id = f"benchmark-{id}"
+        pythoneda_count = max(1, int(dependencyCount * pythonedaRatio))
+        self.dependencies = [
+            PythonedaDependency(
+                f"pythoneda-benchmark-{index}", "0.0.1", f"github:pythoneda/b{index}"
+            )
+            if index < pythoneda_count
+            else Dependency(f"benchmark-{index}", "1.0.0", f"github:benchmark/{index}")
+            for index in range(dependencyCount)
+        ]
+        self.nix_flake_spec = NixFlakeSpec(
+            "pythoneda-benchmark-code-request", "0.0.1", None
+        )
+
+    def to_json(self) -> str:
+        """
+        Serializes this request.
+        :return: The JSON text.
+        :rtype: str
+        """
+        return json.dumps(
+            {
+                "id": self.id,
+                "dependencies": [
+                    [dep.name, dep.version, dep.url] for dep in self.dependencies
+                ],
+            }
+        )
+
+    @classmethod
+    def many(cls, count: int, dependencyCount: int) -> List:
+        """
+        Builds several requests.
+        :param count: The number of requests.
+        :type count: int
+        :param dependencyCount: The number of dependencies of each.
+        :type dependencyCount: int
+        :return: Such requests.
+        :rtype: List[benchmarks.BenchmarkCodeRequest]
+        """
+        return [cls(index, dependencyCount) for index in range(count)]
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
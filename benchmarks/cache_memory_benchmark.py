@@ -0,0 +1,137 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/cache_memory_benchmark.py
+
+This file defines the CacheMemoryBenchmark class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import gc
+from .in_memory_nix_flake_repo import InMemoryNixFlakeRepo
+from pythoneda.artifact.nix.flake import NixFlakeRef
+from pythoneda.shared.nix.flake import NixFlake
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+
+class CacheMemoryBenchmark:
+    """
+    Measures the memory a cache of resolved flakes retains, per representation.
+
+    Class name: CacheMemoryBenchmark
+
+    Responsibilities:
+        - Fills a cache with full NixFlake instances, and with NixFlakeRef instances.
+        - Reports the memory each cache retains, in total and per entry.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRef
+        - benchmarks.InMemoryNixFlakeRepo
+    """
+
+    def __init__(self, entries: int = 100000, packages: int = 100):
+        """
+        Creates a new CacheMemoryBenchmark instance.
+        :param entries: The number of cached entries.
+        :type entries: int
+        :param packages: The number of distinct packages the entries belong to.
+        :type packages: int
+        """
+        super().__init__()
+        self._entries = entries
+        self._packages = packages
+
+    def measure(self, kind: str, build: Callable[[str, str, str], Any]) -> Dict:
+        """
+        Measures the memory retained by a cache of given representation.
+        :param kind: The name of the representation.
+        :type kind: str
+        :param build: The function building an entry from its name, version and url.
+        :type build: Callable[[str, str, str], Any]
+        :return: The report.
+        :rtype: Dict
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            cache = {}
+            for index in range(self._entries):
+                name = f"package-{index % self._packages}"
+                version = f"0.0.{index // self._packages}"
+                url = f"github:pythoneda/{name}/{version}"
+                cache[(name, version)] = build(name, version, url)
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del cache
+        return {
+            "kind": kind,
+            "entries": self._entries,
+            "bytes": retained,
+            "bytes_per_entry": retained / self._entries if self._entries else 0.0,
+        }
+
+    def run(self) -> List[Dict]:
+        """
+        Measures full flakes, and flake references.
+        :return: The reports, each with its size relative to full flakes.
+        :rtype: List[Dict]
+        """
+        class_id = NixFlakeRef.flake_class_id(NixFlake)
+        result = [
+            self.measure("NixFlake", InMemoryNixFlakeRepo.build_flake),
+            self.measure(
+                "NixFlakeRef",
+                lambda name, version, url: NixFlakeRef(name, version, url, class_id),
+            ),
+        ]
+        baseline = result[0]["bytes"]
+        for report in result:
+            report["ratio"] = report["bytes"] / baseline if baseline else 0.0
+        return result
+
+    @classmethod
+    def format(cls, reports: List[Dict]) -> str:
+        """
+        Formats given reports as a table.
+        :param reports: The reports.
+        :type reports: List[Dict]
+        :return: The table.
+        :rtype: str
+        """
+        lines = [
+            f"{'kind':<12} {'entries':>9} {'MiB':>9} {'bytes/entry':>12} {'ratio':>7}"
+        ]
+        for report in reports:
+            lines.append(
+                f"{report['kind']:<12} {report['entries']:>9} "
+                f"{report['bytes'] / (1024 * 1024):>9.2f} "
+                f"{report['bytes_per_entry']:>12.1f} {report['ratio']:>7.2f}"
+            )
+        return "\n".join(lines)
+
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
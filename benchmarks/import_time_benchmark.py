@@ -0,0 +1,136 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/import_time_benchmark.py
+
+This file defines the ImportTimeBenchmark class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import statistics
+import subprocess
+import sys
+from typing import Dict, Iterable, List
+
+
+class ImportTimeBenchmark:
+    """
+    Measures how long importing the package takes in a fresh interpreter.
+
+    Class name: ImportTimeBenchmark
+
+    Responsibilities:
+        - Runs import statements in new interpreters, several times each.
+        - Reports the median import time and the number of loaded modules.
+
+    Collaborators:
+        - None
+    """
+
+    STATEMENTS = (
+        "import pythoneda.artifact.nix.flake",
+        "from pythoneda.artifact.nix.flake import TtlLruCache",
+        "from pythoneda.artifact.nix.flake import NixFlakeRepo",
+        "from pythoneda.artifact.nix.flake import NixFlakePackage",
+        "import pythoneda.artifact.nix.flake.jupyterlab",
+        "from pythoneda.artifact.nix.flake.jupyterlab import "
+        "JupyterlabCodeRequestNixFlakeFactory",
+    )
+
+    _PROBE = (
+        "import sys, time\n"
+        "modules = len(sys.modules)\n"
+        "started = time.perf_counter()\n"
+        "{statement}\n"
+        "print(time.perf_counter() - started, len(sys.modules) - modules)\n"
+    )
+
+    def __init__(self, runs: int = 10, python: str = sys.executable):
+        """
+        Creates a new ImportTimeBenchmark instance.
+        :param runs: The number of interpreters started per statement.
+        :type runs: int
+        :param python: The interpreter.
+        :type python: str
+        """
+        super().__init__()
+        self._runs = runs
+        self._python = python
+
+    def measure(self, statement: str) -> Dict:
+        """
+        Measures an import statement.
+        :param statement: The statement.
+        :type statement: str
+        :return: The median time, in milliseconds, and the number of imported modules.
+        :rtype: Dict
+        """
+        samples = []
+        modules = 0
+        for _ in range(self._runs):
+            output = subprocess.run(
+                [
+                    self._python,
+                    "-c",
+                    self.__class__._PROBE.format(statement=statement),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()
+            samples.append(float(output[0]))
+            modules = int(output[1])
+        return {
+            "statement": statement,
+            "median_ms": statistics.median(samples) * 1000,
+            "modules": modules,
+        }
+
+    def run(self, statements: Iterable[str] = STATEMENTS) -> List[Dict]:
+        """
+        Measures given import statements.
+        :param statements: The statements.
+        :type statements: Iterable[str]
+        :return: The reports.
+        :rtype: List[Dict]
+        """
+        return [self.measure(statement) for statement in statements]
+
+    @classmethod
+    def format(cls, reports: List[Dict]) -> str:
+        """
+        Formats given reports as a table.
+        :param reports: The reports.
+        :type reports: List[Dict]
+        :return: The table.
+        :rtype: str
+        """
+        lines = [f"{'statement':<90} {'median ms':>10} {'modules':>8}"]
+        for report in reports:
+            lines.append(
+                f"{report['statement']:<90} {report['median_ms']:>10.2f} "
+                f"{report['modules']:>8}"
+            )
+        return "\n".join(lines)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,196 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/in_memory_nix_flake_repo.py
+
+This file defines the InMemoryNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import NixFlakeRegistry, NixFlakeRepo
+from pythoneda.shared.code_requests import CodeExecutionNixFlake, CodeRequest
+from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequestNixFlake
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+import random
+import threading
+import time
+from typing import Dict, Iterable
+
+
+class InMemoryNixFlakeRepo(NixFlakeRepo):
+    """
+    A deterministic, in-memory NixFlakeRepo simulating a slow backend.
+
+    Class name: InMemoryNixFlakeRepo
+
+    Responsibilities:
+        - Answers every lookup from memory, after a configurable latency.
+        - Draws the jitter of each call from a seeded generator, for reproducibility.
+        - Counts the calls it receives.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        versions: Dict[str, str] = None,
+        unresolvable: Iterable[str] = (),
+    ):
+        """
+        Creates a new InMemoryNixFlakeRepo instance.
+        :param latency: The mean duration of each call, in seconds.
+        :type latency: float
+        :param jitter: The maximum deviation from the mean duration, in seconds.
+        :type jitter: float
+        :param seed: The seed of the jitter generator.
+        :type seed: int
+        :param versions: The latest version of each package, if not "1.0.0".
+        :type versions: Dict[str, str]
+        :param unresolvable: The names of the flakes that cannot be resolved.
+        :type unresolvable: Iterable[str]
+        """
+        super().__init__()
+        self._latency = latency
+        self._jitter = jitter
+        self._random = random.Random(seed)
+        self._versions = dict((name, "1.0.0") for name in NixFlakeRegistry.names())
+        self._versions.update(versions or {})
+        self._unresolvable = frozenset(unresolvable)
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        """
+        Retrieves the number of calls received so far.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._calls
+
+    @classmethod
+    def build_flake(cls, name: str, version: str, url: str = None) -> NixFlake:
+        """
+        Builds a flake with no inputs.
+        :param name: The flake name.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :param url: The url, if any.
+        :type url: str
+        :return: Such flake.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return NixFlake(
+            name,
+            version,
+            url or f"github:pythoneda/{name}/{version}",
+            [],
+            None,
+            name,
+            f"https://github.com/pythoneda/{name}",
+            [],
+            [],
+            2023,
+        )
+
+    def wait(self):
+        """
+        Simulates the latency of a call.
+        """
+        with self._lock:
+            self._calls += 1
+            delay = self._latency
+            if self._jitter:
+                delay += self._random.uniform(-self._jitter, self._jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def latest_code_execution(self, codeRequest: CodeRequest) -> CodeExecutionNixFlake:
+        """
+        Retrieves the latest version of the nix flake for executing code.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.CodeExecutionNixFlake
+        """
+        self.wait()
+        return CodeExecutionNixFlake(codeRequest, [])
+
+    def latest_Jupyterlab_for_code_requests(
+        self, codeRequest: CodeRequest
+    ) -> JupyterlabCodeRequestNixFlake:
+        """
+        Retrieves the latest version of the nix flake for Jupyterlab.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.jupyter.JupyterlabCodeRequestNixFlake
+        """
+        self.wait()
+        return JupyterlabCodeRequestNixFlake(codeRequest, "latest", [])
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the version of the latest Nix flake of given package.
+        :param name: The flake name.
+        :type name: str
+        :return: Such version, or None if the package is unknown.
+        :rtype: str
+        """
+        self.wait()
+        return self._versions.get(name, None)
+
+    def find(self, name: str, version: str) -> NixFlake:
+        """
+        Retrieves a specific version of the Nix flake of given package.
+        :param name: The flake name.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        self.wait()
+        if name in self._unresolvable:
+            return None
+        return self.__class__.build_flake(name, version)
+
+    def resolve_exact(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification, whose version is not a range.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        self.wait()
+        if spec.name in self._unresolvable:
+            return None
+        return self.__class__.build_flake(spec.name, spec.version, spec.url)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
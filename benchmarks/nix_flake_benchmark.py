@@ -0,0 +1,223 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/nix_flake_benchmark.py
+
+This file defines the NixFlakeBenchmark class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import math
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Dict, List
+
+
+class NixFlakeBenchmark:
+    """
+    Measures the throughput, latency and allocations of an operation.
+
+    Class name: NixFlakeBenchmark
+
+    Responsibilities:
+        - Runs an operation a number of times, with a given concurrency.
+        - Reports operations per second and p50/p99 latencies.
+        - Reports the memory allocated per operation, in a separate traced pass.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(
+        self, iterations: int = 20, warmup: int = 2, tracedIterations: int = 3
+    ):
+        """
+        Creates a new NixFlakeBenchmark instance.
+        :param iterations: The number of measured operations per run.
+        :type iterations: int
+        :param warmup: The number of unmeasured operations before each run.
+        :type warmup: int
+        :param tracedIterations: The number of operations traced to count allocations.
+        :type tracedIterations: int
+        """
+        super().__init__()
+        self._iterations = iterations
+        self._warmup = warmup
+        self._traced_iterations = tracedIterations
+
+    @property
+    def iterations(self) -> int:
+        """
+        Retrieves the number of measured operations per run.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._iterations
+
+    @property
+    def unmeasured_iterations(self) -> int:
+        """
+        Retrieves the number of warmup and traced operations per run.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._warmup + self._traced_iterations
+
+    @classmethod
+    def percentile(cls, samples: List[float], fraction: float) -> float:
+        """
+        Retrieves a percentile of given samples, by the nearest-rank method.
+        :param samples: The samples, sorted.
+        :type samples: List[float]
+        :param fraction: The percentile, between 0 and 1.
+        :type fraction: float
+        :return: Such percentile, or 0 if there are no samples.
+        :rtype: float
+        """
+        if not samples:
+            return 0.0
+        rank = max(1, math.ceil(fraction * len(samples)))
+        return samples[rank - 1]
+
+    def _report(self, wall: float, samples: List[float], allocations: Dict) -> Dict:
+        """
+        Summarizes a run.
+        :param wall: The duration of the whole run, in seconds.
+        :type wall: float
+        :param samples: The duration of each operation, in seconds.
+        :type samples: List[float]
+        :param allocations: The allocation figures.
+        :type allocations: Dict
+        :return: The report.
+        :rtype: Dict
+        """
+        samples = sorted(samples)
+        result = {
+            "operations": len(samples),
+            "ops_per_second": len(samples) / wall if wall > 0 else float("inf"),
+            "p50_ms": self.__class__.percentile(samples, 0.5) * 1000,
+            "p99_ms": self.__class__.percentile(samples, 0.99) * 1000,
+        }
+        result.update(allocations)
+        return result
+
+    def _traced(self, operation: Callable[[int], None]) -> Dict:
+        """
+        Runs an operation sequentially under tracemalloc.
+        :param operation: The operation, receiving the iteration number.
+        :type operation: Callable[[int], None]
+        :return: The mean allocated and retained bytes and blocks per operation.
+        :rtype: Dict
+        """
+        count = self._traced_iterations
+        if count < 1:
+            return {}
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            peak = 0
+            for iteration in range(count):
+                tracemalloc.reset_peak()
+                current, _ = tracemalloc.get_traced_memory()
+                operation(-1 - iteration)
+                peak += tracemalloc.get_traced_memory()[1] - current
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        differences = after.compare_to(before, "filename")
+        return {
+            "peak_bytes_per_op": peak // count,
+            "retained_bytes_per_op": sum(diff.size_diff for diff in differences)
+            // count,
+            "retained_blocks_per_op": sum(diff.count_diff for diff in differences)
+            // count,
+        }
+
+    def run(self, operation: Callable[[int], None], concurrency: int = 1) -> Dict:
+        """
+        Measures a synchronous operation.
+        :param operation: The operation, receiving the iteration number.
+        :type operation: Callable[[int], None]
+        :param concurrency: The number of threads running operations at once.
+        :type concurrency: int
+        :return: The report.
+        :rtype: Dict
+        """
+        for iteration in range(self._warmup):
+            operation(-1 - self._traced_iterations - iteration)
+        allocations = self._traced(operation)
+
+        def timed(iteration: int) -> float:
+            started = time.perf_counter()
+            operation(iteration)
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            samples = list(executor.map(timed, range(self._iterations)))
+        return self._report(time.perf_counter() - started, samples, allocations)
+
+    def run_async(
+        self, operation: Callable[[int], Awaitable], concurrency: int = 1
+    ) -> Dict:
+        """
+        Measures an asynchronous operation.
+        :param operation: The coroutine function, receiving the iteration number.
+        :type operation: Callable[[int], Awaitable]
+        :param concurrency: The number of operations awaited at once.
+        :type concurrency: int
+        :return: The report.
+        :rtype: Dict
+        """
+
+        async def measure() -> Dict:
+            for iteration in range(self._warmup):
+                await operation(-1 - self._traced_iterations - iteration)
+            samples = []
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def timed(iteration: int):
+                async with semaphore:
+                    started = time.perf_counter()
+                    await operation(iteration)
+                    samples.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*[timed(index) for index in range(self._iterations)])
+            return time.perf_counter() - started, samples
+
+        loop = asyncio.new_event_loop()
+        try:
+            allocations = self._traced(
+                lambda iteration: loop.run_until_complete(operation(iteration))
+            )
+        finally:
+            loop.close()
+        wall, samples = asyncio.run(measure())
+        return self._report(wall, samples, allocations)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,192 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/nix_flake_benchmark_suite.py
+
+This file defines the NixFlakeBenchmarkSuite class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .benchmark_code_request import BenchmarkCodeRequest
+from .in_memory_nix_flake_repo import InMemoryNixFlakeRepo
+from .nix_flake_benchmark import NixFlakeBenchmark
+from .null_event_emitter import NullEventEmitter
+from pythoneda import EventEmitter, Ports
+from pythoneda.artifact.nix.flake import (
+    CodeExecutionNixFlakeFactory,
+    NixFlakePackage,
+    NixFlakeRepo,
+)
+from pythoneda.artifact.nix.flake.jupyterlab import (
+    JupyterlabCodeRequestNixFlakeFactory,
+)
+from types import SimpleNamespace
+from typing import Dict, Iterable, List
+
+
+class NixFlakeBenchmarkSuite:
+    """
+    Benchmarks the flake factories and NixFlakePackage listeners.
+
+    Class name: NixFlakeBenchmarkSuite
+
+    Responsibilities:
+        - Wires an InMemoryNixFlakeRepo into the ports.
+        - Measures each scenario across dependency counts and concurrency levels.
+        - Formats the results as a table.
+
+    Collaborators:
+        - benchmarks.InMemoryNixFlakeRepo
+        - benchmarks.NixFlakeBenchmark
+    """
+
+    SCENARIOS = (
+        "CodeExecutionNixFlakeFactory.create",
+        "JupyterlabCodeRequestNixFlakeFactory.create",
+        "NixFlakePackage.listen_ChangeStagingCodeDescribed",
+        "NixFlakePackage.listen_ChangeStagingCodeExecutionRequested",
+    )
+
+    def __init__(self, repo: InMemoryNixFlakeRepo, benchmark: NixFlakeBenchmark):
+        """
+        Creates a new NixFlakeBenchmarkSuite instance.
+        :param repo: The repository stand-in.
+        :type repo: benchmarks.InMemoryNixFlakeRepo
+        :param benchmark: The harness.
+        :type benchmark: benchmarks.NixFlakeBenchmark
+        """
+        super().__init__()
+        self._repo = repo
+        self._benchmark = benchmark
+
+    def setup(self):
+        """
+        Registers the repository stand-in, and forgets whatever the factories cached.
+        """
+        Ports.initialize({NixFlakeRepo: self._repo, EventEmitter: NullEventEmitter()})
+        for factory in (
+            CodeExecutionNixFlakeFactory,
+            JupyterlabCodeRequestNixFlakeFactory,
+        ):
+            factory.output_cache().clear()
+            factory.dependency_graph().forget()
+
+    def run_scenario(
+        self, scenario: str, dependencyCount: int, concurrency: int
+    ) -> Dict:
+        """
+        Measures a scenario.
+        :param scenario: The scenario, one of SCENARIOS.
+        :type scenario: str
+        :param dependencyCount: The number of dependencies of each code request.
+        :type dependencyCount: int
+        :param concurrency: The number of operations running at once.
+        :type concurrency: int
+        :return: The report.
+        :rtype: Dict
+        """
+        self.setup()
+        requests = {
+            index: BenchmarkCodeRequest(index, dependencyCount)
+            for index in range(
+                -self._benchmark.unmeasured_iterations, self._benchmark.iterations
+            )
+        }
+        if scenario not in self.__class__.SCENARIOS:
+            raise ValueError(f"Unknown scenario {scenario}")
+        owner, method = scenario.split(".")
+        if owner == "CodeExecutionNixFlakeFactory":
+            factory = CodeExecutionNixFlakeFactory.instance()
+        elif owner == "JupyterlabCodeRequestNixFlakeFactory":
+            factory = JupyterlabCodeRequestNixFlakeFactory.instance()
+        else:
+            factory = None
+        if factory is not None:
+            result = self._benchmark.run(
+                lambda index: factory.create(requests[index], []), concurrency
+            )
+        else:
+            listener = getattr(NixFlakePackage, method)
+            result = self._benchmark.run_async(
+                lambda index: listener(
+                    SimpleNamespace(code_request=requests[index], id=str(index))
+                ),
+                concurrency,
+            )
+        result.update(
+            {
+                "scenario": scenario,
+                "dependencies": dependencyCount,
+                "concurrency": concurrency,
+            }
+        )
+        return result
+
+    def run(
+        self,
+        scenarios: Iterable[str] = SCENARIOS,
+        dependencyCounts: Iterable[int] = (1, 10, 100, 1000),
+        concurrencies: Iterable[int] = (1, 8, 32),
+    ) -> List[Dict]:
+        """
+        Measures every combination of scenario, dependency count and concurrency.
+        :param scenarios: The scenarios.
+        :type scenarios: Iterable[str]
+        :param dependencyCounts: The dependency counts.
+        :type dependencyCounts: Iterable[int]
+        :param concurrencies: The concurrency levels.
+        :type concurrencies: Iterable[int]
+        :return: The reports.
+        :rtype: List[Dict]
+        """
+        return [
+            self.run_scenario(scenario, dependency_count, concurrency)
+            for scenario in scenarios
+            for dependency_count in dependencyCounts
+            for concurrency in concurrencies
+        ]
+
+    @classmethod
+    def format(cls, reports: List[Dict]) -> str:
+        """
+        Formats given reports as a table.
+        :param reports: The reports.
+        :type reports: List[Dict]
+        :return: The table.
+        :rtype: str
+        """
+        lines = [
+            f"{'scenario':<60} {'deps':>5} {'conc':>4} {'ops/s':>10} "
+            f"{'p50 ms':>9} {'p99 ms':>9} {'peak KiB/op':>12} {'kept KiB/op':>12}"
+        ]
+        for report in reports:
+            lines.append(
+                f"{report['scenario']:<60} {report['dependencies']:>5} "
+                f"{report['concurrency']:>4} {report['ops_per_second']:>10.1f} "
+                f"{report['p50_ms']:>9.3f} {report['p99_ms']:>9.3f} "
+                f"{report.get('peak_bytes_per_op', 0) / 1024:>12.1f} "
+                f"{report.get('retained_bytes_per_op', 0) / 1024:>12.1f}"
+            )
+        return "\n".join(lines)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -21,9 +21,110 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
-from .nix_flake_repo import NixFlakeRepo
-from .nix_flake_package import NixFlakePackage
-from .code_execution_nix_flake_factory import CodeExecutionNixFlakeFactory
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "TtlLruCache": ".ttl_lru_cache",
+    "NixFlakeMetrics": ".nix_flake_metrics",
+    "NixFlakeVersion": ".nix_flake_version",
+    "NixFlakeVersionRange": ".nix_flake_version_range",
+    "NixFlakeVersionIndex": ".nix_flake_version_index",
+    "NixFlakeInputSet": ".nix_flake_input_set",
+    "NixFlakeOutputCache": ".nix_flake_output_cache",
+    "NixFlakeRegistryEntry": ".nix_flake_registry_entry",
+    "NixFlakeRegistry": ".nix_flake_registry",
+    "NixFlakeRepo": ".nix_flake_repo",
+    "NixFlakeRef": ".nix_flake_ref",
+    "NixFlakeDependencyGraph": ".nix_flake_dependency_graph",
+    "IncrementalNixFlakeResolver": ".incremental_nix_flake_resolver",
+    "NixFlakeRepoDecorator": ".nix_flake_repo_decorator",
+    "CachingNixFlakeRepo": ".caching_nix_flake_repo",
+    "NegativeCachingNixFlakeRepo": ".negative_caching_nix_flake_repo",
+    "InstrumentedNixFlakeRepo": ".instrumented_nix_flake_repo",
+    "NixFlakeRepoRefresher": ".nix_flake_repo_refresher",
+    "SingleFlight": ".single_flight",
+    "SingleFlightNixFlakeRepo": ".single_flight_nix_flake_repo",
+    "NixFlakeResolutionStore": ".nix_flake_resolution_store",
+    "PersistentNixFlakeRepo": ".persistent_nix_flake_repo",
+    "NixFlakeCatalog": ".nix_flake_catalog",
+    "CatalogNixFlakeRepo": ".catalog_nix_flake_repo",
+    "NixFlakeLockfile": ".nix_flake_lockfile",
+    "RecordingNixFlakeRepo": ".recording_nix_flake_repo",
+    "NixFlakeBaseInputs": ".nix_flake_base_inputs",
+    "AsyncNixFlakeRepo": ".async_nix_flake_repo",
+    "ExecutorAsyncNixFlakeRepo": ".executor_async_nix_flake_repo",
+    "NixFlakeResolutionBatcher": ".nix_flake_resolution_batcher",
+    "NixFlakeWorkQueue": ".nix_flake_work_queue",
+    "NixFlakePackage": ".nix_flake_package",
+    "CodeRequestNixFlakeFactory": ".code_request_nix_flake_factory",
+    "CodeExecutionNixFlakeFactory": ".code_execution_nix_flake_factory",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """
+    Imports the module defining given attribute on first access (PEP 562), so
+    importing this package doesn't import all of its dependencies.
+    :param name: The attribute name.
+    :type name: str
+    :return: The attribute.
+    :rtype: Any
+    """
+    module = _EXPORTS.get(name, None)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    result = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    """
+    Lists the attributes of this package, including the not-yet-imported ones.
+    :return: Such attributes.
+    :rtype: List[str]
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from .ttl_lru_cache import TtlLruCache
+    from .nix_flake_metrics import NixFlakeMetrics
+    from .nix_flake_version import NixFlakeVersion
+    from .nix_flake_version_range import NixFlakeVersionRange
+    from .nix_flake_version_index import NixFlakeVersionIndex
+    from .nix_flake_input_set import NixFlakeInputSet
+    from .nix_flake_output_cache import NixFlakeOutputCache
+    from .nix_flake_registry_entry import NixFlakeRegistryEntry
+    from .nix_flake_registry import NixFlakeRegistry
+    from .nix_flake_repo import NixFlakeRepo
+    from .nix_flake_ref import NixFlakeRef
+    from .nix_flake_dependency_graph import NixFlakeDependencyGraph
+    from .incremental_nix_flake_resolver import IncrementalNixFlakeResolver
+    from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+    from .caching_nix_flake_repo import CachingNixFlakeRepo
+    from .negative_caching_nix_flake_repo import NegativeCachingNixFlakeRepo
+    from .instrumented_nix_flake_repo import InstrumentedNixFlakeRepo
+    from .nix_flake_repo_refresher import NixFlakeRepoRefresher
+    from .single_flight import SingleFlight
+    from .single_flight_nix_flake_repo import SingleFlightNixFlakeRepo
+    from .nix_flake_resolution_store import NixFlakeResolutionStore
+    from .persistent_nix_flake_repo import PersistentNixFlakeRepo
+    from .nix_flake_catalog import NixFlakeCatalog
+    from .catalog_nix_flake_repo import CatalogNixFlakeRepo
+    from .nix_flake_lockfile import NixFlakeLockfile
+    from .recording_nix_flake_repo import RecordingNixFlakeRepo
+    from .nix_flake_base_inputs import NixFlakeBaseInputs
+    from .async_nix_flake_repo import AsyncNixFlakeRepo
+    from .executor_async_nix_flake_repo import ExecutorAsyncNixFlakeRepo
+    from .nix_flake_resolution_batcher import NixFlakeResolutionBatcher
+    from .nix_flake_work_queue import NixFlakeWorkQueue
+    from .nix_flake_package import NixFlakePackage
+    from .code_request_nix_flake_factory import CodeRequestNixFlakeFactory
+    from .code_execution_nix_flake_factory import CodeExecutionNixFlakeFactory
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
 # Local Variables:
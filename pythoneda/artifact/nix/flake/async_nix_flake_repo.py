@@ -0,0 +1,153 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/async_nix_flake_repo.py
+
+This file defines the AsyncNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import abc
+import asyncio
+from pythoneda.shared.code_requests import CodeExecutionNixFlake, CodeRequest
+from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequestNixFlake
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import List
+
+
+class AsyncNixFlakeRepo(abc.ABC):
+    """
+    The asynchronous counterpart of NixFlakeRepo.
+
+    Class name: AsyncNixFlakeRepo
+
+    Responsibilities:
+        - Retrieves nix flakes based on certain criteria, without blocking the event loop.
+        - Exposes the operations of NixFlakeRepo by package name, as coroutines.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    async def default_latest_flakes(self) -> List:
+        """
+        Retrieves the latest Nix flakes for the default packages.
+        :return: The Nix flakes for NixOS, FlakeUtils, pythoneda-shared-pythoneda/banner
+        and pythoneda-shared-pythoneda/domain.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return list(
+            await asyncio.gather(
+                self.latest("nixos"),
+                self.latest("flake-utils"),
+                self.latest("pythoneda-shared-pythoneda-banner"),
+                self.latest("pythoneda-shared-pythoneda-domain"),
+            )
+        )
+
+    @abc.abstractmethod
+    async def latest_code_execution(
+        self, codeRequest: CodeRequest
+    ) -> CodeExecutionNixFlake:
+        """
+        Retrieves the latest version of the nix flake for executing code.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.CodeExecutionNixFlake
+        """
+        pass
+
+    @abc.abstractmethod
+    async def latest_Jupyterlab_for_code_requests(
+        self, codeRequest: CodeRequest
+    ) -> JupyterlabCodeRequestNixFlake:
+        """
+        Retrieves the latest version of the nix flake for Jupyterlab.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.jupyter.JupyterlabCodeRequestNixFlake
+        """
+        pass
+
+    @abc.abstractmethod
+    async def resolve(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        pass
+
+    async def resolve_many(self, specs: List) -> List:
+        """
+        Resolves given specifications concurrently.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return list(await asyncio.gather(*[self.resolve(spec) for spec in specs]))
+
+    async def latest(self, name: str) -> NixFlake:
+        """
+        Retrieves the latest Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        version = await self.latest_version(name)
+        if version is None:
+            return None
+        return await self.find(name, version)
+
+    @abc.abstractmethod
+    async def latest_version(self, name: str) -> str:
+        """
+        Retrieves the version of the latest Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such version, or None if the package is unknown.
+        :rtype: str
+        """
+        pass
+
+    @abc.abstractmethod
+    async def find(self, name: str, version: str) -> NixFlake:
+        """
+        Retrieves a specific version of the Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        pass
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
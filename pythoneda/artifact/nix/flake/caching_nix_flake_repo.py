@@ -0,0 +1,176 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/caching_nix_flake_repo.py
+
+This file defines the CachingNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_metrics import NixFlakeMetrics
+from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from .ttl_lru_cache import TtlLruCache
+from pythoneda.shared.nix.flake import NixFlake
+from typing import Callable
+
+
+class CachingNixFlakeRepo(NixFlakeRepoDecorator):
+    """
+    A NixFlakeRepo that memoizes the version and flake lookups of another one.
+
+    Class name: CachingNixFlakeRepo
+
+    Responsibilities:
+        - Remembers the latest version of each package for a configurable time.
+        - Remembers the flakes found for each package and version.
+        - Evicts the least recently used entries when full.
+        - Allows refreshing and invalidating entries explicitly.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepoDecorator
+        - pythoneda.artifact.nix.flake.TtlLruCache
+    """
+
+    def __init__(
+        self,
+        delegate: NixFlakeRepo,
+        ttl: float = 300.0,
+        maxEntries: int = 1024,
+        metrics: NixFlakeMetrics = None,
+    ):
+        """
+        Creates a new CachingNixFlakeRepo instance.
+        :param delegate: The decorated repository.
+        :type delegate: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param ttl: How long, in seconds, each lookup is remembered.
+        :type ttl: float
+        :param maxEntries: The maximum number of remembered lookups.
+        :type maxEntries: int
+        :param metrics: The metrics recording cache hits and misses, or None to use
+        the shared instance.
+        :type metrics: pythoneda.artifact.nix.flake.NixFlakeMetrics
+        """
+        super().__init__(delegate)
+        self._cache = TtlLruCache(ttl, maxEntries)
+        self._metrics = metrics or NixFlakeMetrics.instance()
+
+    @property
+    def cache(self) -> TtlLruCache:
+        """
+        Retrieves the underlying cache.
+        :return: Such cache.
+        :rtype: pythoneda.artifact.nix.flake.TtlLruCache
+        """
+        return self._cache
+
+    def lookup_latest_version(self, package: str, retrieve: Callable[[], str]) -> str:
+        """
+        Retrieves the latest version of given package, from the cache if possible.
+        :param package: The package.
+        :type package: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], str]
+        :return: Such version.
+        :rtype: str
+        """
+        key = ("latest", package)
+        found, result = self._cache.lookup(key)
+        self._metrics.record_cache("caching", "latest_version", package, found)
+        if not found:
+            result = retrieve()
+            if result is not None:
+                self._cache.put(key, result)
+        return result
+
+    def lookup_version(
+        self, package: str, version: str, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package, from the cache if possible.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        key = ("find", package, version)
+        found, result = self._cache.lookup(key)
+        self._metrics.record_cache("caching", "find", package, found)
+        if not found:
+            result = retrieve()
+            if result is not None:
+                self._cache.put(key, result)
+        return result
+
+    def refresh(self, package: str) -> str:
+        """
+        Queries the decorated repository for the latest version of given package,
+        and caches it together with its flake. The flake of a given version does
+        not change, so an already cached one is kept, but its lifetime is renewed.
+        :param package: The flake name.
+        :type package: str
+        :return: The latest version, or None if unknown.
+        :rtype: str
+        """
+        result = self._delegate.latest_version(package)
+        if result is not None:
+            self._cache.put(("latest", package), result)
+            key = ("find", package, result)
+            found, flake = self._cache.lookup(key)
+            if not found:
+                flake = self._delegate.find(package, result)
+            if flake is not None:
+                self._cache.put(key, flake)
+        return result
+
+    def invalidate(self, package: str = None) -> int:
+        """
+        Forgets the cached lookups of given package, or all of them.
+        :param package: The flake name, or None to clear the whole cache.
+        :type package: str
+        :return: The number of forgotten entries.
+        :rtype: int
+        """
+        if package is None:
+            result = len(self._cache)
+            self._cache.clear()
+            return result
+        return self._cache.invalidate_matching(lambda key: key[1] == package)
+
+    def invalidate_version(self, package: str, version: str) -> bool:
+        """
+        Forgets the cached flake of given package and version.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :return: True if the entry was cached.
+        :rtype: bool
+        """
+        return self._cache.invalidate(("find", package, version))
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
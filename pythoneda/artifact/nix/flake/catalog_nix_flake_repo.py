@@ -0,0 +1,296 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/catalog_nix_flake_repo.py
+
+This file defines the CatalogNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_catalog import NixFlakeCatalog
+from .nix_flake_repo import NixFlakeRepo
+from pythoneda.shared.code_requests import CodeExecutionNixFlake, CodeRequest
+from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequestNixFlake
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Dict, List, Tuple
+
+
+class CatalogNixFlakeRepo(NixFlakeRepo):
+    """
+    A NixFlakeRepo answering from a local NixFlakeCatalog, without network access.
+
+    Class name: CatalogNixFlakeRepo
+
+    Responsibilities:
+        - Answers version, flake and spec lookups from the catalog.
+        - Optionally asks a fallback repository on misses, adding what it finds.
+        - Queries, inserts, updates and deletes flakes through the catalog indexes.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeCatalog
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    def __init__(self, catalog: NixFlakeCatalog, fallback: NixFlakeRepo = None):
+        """
+        Creates a new CatalogNixFlakeRepo instance.
+        :param catalog: The catalog.
+        :type catalog: pythoneda.artifact.nix.flake.NixFlakeCatalog
+        :param fallback: The repository to ask on misses, if any.
+        :type fallback: pythoneda.artifact.nix.flake.NixFlakeRepo
+        """
+        super().__init__()
+        self._catalog = catalog
+        self._fallback = fallback
+
+    @property
+    def catalog(self) -> NixFlakeCatalog:
+        """
+        Retrieves the catalog.
+        :return: Such catalog.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeCatalog
+        """
+        return self._catalog
+
+    @property
+    def fallback(self) -> NixFlakeRepo:
+        """
+        Retrieves the repository asked on misses.
+        :return: Such repository, or None.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeRepo
+        """
+        return self._fallback
+
+    def latest_code_execution(self, codeRequest: CodeRequest) -> CodeExecutionNixFlake:
+        """
+        Retrieves the latest version of the nix flake for executing code.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.CodeExecutionNixFlake
+        """
+        if self._fallback is not None:
+            return self._fallback.latest_code_execution(codeRequest)
+        from .code_execution_nix_flake_factory import CodeExecutionNixFlakeFactory
+
+        return CodeExecutionNixFlakeFactory.instance().create(codeRequest)
+
+    def latest_Jupyterlab_for_code_requests(
+        self, codeRequest: CodeRequest
+    ) -> JupyterlabCodeRequestNixFlake:
+        """
+        Retrieves the latest version of the nix flake for Jupyterlab.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.jupyter.JupyterlabCodeRequestNixFlake
+        """
+        if self._fallback is not None:
+            return self._fallback.latest_Jupyterlab_for_code_requests(codeRequest)
+        from .jupyterlab import JupyterlabCodeRequestNixFlakeFactory
+
+        return JupyterlabCodeRequestNixFlakeFactory.instance().create(codeRequest)
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the version of the latest Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such version, or None if unknown.
+        :rtype: str
+        """
+        result = self._catalog.latest_version(name)
+        if result is None and self._fallback is not None:
+            result = self._fallback.latest_version(name)
+        return result
+
+    def find(self, name: str, version: str) -> NixFlake:
+        """
+        Retrieves a specific version of the Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        result = self._catalog.get(name, version)
+        if result is None and self._fallback is not None:
+            result = self._fallback.find(name, version)
+            if result is not None:
+                self._catalog.add(result)
+        return result
+
+    def versions(self, name: str, newerThan: str = None) -> List[str]:
+        """
+        Retrieves the available versions of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param newerThan: If provided, only versions newer than this one are retrieved.
+        :type newerThan: str
+        :return: Such versions.
+        :rtype: List[str]
+        """
+        result = self._catalog.versions(name)
+        if not result and self._fallback is not None:
+            return self._fallback.versions(name, newerThan)
+        if newerThan is not None:
+            result = self._catalog.matching(name, f">{newerThan}")
+        return result
+
+    def resolve(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        result = self._catalog.resolve(spec)
+        if result is None and self._fallback is not None:
+            result = self._fallback.resolve(spec)
+            if result is not None:
+                self._catalog.add(result)
+        return result
+
+    def resolve_exact(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification, whose version is not a range. The catalog
+        handles ranges itself, so this is the same as resolve().
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self.resolve(spec)
+
+    def resolve_many(self, specs: List, failures: List = None) -> List:
+        """
+        Resolves given specifications from the catalog, asking the fallback
+        repository, in a single batch, only for the missing ones.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param failures: If given, the list receiving the specifications whose
+        resolution failed or timed out.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        specs = list(specs)
+        result = [self._catalog.resolve(spec) for spec in specs]
+        missing = [index for index, flake in enumerate(result) if flake is None]
+        if missing and self._fallback is not None:
+            resolved = self._fallback.resolve_many(
+                [specs[index] for index in missing], failures
+            )
+            for index, flake in zip(missing, resolved):
+                if flake is not None:
+                    self._catalog.add(flake)
+                    result[index] = flake
+        return result
+
+    def find_by_id(self, idValue: str) -> NixFlake:
+        """
+        Retrieves a flake by its url.
+        :param idValue: The url.
+        :type idValue: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        result = self._catalog.find_by_attribute("url", idValue)
+        if result:
+            return result[0]
+        return None
+
+    def find_by_pk(self, idValue: Tuple[str, str, str]) -> NixFlake:
+        """
+        Retrieves a flake by its name, version and url.
+        :param idValue: The name, version and url.
+        :type idValue: Tuple[str, str, str]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        name, version, url = idValue
+        return self._catalog.get(name, version, url)
+
+    def find_by_attribute(self, attributeName: str, attributeValue: str) -> List:
+        """
+        Retrieves the flakes matching given attribute criteria.
+        :param attributeName: The name of the attribute: name, version, url,
+        url_prefix, flake_class or inputs.
+        :type attributeName: str
+        :param attributeValue: The value of the attribute.
+        :type attributeValue: str
+        :return: The matching flakes, or an empty list if none found.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return self._catalog.find_by_attribute(attributeName, attributeValue)
+
+    def filter(self, dictionary: Dict) -> List:
+        """
+        Retrieves the flakes matching all given criteria, such as
+        {"inputs": "grpcio", "url_prefix": "github:pythoneda-shared-pythoneda-def/"}.
+        Each value can also be a list of accepted values.
+        :param dictionary: The filter.
+        :type dictionary: Dict
+        :return: The matching flakes, or an empty list if none found.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return self._catalog.filter(dictionary)
+
+    def insert(self, item: NixFlake):
+        """
+        Adds a flake to the catalog.
+        :param item: The flake.
+        :type item: pythoneda.shared.nix.flake.NixFlake
+        """
+        self._catalog.add(item)
+
+    def update(self, item: NixFlake):
+        """
+        Replaces the flake with the same name, version and url.
+        :param item: The flake.
+        :type item: pythoneda.shared.nix.flake.NixFlake
+        """
+        self._catalog.remove(item)
+        self._catalog.add(item)
+
+    def delete(self, idValue: str):
+        """
+        Removes the flakes with given url.
+        :param idValue: The url.
+        :type idValue: str
+        """
+        for flake in self._catalog.find_by_attribute("url", idValue):
+            self._catalog.remove(flake)
+
+    def list(self) -> List:
+        """
+        Retrieves all flakes in the catalog.
+        :return: Such flakes, sorted by name, version and url.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return self._catalog.filter({})
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
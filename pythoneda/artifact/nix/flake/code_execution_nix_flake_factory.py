@@ -19,15 +19,14 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from .nix_flake_repo import NixFlakeRepo
-from pythoneda import BaseObject, Ports
-from pythoneda.shared.code_requests import CodeExecutionNixFlake, PythonedaDependency
+from .code_request_nix_flake_factory import CodeRequestNixFlakeFactory
+from .nix_flake_base_inputs import NixFlakeBaseInputs
+from pythoneda.shared.code_requests import CodeExecutionNixFlake
 from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequest
-from pythoneda.shared.nix.flake import NixFlakeSpec
 from typing import List
 
 
-class CodeExecutionNixFlakeFactory(BaseObject):
+class CodeExecutionNixFlakeFactory(CodeRequestNixFlakeFactory):
 
     """
     A factory for Nix flakes to execute code.
@@ -38,10 +37,19 @@ class CodeExecutionNixFlakeFactory(BaseObject):
         - Is able to build CodeExecutionNixFlake instances.
 
     Collaborators:
+        - pythoneda.artifact.nix.flake.CodeRequestNixFlakeFactory
         - pythoneda.shared.code_requests.CodeExecutionNixFlake
     """
 
     _singleton = None
+    _base_inputs = NixFlakeBaseInputs(
+        [
+            "nixos",
+            "flake-utils",
+            "pythoneda-shared-pythoneda-banner",
+            "pythoneda-shared-pythoneda-domain",
+        ]
+    )
 
     def __init__(self):
         """
@@ -61,58 +69,28 @@ class CodeExecutionNixFlakeFactory(BaseObject):
 
         return cls._singleton
 
-    def create(
+    @classmethod
+    def kind(cls) -> str:
+        """
+        Retrieves the kind of flakes this factory builds.
+        :return: Such kind.
+        :rtype: str
+        """
+        return CodeExecutionNixFlake.__name__
+
+    def build(
         self, codeRequest: JupyterlabCodeRequest, inputs: List
     ) -> CodeExecutionNixFlake:
         """
-        Creates a new CodeExecutionNixFlake instance.
+        Builds a new CodeExecutionNixFlake instance.
         :param codeRequest: The code request.
         :type codeRequest: pythoneda.shared.code_requests.jupyterlab.JupyterlabCodeRequest
-        :param inputs: The flake inputs.
+        :param inputs: The resolved flake inputs.
         :type inputs: List[pythoneda.shared.nix.flake.NixFlake]
         :return: The Nix flake.
-        :rtype: pythoneda.shared.nix.flake.NixFlake
-        """
-        return CodeExecutionNixFlake(
-            codeRequest, self.__class__.dependencies_to_inputs(inputs, codeRequest)
-        )
-
-    @classmethod
-    def dependencies_to_inputs(
-        cls, inputs: List, codeRequest: JupyterlabCodeRequest
-    ) -> List:
+        :rtype: pythoneda.shared.code_requests.CodeExecutionNixFlake
         """
-        Converts the dependencies of given code request to a list of NixFlake instances.
-        :param codeRequest: The code request.
-        :type codeRequest: pythoneda.shared.code_requests.JupyterlabCodeRequest
-        :param inputs: The flake inputs.
-        :type inputs: List[pythoneda.shared.nix.flake.NixFlake]
-        :return: The list of NixFlake instances.
-        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
-        """
-        nix_flake_repo = Ports.instance().resolve(NixFlakeRepo)
-
-        result = inputs
-        pythoneda_dependencies = [
-            nix_flake_repo.latest_Nixos(),
-            nix_flake_repo.latest_FlakeUtils(),
-            nix_flake_repo.latest_PythonedaSharedPythonedaBanner(),
-        ]
-        for dep in codeRequest.dependencies:
-            if isinstance(dep, PythonedaDependency):
-                deps = pythoneda_dependencies
-                if dep.name != "pythoneda-shared-pythoneda-domain":
-                    deps.append(nix_flake_repo.latest_PythonedaSharedPythonedaDomain())
-            resolved_flake = nix_flake_repo.resolve(
-                NixFlakeSpec(dep.name, dep.version, dep.url)
-            )
-            if resolved_flake is None:
-                CodeExecutionNixFlakeFactory.logger().error(
-                    f"Cannot resolve flake for {dep.name}-{dep.version}"
-                )
-            else:
-                result.append(resolved_flake)
-        return list(set(result))
+        return CodeExecutionNixFlake(codeRequest, inputs)
 
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
@@ -0,0 +1,247 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/code_request_nix_flake_factory.py
+
+This file defines the CodeRequestNixFlakeFactory class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import abc
+from .incremental_nix_flake_resolver import IncrementalNixFlakeResolver
+from .nix_flake_base_inputs import NixFlakeBaseInputs
+from .nix_flake_dependency_graph import NixFlakeDependencyGraph
+from .nix_flake_input_set import NixFlakeInputSet
+from .nix_flake_metrics import NixFlakeMetrics
+from .nix_flake_output_cache import NixFlakeOutputCache
+from .nix_flake_repo import NixFlakeRepo
+from pythoneda import BaseObject, Ports
+from pythoneda.shared.code_requests import CodeRequest
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Iterable, List, Tuple
+
+
+class CodeRequestNixFlakeFactory(BaseObject, abc.ABC):
+    """
+    The common logic of the factories building Nix flakes for code requests.
+
+    Class name: CodeRequestNixFlakeFactory
+
+    Responsibilities:
+        - Resolves the dependencies of code requests into flake inputs.
+        - Reuses the flakes already built for the same code request and inputs.
+        - Lets subclasses build the actual flake.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeOutputCache
+        - pythoneda.artifact.nix.flake.NixFlakeDependencyGraph
+        - pythoneda.artifact.nix.flake.IncrementalNixFlakeResolver
+    """
+
+    _base_inputs = NixFlakeBaseInputs([])
+    _output_cache = NixFlakeOutputCache()
+    _dependency_graph = NixFlakeDependencyGraph()
+    _incremental_resolver = None
+
+    @classmethod
+    @abc.abstractmethod
+    def kind(cls) -> str:
+        """
+        Retrieves the kind of flakes this factory builds, to tell them apart in the
+        shared output cache.
+        :return: Such kind, usually the name of the flake class.
+        :rtype: str
+        """
+        pass
+
+    @abc.abstractmethod
+    def build(self, codeRequest: CodeRequest, inputs: List[NixFlake]) -> NixFlake:
+        """
+        Builds the flake of given code request.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :param inputs: The resolved flake inputs.
+        :type inputs: List[pythoneda.shared.nix.flake.NixFlake]
+        :return: The Nix flake.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        pass
+
+    def create(self, codeRequest: CodeRequest, inputs: Iterable = ()) -> NixFlake:
+        """
+        Creates the flake of given code request, or retrieves the one already built
+        for the same code request and inputs.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :param inputs: The flake inputs, which are never modified.
+        :type inputs: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :return: The Nix flake.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        cls = self.__class__
+        cache = cls.output_cache()
+        kind = cls.kind()
+        inputs = NixFlakeInputSet.of(inputs)
+        request_digest = None
+        if not cls.dependency_graph().has_declarations():
+            request_digest = NixFlakeOutputCache.request_digest(
+                kind, codeRequest, inputs
+            )
+        if request_digest is not None:
+            result = cache.lookup(request_digest)
+            if result is not None:
+                return result
+        resolved_inputs = cls.dependencies_to_inputs(inputs, codeRequest)
+        digest = NixFlakeOutputCache.digest(kind, codeRequest, resolved_inputs)
+        result = cache.get(digest) if digest is not None else None
+        if result is None:
+            result = self.build(codeRequest, resolved_inputs.to_list())
+            if digest is not None:
+                cache.put(digest, result)
+        if (
+            request_digest is not None
+            and digest is not None
+            and all(
+                resolved_inputs.get(dependency.name) is not None
+                for dependency in codeRequest.dependencies
+            )
+        ):
+            cache.remember(request_digest, digest)
+        return result
+
+    @classmethod
+    def output_cache(cls) -> NixFlakeOutputCache:
+        """
+        Retrieves the cache of the flakes built by the factories.
+        :return: Such cache.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeOutputCache
+        """
+        return cls._output_cache
+
+    @classmethod
+    def base_inputs(cls) -> NixFlakeBaseInputs:
+        """
+        Retrieves the base inputs of the flakes built by this factory.
+        :return: Such inputs.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeBaseInputs
+        """
+        return cls._base_inputs
+
+    @classmethod
+    def dependency_graph(cls) -> NixFlakeDependencyGraph:
+        """
+        Retrieves the graph used to compute the transitive inputs of the flakes.
+        :return: Such graph.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeDependencyGraph
+        """
+        return cls._dependency_graph
+
+    @classmethod
+    def declare_dependencies(cls, name: str, dependencies: Iterable[str]):
+        """
+        Declares the flakes given flake needs, so the flakes of code requests
+        depending on it include their latest versions too.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param dependencies: The names of the flakes it depends on.
+        :type dependencies: Iterable[str]
+        """
+        cls.dependency_graph().declare(name, dependencies)
+
+    @classmethod
+    def use_incremental_resolution(
+        cls, resolver: IncrementalNixFlakeResolver = None, enabled: bool = True
+    ):
+        """
+        Enables or disables re-resolving only the dependencies that changed since the
+        previous request with the same identity.
+        :param resolver: The resolver to use, or None for a default one.
+        :type resolver: pythoneda.artifact.nix.flake.IncrementalNixFlakeResolver
+        :param enabled: Whether to enable incremental resolution.
+        :type enabled: bool
+        """
+        if not enabled:
+            cls._incremental_resolver = None
+        else:
+            cls._incremental_resolver = resolver or IncrementalNixFlakeResolver()
+
+    @classmethod
+    def baseline(cls, nixFlakeRepo: NixFlakeRepo = None) -> Tuple:
+        """
+        Retrieves the current base inputs of this factory. They are not added to the
+        flakes automatically: callers wanting them pass them as inputs to create().
+        :param nixFlakeRepo: The repository, or None to use the configured one.
+        :type nixFlakeRepo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :return: The base inputs.
+        :rtype: Tuple[pythoneda.shared.nix.flake.NixFlake, ...]
+        """
+        if nixFlakeRepo is None:
+            nixFlakeRepo = Ports.instance().resolve(NixFlakeRepo)
+        return cls.base_inputs().flakes(nixFlakeRepo)
+
+    @classmethod
+    def dependencies_to_inputs(
+        cls, inputs: Iterable, codeRequest: CodeRequest
+    ) -> NixFlakeInputSet:
+        """
+        Adds the flakes of the dependencies of given code request to given inputs.
+        The inputs are never modified, so a shared baseline can be passed to every
+        request without copying it.
+        :param inputs: The flake inputs.
+        :type inputs: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: A new set with the inputs and the flakes of the dependencies.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeInputSet
+        """
+        with NixFlakeMetrics.instance().measure(
+            "dependencies_to_inputs", cls.__name__
+        ):
+            nix_flake_repo = Ports.instance().resolve(NixFlakeRepo)
+
+            dependencies = list(codeRequest.dependencies)
+            roots = []
+            if cls._incremental_resolver is None:
+                resolved_flakes = nix_flake_repo.resolve_many(
+                    [
+                        NixFlakeSpec(dep.name, dep.version, dep.url)
+                        for dep in dependencies
+                    ]
+                )
+            else:
+                resolved_flakes = cls._incremental_resolver.resolve(
+                    nix_flake_repo, codeRequest, dependencies
+                )
+            for dep, resolved_flake in zip(dependencies, resolved_flakes):
+                if resolved_flake is None:
+                    cls.logger().error(
+                        f"Cannot resolve flake for {dep.name}-{dep.version}"
+                    )
+                else:
+                    roots.append(resolved_flake)
+            return NixFlakeInputSet.of(inputs).union(
+                cls.dependency_graph().closure(nix_flake_repo, roots)
+            )
+
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,169 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/executor_async_nix_flake_repo.py
+
+This file defines the ExecutorAsyncNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+from .async_nix_flake_repo import AsyncNixFlakeRepo
+from concurrent.futures import Executor
+import functools
+from .nix_flake_repo import NixFlakeRepo
+from pythoneda.shared.code_requests import CodeExecutionNixFlake, CodeRequest
+from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequestNixFlake
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Any, Callable, List
+
+
+class ExecutorAsyncNixFlakeRepo(AsyncNixFlakeRepo):
+    """
+    An AsyncNixFlakeRepo running a synchronous NixFlakeRepo in an executor.
+
+    Class name: ExecutorAsyncNixFlakeRepo
+
+    Responsibilities:
+        - Offloads each NixFlakeRepo call to an executor, so the event loop keeps running.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.AsyncNixFlakeRepo
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    def __init__(self, repo: NixFlakeRepo, executor: Executor = None):
+        """
+        Creates a new ExecutorAsyncNixFlakeRepo instance.
+        :param repo: The synchronous repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param executor: The executor, or None to use the event loop's default one.
+        :type executor: concurrent.futures.Executor
+        """
+        super().__init__()
+        self._repo = repo
+        self._executor = executor
+
+    @property
+    def repo(self) -> NixFlakeRepo:
+        """
+        Retrieves the synchronous repository.
+        :return: Such repository.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeRepo
+        """
+        return self._repo
+
+    async def offload(self, function: Callable, *args) -> Any:
+        """
+        Runs given function in the executor.
+        :param function: The function.
+        :type function: Callable
+        :param args: The function arguments.
+        :type args: List
+        :return: The function result.
+        :rtype: Any
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(function, *args)
+        )
+
+    async def resolve_many(self, specs: List) -> List:
+        """
+        Resolves given specifications, in a single executor call.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return await self.offload(self._repo.resolve_many, list(specs))
+
+    async def latest_code_execution(
+        self, codeRequest: CodeRequest
+    ) -> CodeExecutionNixFlake:
+        """
+        Retrieves the latest version of the nix flake for executing code.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.CodeExecutionNixFlake
+        """
+        return await self.offload(self._repo.latest_code_execution, codeRequest)
+
+    async def latest_Jupyterlab_for_code_requests(
+        self, codeRequest: CodeRequest
+    ) -> JupyterlabCodeRequestNixFlake:
+        """
+        Retrieves the latest version of the nix flake for Jupyterlab.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.jupyter.JupyterlabCodeRequestNixFlake
+        """
+        return await self.offload(
+            self._repo.latest_Jupyterlab_for_code_requests, codeRequest
+        )
+
+    async def resolve(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return await self.offload(self._repo.resolve, spec)
+
+    async def latest(self, name: str) -> NixFlake:
+        """
+        Retrieves the latest Nix flake of given package, in a single executor call.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return await self.offload(self._repo.latest, name)
+
+    async def latest_version(self, name: str) -> str:
+        """
+        Retrieves the version of the latest Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such version, or None if the package is unknown.
+        :rtype: str
+        """
+        return await self.offload(self._repo.latest_version, name)
+
+    async def find(self, name: str, version: str) -> NixFlake:
+        """
+        Retrieves a specific version of the Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return await self.offload(self._repo.find, name, version)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
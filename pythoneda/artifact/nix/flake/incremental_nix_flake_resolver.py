@@ -0,0 +1,134 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/incremental_nix_flake_resolver.py
+
+This file defines the IncrementalNixFlakeResolver class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_repo import NixFlakeRepo
+from .ttl_lru_cache import TtlLruCache
+from pythoneda.shared.code_requests import CodeRequest
+from pythoneda.shared.nix.flake import NixFlakeSpec
+from typing import Hashable, List, Tuple
+
+
+class IncrementalNixFlakeResolver:
+    """
+    Re-resolves only the dependencies of a code request that changed since last time.
+
+    Class name: IncrementalNixFlakeResolver
+
+    Responsibilities:
+        - Remembers the flakes resolved for each code request with an id.
+        - Reuses them for unchanged (name, version, url) dependencies.
+        - Resolves the new or changed dependencies in a single batch.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+        - pythoneda.artifact.nix.flake.TtlLruCache
+    """
+
+    def __init__(self, ttl: float = 600.0, maxRequests: int = 256):
+        """
+        Creates a new IncrementalNixFlakeResolver instance.
+        :param ttl: How long, in seconds, the resolutions of a code request are remembered.
+        :type ttl: float
+        :param maxRequests: The maximum number of code requests remembered.
+        :type maxRequests: int
+        """
+        super().__init__()
+        self._memos = TtlLruCache(ttl, maxRequests)
+
+    @classmethod
+    def identity(cls, codeRequest: CodeRequest) -> Hashable:
+        """
+        Retrieves the identity under which the resolutions of given code request are
+        remembered.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Its id, or None if it has none, so its resolutions cannot be told
+        apart from those of other requests and are not remembered.
+        :rtype: Hashable
+        """
+        return getattr(codeRequest, "id", None)
+
+    @classmethod
+    def dependency_key(cls, dependency) -> Tuple[str, str, str]:
+        """
+        Retrieves the identity of given dependency.
+        :param dependency: The dependency.
+        :type dependency: pythoneda.shared.code_requests.Dependency
+        :return: Its name, version and url.
+        :rtype: Tuple[str, str, str]
+        """
+        return (dependency.name, dependency.version, dependency.url)
+
+    def resolve(
+        self, repo: NixFlakeRepo, codeRequest: CodeRequest, dependencies: List
+    ) -> List:
+        """
+        Resolves given dependencies of a code request.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :param dependencies: The dependencies.
+        :type dependencies: List[pythoneda.shared.code_requests.Dependency]
+        :return: The resolved flakes, in the same order as the dependencies,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        identity = self.__class__.identity(codeRequest)
+        previous = {} if identity is None else self._memos.get(identity, {})
+        keys = [self.__class__.dependency_key(dep) for dep in dependencies]
+        result = [previous.get(key, None) for key in keys]
+        missing = [position for position, flake in enumerate(result) if flake is None]
+        if missing:
+            resolved = repo.resolve_many(
+                [NixFlakeSpec(*keys[position]) for position in missing]
+            )
+            for position, flake in zip(missing, resolved):
+                result[position] = flake
+        if identity is not None:
+            self._memos.put(
+                identity,
+                {key: flake for key, flake in zip(keys, result) if flake is not None},
+            )
+        return result
+
+    def forget(self, codeRequest: CodeRequest = None):
+        """
+        Forgets the resolutions of given code request, or of all of them.
+        :param codeRequest: The code request, or None to forget everything.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        """
+        if codeRequest is None:
+            self._memos.clear()
+        else:
+            identity = self.__class__.identity(codeRequest)
+            if identity is not None:
+                self._memos.invalidate(identity)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
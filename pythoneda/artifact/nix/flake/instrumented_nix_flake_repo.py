@@ -0,0 +1,168 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/instrumented_nix_flake_repo.py
+
+This file defines the InstrumentedNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_metrics import NixFlakeMetrics
+from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from pythoneda.shared.code_requests import CodeExecutionNixFlake, CodeRequest
+from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequestNixFlake
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Callable, List
+
+
+class InstrumentedNixFlakeRepo(NixFlakeRepoDecorator):
+    """
+    A NixFlakeRepo that records metrics about the lookups of another one.
+
+    Class name: InstrumentedNixFlakeRepo
+
+    Responsibilities:
+        - Measures every version, flake and spec lookup, per method and package.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeMetrics
+        - pythoneda.artifact.nix.flake.NixFlakeRepoDecorator
+    """
+
+    def __init__(self, delegate: NixFlakeRepo, metrics: NixFlakeMetrics = None):
+        """
+        Creates a new InstrumentedNixFlakeRepo instance.
+        :param delegate: The decorated repository.
+        :type delegate: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param metrics: The metrics, or None to use the shared instance.
+        :type metrics: pythoneda.artifact.nix.flake.NixFlakeMetrics
+        """
+        super().__init__(delegate)
+        self._metrics = metrics or NixFlakeMetrics.instance()
+
+    @property
+    def metrics(self) -> NixFlakeMetrics:
+        """
+        Retrieves the metrics.
+        :return: Such metrics.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeMetrics
+        """
+        return self._metrics
+
+    def lookup_latest_version(self, package: str, retrieve: Callable[[], str]) -> str:
+        """
+        Retrieves the latest version of given package, measuring the lookup.
+        :param package: The package.
+        :type package: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], str]
+        :return: Such version.
+        :rtype: str
+        """
+        with self._metrics.measure("latest_version", package):
+            return retrieve()
+
+    def lookup_version(
+        self, package: str, version: str, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package, measuring the lookup.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        with self._metrics.measure("find", package):
+            return retrieve()
+
+    def lookup_spec(
+        self, spec: NixFlakeSpec, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Resolves given specification, measuring the resolution.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        with self._metrics.measure("resolve", self.__class__.spec_key(spec)[1]):
+            return retrieve()
+
+    def lookup_specs(
+        self, specs: List, retrieve: Callable[[List], List], failures: List
+    ) -> List:
+        """
+        Resolves given specifications, measuring the batch.
+        While metrics are enabled, each specification is resolved on its own, via
+        resolve() and concurrently, so its duration is recorded per package too.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param retrieve: The function querying the decorated repository, given the
+        list receiving the specifications whose resolution fails.
+        :type retrieve: Callable[[List], List[pythoneda.shared.nix.flake.NixFlake]]
+        :param failures: The list receiving the specifications whose resolution
+        failed or timed out, as opposed to those without a compatible flake.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        if not self._metrics.enabled:
+            return retrieve(failures)
+        with self._metrics.measure("resolve_many"):
+            return self.resolve_concurrently(
+                specs, self._resolution_timeout, failures
+            )
+
+    def latest_code_execution(self, codeRequest: CodeRequest) -> CodeExecutionNixFlake:
+        """
+        Retrieves the latest version of the nix flake for executing code.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.CodeExecutionNixFlake
+        """
+        with self._metrics.measure("latest_code_execution"):
+            return super().latest_code_execution(codeRequest)
+
+    def latest_Jupyterlab_for_code_requests(
+        self, codeRequest: CodeRequest
+    ) -> JupyterlabCodeRequestNixFlake:
+        """
+        Retrieves the latest version of the nix flake for Jupyterlab.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.jupyter.JupyterlabCodeRequestNixFlake
+        """
+        with self._metrics.measure("latest_Jupyterlab_for_code_requests"):
+            return super().latest_Jupyterlab_for_code_requests(codeRequest)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
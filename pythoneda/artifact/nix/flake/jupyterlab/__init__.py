@@ -21,9 +21,47 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
-from .jupyterlab_code_request_nix_flake_factory import (
-    JupyterlabCodeRequestNixFlakeFactory,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "JupyterlabCodeRequestNixFlakeFactory": (
+        ".jupyterlab_code_request_nix_flake_factory"
+    ),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """
+    Imports the module defining given attribute on first access (PEP 562).
+    :param name: The attribute name.
+    :type name: str
+    :return: The attribute.
+    :rtype: Any
+    """
+    module = _EXPORTS.get(name, None)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    result = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = result
+    return result
+
+
+def __dir__():
+    """
+    Lists the attributes of this package, including the not-yet-imported ones.
+    :return: Such attributes.
+    :rtype: List[str]
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from .jupyterlab_code_request_nix_flake_factory import (
+        JupyterlabCodeRequestNixFlakeFactory,
+    )
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
 # Local Variables:
@@ -19,18 +19,18 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from pythoneda import BaseObject, Ports
-from pythoneda.artifact.nix.flake import NixFlakeRepo
-from pythoneda.shared.code_requests import PythonedaDependency
+from pythoneda.artifact.nix.flake import (
+    CodeRequestNixFlakeFactory,
+    NixFlakeBaseInputs,
+)
 from pythoneda.shared.code_requests.jupyterlab import (
     JupyterlabCodeRequest,
     JupyterlabCodeRequestNixFlake,
 )
-from pythoneda.shared.nix.flake import NixFlakeSpec
-from typing import Dict, List
+from typing import List
 
 
-class JupyterlabCodeRequestNixFlakeFactory(BaseObject):
+class JupyterlabCodeRequestNixFlakeFactory(CodeRequestNixFlakeFactory):
 
     """
     A factory for Jupyterlab's Nix flakes.
@@ -41,10 +41,20 @@ class JupyterlabCodeRequestNixFlakeFactory(BaseObject):
         - Is able to build JupyterlabCodeRequestNixFlake instances.
 
     Collaborators:
+        - pythoneda.artifact.nix.flake.CodeRequestNixFlakeFactory
         - pythoneda.shared.code_requests.jupyterlab.JupyterlabCodeRequestNixFlake
     """
 
     _singleton = None
+    _base_inputs = NixFlakeBaseInputs(
+        [
+            "nixos",
+            "flake-utils",
+            "pythoneda-shared-pythoneda-banner",
+            "jupyterlab",
+            "pythoneda-shared-pythoneda-domain",
+        ]
+    )
 
     def __init__(self):
         """
@@ -64,60 +74,28 @@ class JupyterlabCodeRequestNixFlakeFactory(BaseObject):
 
         return cls._singleton
 
-    def create(self, codeRequest: JupyterlabCodeRequest, inputs: List):
+    @classmethod
+    def kind(cls) -> str:
         """
-        Creates a new JupyterlabNixFlake instance.
-        :param codeRequest: The code request.
-        :type codeRequest: pythoneda.shared.code_requests.jupyterlab.JupyterlabCodeRequest
-        :param inputs: The flake inputs.
-        :type inputs: List[pythoneda.shared.nix.flake.NixFlake]
-        :return: The Nix flake.
-        :rtype: pythoneda.shared.nix.flake.NixFlake
+        Retrieves the kind of flakes this factory builds.
+        :return: Such kind.
+        :rtype: str
         """
-        return JupyterlabCodeRequestNixFlake(
-            codeRequest,
-            "latest",
-            self.__class__.dependencies_to_inputs(inputs, codeRequest),
-        )
+        return JupyterlabCodeRequestNixFlake.__name__
 
-    @classmethod
-    def dependencies_to_inputs(
-        cls, inputs: List, codeRequest: JupyterlabCodeRequest
-    ) -> List:
+    def build(
+        self, codeRequest: JupyterlabCodeRequest, inputs: List
+    ) -> JupyterlabCodeRequestNixFlake:
         """
-        Converts the dependencies of given code request to a list of NixFlake instances.
+        Builds a new JupyterlabCodeRequestNixFlake instance.
         :param codeRequest: The code request.
-        :type codeRequest: pythoneda.shared.code_requests.JupyterlabCodeRequest
-        :param inputs: The flake inputs.
+        :type codeRequest: pythoneda.shared.code_requests.jupyterlab.JupyterlabCodeRequest
+        :param inputs: The resolved flake inputs.
         :type inputs: List[pythoneda.shared.nix.flake.NixFlake]
-        :return: The list of NixFlake instances.
-        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        :return: The Nix flake.
+        :rtype: pythoneda.shared.code_requests.jupyterlab.JupyterlabCodeRequestNixFlake
         """
-        nix_flake_repo = Ports.instance().resolve(NixFlakeRepo)
-
-        result = inputs
-        pythonedaDependencies = [
-            nix_flake_repo.latest_Nixos(),
-            nix_flake_repo.latest_FlakeUtils(),
-            nix_flake_repo.latest_PythonedaSharedPythonedaBanner(),
-            nix_flake_repo.latest_Jupyterlab(),
-        ]
-        for dep in codeRequest.dependencies:
-            deps = []
-            if isinstance(dep, PythonedaDependency):
-                deps = pythonedaDependencies
-                if dep.name != "pythoneda-shared-pythoneda-domain":
-                    deps.append(nix_flake_repo.latest_PythonedaSharedPythonedaDomain())
-            resolved_flake = nix_flake_repo.resolve(
-                NixFlakeSpec(dep.name, dep.version, dep.url)
-            )
-            if resolved_flake is None:
-                JupyterlabCodeRequestNixFlakeFactory.logger().error(
-                    f"Cannot resolve flake for {dep.name}-{dep.version}"
-                )
-            else:
-                result.append(resolved_flake)
-        return list(set(result))
+        return JupyterlabCodeRequestNixFlake(codeRequest, "latest", inputs)
 
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
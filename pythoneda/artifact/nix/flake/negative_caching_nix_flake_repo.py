@@ -0,0 +1,215 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/negative_caching_nix_flake_repo.py
+
+This file defines the NegativeCachingNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_metrics import NixFlakeMetrics
+from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from .ttl_lru_cache import TtlLruCache
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Callable, List
+
+
+class NegativeCachingNixFlakeRepo(NixFlakeRepoDecorator):
+    """
+    A NixFlakeRepo that remembers, for a short while, which lookups found nothing.
+
+    Class name: NegativeCachingNixFlakeRepo
+
+    Responsibilities:
+        - Remembers the specs and versions the decorated repository could not find,
+          but not those it gave up on after an error or a timeout.
+        - Answers repeated lookups of them with None, without querying it again.
+        - Allows purging those entries explicitly.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepoDecorator
+        - pythoneda.artifact.nix.flake.TtlLruCache
+    """
+
+    def __init__(
+        self,
+        delegate: NixFlakeRepo,
+        ttl: float = 30.0,
+        maxEntries: int = 4096,
+        metrics: NixFlakeMetrics = None,
+    ):
+        """
+        Creates a new NegativeCachingNixFlakeRepo instance.
+        :param delegate: The decorated repository.
+        :type delegate: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param ttl: How long, in seconds, each miss is remembered.
+        :type ttl: float
+        :param maxEntries: The maximum number of remembered misses.
+        :type maxEntries: int
+        :param metrics: The metrics recording cache hits and misses, or None to use
+        the shared instance.
+        :type metrics: pythoneda.artifact.nix.flake.NixFlakeMetrics
+        """
+        super().__init__(delegate)
+        self._misses = TtlLruCache(ttl, maxEntries)
+        self._metrics = metrics or NixFlakeMetrics.instance()
+
+    @property
+    def misses(self) -> TtlLruCache:
+        """
+        Retrieves the remembered misses.
+        :return: Such cache.
+        :rtype: pythoneda.artifact.nix.flake.TtlLruCache
+        """
+        return self._misses
+
+    def is_known_miss(self, spec: NixFlakeSpec) -> bool:
+        """
+        Checks whether given specification is known to be unresolvable.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: True if so.
+        :rtype: bool
+        """
+        return self._misses.lookup(("resolve",) + self.__class__.spec_key(spec))[0]
+
+    def lookup_version(
+        self, package: str, version: str, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package, unless it's known
+        to be missing.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        key = ("find", package, version)
+        known = self._misses.lookup(key)[0]
+        self._metrics.record_cache("negative", "find", package, known)
+        if known:
+            return None
+        result = retrieve()
+        if result is None:
+            self._misses.put(key, True)
+        return result
+
+    def lookup_spec(
+        self, spec: NixFlakeSpec, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Resolves given specification, unless it's known to be unresolvable.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        key = ("resolve",) + self.__class__.spec_key(spec)
+        known = self._misses.lookup(key)[0]
+        self._metrics.record_cache("negative", "resolve", key[2], known)
+        if known:
+            return None
+        result = retrieve()
+        if result is None:
+            self._misses.put(key, True)
+        return result
+
+    def lookup_specs(
+        self, specs: List, retrieve: Callable[[List], List], failures: List
+    ) -> List:
+        """
+        Resolves given specifications, querying the decorated repository only for
+        those not known to be unresolvable. Specifications whose resolution failed
+        or timed out are not remembered as unresolvable.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param retrieve: The function querying the decorated repository, given the
+        list receiving the specifications whose resolution fails.
+        :type retrieve: Callable[[List], List[pythoneda.shared.nix.flake.NixFlake]]
+        :param failures: The list receiving the specifications whose resolution
+        failed or timed out, as opposed to those without a compatible flake.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        keys = [("resolve",) + self.__class__.spec_key(spec) for spec in specs]
+        result = [None] * len(specs)
+        pending = []
+        for index, key in enumerate(keys):
+            known = self._misses.lookup(key)[0]
+            self._metrics.record_cache("negative", "resolve", key[2], known)
+            if not known:
+                pending.append(index)
+        failed = []
+        if len(pending) == len(specs):
+            resolved = retrieve(failed)
+        elif pending:
+            resolved = self._delegate.resolve_many(
+                [specs[index] for index in pending], failed
+            )
+        else:
+            resolved = []
+        failures.extend(failed)
+        failed = {("resolve",) + self.__class__.spec_key(spec) for spec in failed}
+        for index, flake in zip(pending, resolved):
+            result[index] = flake
+            if flake is None and keys[index] not in failed:
+                self._misses.put(keys[index], True)
+        return result
+
+    def purge(self, spec: NixFlakeSpec = None) -> int:
+        """
+        Forgets that given specification could not be resolved, or forgets all misses.
+        :param spec: The specification, or None to forget every miss.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: The number of forgotten entries.
+        :rtype: int
+        """
+        if spec is None:
+            result = len(self._misses)
+            self._misses.clear()
+            return result
+        return int(
+            self._misses.invalidate(("resolve",) + self.__class__.spec_key(spec))
+        )
+
+    def purge_package(self, package: str) -> int:
+        """
+        Forgets every miss concerning given package.
+        :param package: The package.
+        :type package: str
+        :return: The number of forgotten entries.
+        :rtype: int
+        """
+        return self._misses.invalidate_matching(
+            lambda key: (key[2] if key[0] == "resolve" else key[1]) == package
+        )
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,194 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_base_inputs.py
+
+This file defines the NixFlakeBaseInputs class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_repo import NixFlakeRepo
+from pythoneda import BaseObject
+import threading
+import time
+from typing import List, Tuple
+import weakref
+
+
+class NixFlakeBaseInputs(BaseObject):
+    """
+    A precomputed, immutable set of the flake inputs every generated flake needs.
+
+    Class name: NixFlakeBaseInputs
+
+    Responsibilities:
+        - Resolves the latest flakes of a fixed list of packages, once per repository.
+        - Refreshes them when they get older than a maximum age, on demand or in the
+          background, only re-fetching the flakes whose upstream versions changed.
+        - Hands out the current inputs as an immutable tuple.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    def __init__(self, packages: List[str], maxAge: float = 300.0):
+        """
+        Creates a new NixFlakeBaseInputs instance.
+        :param packages: The flake names, as registered in NixFlakeRegistry.
+        :type packages: List[str]
+        :param maxAge: The seconds after which the inputs are checked again, or None
+        to keep them until refreshed explicitly.
+        :type maxAge: float
+        """
+        super().__init__()
+        self._packages = tuple(packages)
+        self._max_age = maxAge
+        self._snapshots = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stop = None
+        self._thread = None
+
+    @property
+    def packages(self) -> Tuple[str, ...]:
+        """
+        Retrieves the packages.
+        :return: Such packages.
+        :rtype: Tuple[str, ...]
+        """
+        return self._packages
+
+    @property
+    def max_age(self) -> float:
+        """
+        Retrieves the seconds after which the inputs are checked again.
+        :return: Such age, or None if they never expire.
+        :rtype: float
+        """
+        return self._max_age
+
+    def refresh(self, repo: NixFlakeRepo) -> bool:
+        """
+        Checks the latest versions of the packages, and rebuilds the inputs if any changed.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :return: True if the inputs changed.
+        :rtype: bool
+        """
+        with self._lock:
+            previous, _ = self._snapshots.get(repo, (None, None))
+            current = dict(
+                (package, (version, flake))
+                for package, version, flake in (previous or ())
+            )
+            snapshot = []
+            for package in self._packages:
+                version = repo.latest_version(package)
+                known_version, flake = current.get(package, (None, None))
+                if flake is None or known_version != version:
+                    flake = repo.find(package, version)
+                if flake is None:
+                    NixFlakeBaseInputs.logger().error(
+                        f"Cannot resolve flake for {package}-{version}"
+                    )
+                snapshot.append((package, version, flake))
+            snapshot = tuple(snapshot)
+            self._snapshots[repo] = (snapshot, time.monotonic())
+            return snapshot != previous
+
+    def invalidate(self, repo: NixFlakeRepo = None):
+        """
+        Discards the inputs resolved so far, so they get resolved again when next used.
+        :param repo: The repository whose inputs to discard, or None for all of them.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        """
+        with self._lock:
+            if repo is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(repo, None)
+
+    def flakes(self, repo: NixFlakeRepo, exclude: Tuple[str, ...] = ()) -> Tuple:
+        """
+        Retrieves the current inputs, resolving them first if they are missing or
+        older than the maximum age.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param exclude: The packages to leave out.
+        :type exclude: Tuple[str, ...]
+        :return: The flakes, in the order of the packages.
+        :rtype: Tuple[pythoneda.shared.nix.flake.NixFlake, ...]
+        """
+        snapshot, refreshed_at = self._snapshots.get(repo, (None, None))
+        if snapshot is None or (
+            self._max_age is not None
+            and time.monotonic() - refreshed_at >= self._max_age
+        ):
+            self.refresh(repo)
+            snapshot, _ = self._snapshots.get(repo, ((), None))
+        return tuple(
+            flake
+            for package, _, flake in snapshot
+            if flake is not None and package not in exclude
+        )
+
+    def start_refreshing(self, repo: NixFlakeRepo, interval: float = 300.0):
+        """
+        Refreshes the inputs periodically, in a background thread.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param interval: The time between refreshes, in seconds.
+        :type interval: float
+        """
+        self.stop_refreshing()
+        stop = threading.Event()
+
+        def run():
+            while not stop.is_set():
+                try:
+                    if self.refresh(repo):
+                        NixFlakeBaseInputs.logger().info(
+                            f"Base inputs updated: {self._packages}"
+                        )
+                except Exception as error:
+                    NixFlakeBaseInputs.logger().error(
+                        f"Cannot refresh base inputs: {error}"
+                    )
+                stop.wait(interval)
+
+        self._stop = stop
+        self._thread = threading.Thread(
+            target=run, name="NixFlakeBaseInputs", daemon=True
+        )
+        self._thread.start()
+
+    def stop_refreshing(self):
+        """
+        Stops refreshing the inputs in the background.
+        """
+        if self._stop is not None:
+            self._stop.set()
+            self._thread.join()
+            self._stop = None
+            self._thread = None
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
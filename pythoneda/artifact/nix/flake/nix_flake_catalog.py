@@ -0,0 +1,637 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_catalog.py
+
+This file defines the NixFlakeCatalog class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import bisect
+import importlib
+import json
+from .nix_flake_input_set import NixFlakeInputSet
+from .nix_flake_version_index import NixFlakeVersionIndex
+from .nix_flake_version_range import NixFlakeVersionRange
+from pythoneda import BaseObject
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+import threading
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Type
+
+
+class NixFlakeCatalog(BaseObject):
+    """
+    A local, precomputed collection of Nix flakes, indexed for fast lookups.
+
+    Class name: NixFlakeCatalog
+
+    Responsibilities:
+        - Indexes flakes by (name, version, url) and by (name, version).
+        - Maintains secondary indexes by name, version, url, flake class and inputs.
+        - Answers compound queries by intersecting those indexes.
+        - Keeps the versions of each flake sorted, to find the latest or compatible one.
+        - Loads and saves itself as JSON, or loads from a NixFlakeResolutionStore.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeResolutionStore
+        - pythoneda.artifact.nix.flake.NixFlakeVersionIndex
+    """
+
+    FORMAT_VERSION = 2
+
+    INDEXED_ATTRIBUTES = ("name", "version", "url", "flake_class", "inputs")
+
+    DESCRIBED_ATTRIBUTES = (
+        "template_subfolder",
+        "description",
+        "homepage",
+        "licenses",
+        "maintainers",
+        "copyright_year",
+    )
+
+    _flake_factories: Dict[Type[NixFlake], Callable[[Dict, List], NixFlake]] = {}
+
+    def __init__(self, flakes: Iterable[NixFlake] = (), latest: Dict[str, str] = None):
+        """
+        Creates a new NixFlakeCatalog instance.
+        :param flakes: The flakes.
+        :type flakes: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :param latest: The latest version of each flake, if not the highest one.
+        :type latest: Dict[str, str]
+        """
+        super().__init__()
+        self._by_key = {}
+        self._by_version = {}
+        self._versions = NixFlakeVersionIndex()
+        self._latest = dict(latest or {})
+        self._indexes = {
+            attribute: {} for attribute in self.__class__.INDEXED_ATTRIBUTES
+        }
+        self._urls = []
+        self._lock = threading.RLock()
+        for flake in flakes:
+            self.add(flake)
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of flakes.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._by_key)
+
+    @classmethod
+    def key(cls, flake: NixFlake) -> Tuple[str, str, str]:
+        """
+        Retrieves the identity of given flake.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: Its name, version and url.
+        :rtype: Tuple[str, str, str]
+        """
+        return NixFlakeInputSet.key(flake)
+
+    @classmethod
+    def indexed_values(cls, flake: NixFlake) -> Dict[str, List[str]]:
+        """
+        Retrieves the values under which given flake is indexed.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: The values, for each indexed attribute.
+        :rtype: Dict[str, List[str]]
+        """
+        name, version, url = cls.key(flake)
+        return {
+            "name": [name],
+            "version": [version],
+            "url": [url],
+            "flake_class": [type(flake).__name__],
+            "inputs": sorted(
+                set(
+                    NixFlakeInputSet.key(flake_input)[0]
+                    for flake_input in getattr(flake, "inputs", None) or []
+                    if flake_input is not None
+                )
+            ),
+        }
+
+    def add(self, flake: NixFlake) -> bool:
+        """
+        Adds given flake, unless one with the same name, version and url is known.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: True if the flake was added.
+        :rtype: bool
+        """
+        key = self.__class__.key(flake)
+        with self._lock:
+            if key in self._by_key:
+                return False
+            self._by_key[key] = flake
+            self._by_version.setdefault(key[:2], flake)
+            self._versions.add(key[0], [key[1]])
+            for attribute, values in self.__class__.indexed_values(flake).items():
+                index = self._indexes[attribute]
+                for value in values:
+                    index.setdefault(value, set()).add(key)
+            bisect.insort(self._urls, (key[2], key))
+            return True
+
+    def remove(self, flake: NixFlake) -> bool:
+        """
+        Removes the flake with the same name, version and url as given one.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: True if the flake was known.
+        :rtype: bool
+        """
+        key = self.__class__.key(flake)
+        with self._lock:
+            current = self._by_key.pop(key, None)
+            if current is None:
+                return False
+            for attribute, values in self.__class__.indexed_values(current).items():
+                index = self._indexes[attribute]
+                for value in values:
+                    keys = index.get(value, None)
+                    if keys is not None:
+                        keys.discard(key)
+                        if not keys:
+                            del index[value]
+            del self._urls[bisect.bisect_left(self._urls, (key[2], key))]
+            if self._by_version.get(key[:2], None) is current:
+                del self._by_version[key[:2]]
+                siblings = self._keys("name", key[0]) & self._keys("version", key[1])
+                if siblings:
+                    self._by_version[key[:2]] = self._by_key[min(siblings)]
+                else:
+                    remaining = self._versions.versions(key[0])
+                    self._versions.clear(key[0])
+                    self._versions.add(
+                        key[0], [version for version in remaining if version != key[1]]
+                    )
+            return True
+
+    def set_latest(self, name: str, version: str):
+        """
+        Pins the latest version of a flake.
+        :param name: The flake name.
+        :type name: str
+        :param version: The version, or None to use the highest known one.
+        :type version: str
+        """
+        with self._lock:
+            if version is None:
+                self._latest.pop(name, None)
+            else:
+                self._latest[name] = version
+
+    def names(self) -> List[str]:
+        """
+        Retrieves the names of the known flakes.
+        :return: Such names, sorted.
+        :rtype: List[str]
+        """
+        return sorted(set(name for name, _ in self._by_version))
+
+    def flakes(self) -> List[NixFlake]:
+        """
+        Retrieves all flakes.
+        :return: Such flakes.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return list(self._by_key.values())
+
+    def versions(self, name: str) -> List[str]:
+        """
+        Retrieves the known versions of a flake.
+        :param name: The flake name.
+        :type name: str
+        :return: Such versions, in ascending order.
+        :rtype: List[str]
+        """
+        return self._versions.versions(name)
+
+    def matching(self, name: str, constraint: str) -> List[str]:
+        """
+        Retrieves the known versions of a flake satisfying given constraint.
+        :param name: The flake name.
+        :type name: str
+        :param constraint: The constraint, such as ">=0.0.3,<0.1".
+        :type constraint: str
+        :return: The matching versions, in ascending order.
+        :rtype: List[str]
+        """
+        return self._versions.matching(name, constraint)
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the latest version of a flake: the pinned one, or the highest known.
+        :param name: The flake name.
+        :type name: str
+        :return: Such version, or None if the flake is unknown.
+        :rtype: str
+        """
+        result = self._latest.get(name, None)
+        if result is None:
+            result = self._versions.highest(name)
+        return result
+
+    def get(self, name: str, version: str, url: str = None) -> NixFlake:
+        """
+        Retrieves a flake.
+        :param name: The flake name.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :param url: The url, or None to accept any.
+        :type url: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        name = "" if name is None else str(name)
+        version = "" if version is None else str(version)
+        if url is not None:
+            return self._by_key.get((name, version, str(url)), None)
+        return self._by_version.get((name, version), None)
+
+    def resolve(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification: an exact match first, then any url for the
+        same name and version, then the highest version satisfying the spec's
+        version, if it's a range.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        name = getattr(spec, "name", None)
+        version = getattr(spec, "version", None)
+        url = getattr(spec, "url", None)
+        result = None
+        if url is not None:
+            result = self.get(name, version, url)
+        if result is None:
+            result = self.get(name, version)
+        if result is None and NixFlakeVersionRange.is_range(version):
+            if version is None or version.strip() in ("", "*", "latest"):
+                compatible = self.latest_version(name)
+            else:
+                compatible = self._versions.highest_compatible(name, version)
+            if compatible is not None:
+                result = self.get(name, compatible)
+        return result
+
+    def _keys(self, attribute: str, value) -> Set[Tuple[str, str, str]]:
+        """
+        Retrieves the keys of the flakes matching a single criterion.
+        :param attribute: The attribute, one of INDEXED_ATTRIBUTES or "url_prefix".
+        :type attribute: str
+        :param value: The value, or a list, tuple or set of accepted values.
+        :type value: Any
+        :return: The keys of the matching flakes.
+        :rtype: Set[Tuple[str, str, str]]
+        """
+        if isinstance(value, (list, tuple, set, frozenset)):
+            result = set()
+            for item in value:
+                result |= self._keys(attribute, item)
+            return result
+        if isinstance(value, type):
+            value = value.__name__
+        value = "" if value is None else str(value)
+        if attribute == "url_prefix":
+            start = bisect.bisect_left(self._urls, (value,))
+            result = set()
+            for url, key in self._urls[start:]:
+                if not url.startswith(value):
+                    break
+                result.add(key)
+            return result
+        index = self._indexes.get(attribute, None)
+        if index is None:
+            raise ValueError(f"Unknown attribute {attribute}")
+        return set(index.get(value, ()))
+
+    def find_by_attribute(self, attribute: str, value) -> List[NixFlake]:
+        """
+        Retrieves the flakes matching given attribute.
+        :param attribute: The attribute, one of INDEXED_ATTRIBUTES or "url_prefix".
+        :type attribute: str
+        :param value: The value, or a list, tuple or set of accepted values.
+        :type value: Any
+        :return: The matching flakes, sorted by name, version and url.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return self.filter({attribute: value})
+
+    def filter(self, criteria: Dict) -> List[NixFlake]:
+        """
+        Retrieves the flakes matching all given criteria, intersecting the indexes
+        of each one, smallest first.
+        :param criteria: The accepted value, or values, for each attribute, among
+        INDEXED_ATTRIBUTES and "url_prefix".
+        :type criteria: Dict
+        :return: The matching flakes, sorted by name, version and url.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        with self._lock:
+            if not criteria:
+                return [self._by_key[key] for key in sorted(self._by_key)]
+            candidates = sorted(
+                (self._keys(attribute, value) for attribute, value in criteria.items()),
+                key=len,
+            )
+            keys = candidates[0]
+            for other in candidates[1:]:
+                if not keys:
+                    break
+                keys = keys & other
+            return [self._by_key[key] for key in sorted(keys)]
+
+    def to_dict(self) -> Dict:
+        """
+        Serializes this catalog. Each flake is described as in encode_flakes(), with
+        the keys of its inputs; inputs not in the catalog are described apart,
+        under "inputs".
+        :return: A JSON-compatible dictionary.
+        :rtype: Dict
+        """
+        with self._lock:
+            flakes = list(self._by_key.values())
+            latest = dict(self._latest)
+        entries = self.__class__.encode_flakes(flakes)
+        return {
+            "format_version": self.__class__.FORMAT_VERSION,
+            "latest": latest,
+            "flakes": entries[: len(flakes)],
+            "inputs": entries[len(flakes) :],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """
+        Deserializes a catalog.
+        :param data: The dictionary built by to_dict().
+        :type data: Dict
+        :return: The catalog.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeCatalog
+        """
+        if data.get("format_version", None) != cls.FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported catalog format {data.get('format_version', None)}"
+            )
+        entries = data.get("flakes", [])
+        flakes = cls.decode_flakes(entries + data.get("inputs", []))
+        return cls(
+            (flakes[cls.entry_key(entry)] for entry in entries),
+            data.get("latest", {}),
+        )
+
+    @classmethod
+    def encode_flakes(cls, flakes: Iterable[NixFlake]) -> List[Dict]:
+        """
+        Describes given flakes, followed by their inputs, transitively. Besides their
+        identity, class and inputs, descriptions keep the DESCRIBED_ATTRIBUTES the
+        flakes have, so they can be built again with the same arguments.
+        :param flakes: The flakes.
+        :type flakes: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :return: One JSON-compatible dictionary per distinct name, version and url.
+        :rtype: List[Dict]
+        """
+        result = []
+        pending = list(flakes)
+        seen = set()
+        position = 0
+        while position < len(pending):
+            flake = pending[position]
+            position += 1
+            key = cls.key(flake)
+            if key in seen:
+                continue
+            seen.add(key)
+            inputs = [
+                flake_input
+                for flake_input in getattr(flake, "inputs", None) or []
+                if flake_input is not None
+            ]
+            flake_class = type(flake)
+            entry = {
+                "name": key[0],
+                "version": key[1],
+                "url": flake.url,
+                "flake_class": ":".join(
+                    (flake_class.__module__, flake_class.__qualname__)
+                ),
+                "inputs": [list(cls.key(flake_input)) for flake_input in inputs],
+            }
+            for attribute in cls.DESCRIBED_ATTRIBUTES:
+                value = getattr(flake, attribute, None)
+                if isinstance(value, (list, tuple)) and all(
+                    isinstance(item, (str, int)) for item in value
+                ):
+                    entry[attribute] = list(value)
+                elif isinstance(value, (str, int)):
+                    entry[attribute] = value
+            result.append(entry)
+            pending.extend(inputs)
+        return result
+
+    @classmethod
+    def decode_flakes(cls, entries: Iterable[Dict]) -> Dict[Tuple, NixFlake]:
+        """
+        Rebuilds the flakes described by encode_flakes().
+        :param entries: The descriptions.
+        :type entries: Iterable[Dict]
+        :return: The flakes, by name, version and url.
+        :rtype: Dict[Tuple[str, str, str], pythoneda.shared.nix.flake.NixFlake]
+        """
+        entries = {cls.entry_key(entry): entry for entry in entries}
+        result = {}
+        for key in entries:
+            cls._decode_flake(key, entries, result, set())
+        return result
+
+    @classmethod
+    def _decode_flake(
+        cls, key: Tuple, entries: Dict, flakes: Dict, path: Set
+    ) -> NixFlake:
+        """
+        Rebuilds the flake with given key, after its inputs.
+        :param key: The name, version and url of the flake.
+        :type key: Tuple[str, str, str]
+        :param entries: The descriptions, by key.
+        :type entries: Dict[Tuple[str, str, str], Dict]
+        :param flakes: The flakes already rebuilt, by key.
+        :type flakes: Dict[Tuple[str, str, str], pythoneda.shared.nix.flake.NixFlake]
+        :param path: The keys of the flakes being rebuilt, to skip cyclic inputs.
+        :type path: Set[Tuple[str, str, str]]
+        :return: The flake, or None if it is not described.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        result = flakes.get(key, None)
+        entry = entries.get(key, None)
+        if result is not None or entry is None or key in path:
+            return result
+        path.add(key)
+        inputs = []
+        for input_key in entry.get("inputs", []):
+            flake_input = cls._decode_flake(tuple(input_key), entries, flakes, path)
+            if flake_input is not None:
+                inputs.append(flake_input)
+        path.discard(key)
+        result = cls.rebuild_flake(
+            cls.flake_class(entry.get("flake_class", None)), entry, inputs
+        )
+        flakes[key] = result
+        return result
+
+    @classmethod
+    def entry_key(cls, entry: Dict) -> Tuple[str, str, str]:
+        """
+        Retrieves the identity of the flake described by given entry.
+        :param entry: The description, as built by encode_flakes().
+        :type entry: Dict
+        :return: Its name, version and url.
+        :rtype: Tuple[str, str, str]
+        """
+        url = entry.get("url", None)
+        return (entry["name"], entry["version"], "" if url is None else url)
+
+    @classmethod
+    def flake_class(cls, qualifiedName: str) -> Type[NixFlake]:
+        """
+        Retrieves the flake class with given qualified name.
+        :param qualifiedName: The module and name of the class, separated by a colon.
+        :type qualifiedName: str
+        :return: Such class, or NixFlake if it is unknown or not a flake class.
+        :rtype: Type[pythoneda.shared.nix.flake.NixFlake]
+        """
+        module_name, _, class_name = (qualifiedName or "").partition(":")
+        try:
+            result = importlib.import_module(module_name)
+            for name in class_name.split("."):
+                result = getattr(result, name)
+        except (AttributeError, ImportError, ValueError):
+            return NixFlake
+        if isinstance(result, type) and issubclass(result, NixFlake):
+            return result
+        return NixFlake
+
+    @classmethod
+    def register_flake_factory(
+        cls, flakeClass: Type[NixFlake], factory: Callable[[Dict, List], NixFlake]
+    ):
+        """
+        Registers how to rebuild the flakes of a class whose constructor does not
+        take the same arguments as NixFlake's.
+        :param flakeClass: The flake class.
+        :type flakeClass: Type[pythoneda.shared.nix.flake.NixFlake]
+        :param factory: The function receiving the description of a flake, as built
+        by encode_flakes(), and its rebuilt inputs, and returning the flake.
+        :type factory: Callable[[Dict, List], pythoneda.shared.nix.flake.NixFlake]
+        """
+        cls._flake_factories[flakeClass] = factory
+
+    @classmethod
+    def rebuild_flake(
+        cls, flakeClass: Type[NixFlake], entry: Dict, inputs: List[NixFlake]
+    ) -> NixFlake:
+        """
+        Rebuilds a flake from its description, via the factory registered for its
+        class, or else via its own constructor, called with NixFlake's arguments.
+        Classes whose constructor rejects them are rebuilt as plain NixFlakes.
+        :param flakeClass: The flake class.
+        :type flakeClass: Type[pythoneda.shared.nix.flake.NixFlake]
+        :param entry: The description, as built by encode_flakes().
+        :type entry: Dict
+        :param inputs: The rebuilt inputs.
+        :type inputs: List[pythoneda.shared.nix.flake.NixFlake]
+        :return: The flake.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        factory = cls._flake_factories.get(flakeClass, None)
+        if factory is not None:
+            return factory(entry, inputs)
+        arguments = (
+            entry["name"],
+            entry["version"],
+            entry.get("url", None),
+            inputs,
+            entry.get("template_subfolder", None),
+            entry.get("description", None),
+            entry.get("homepage", None),
+            entry.get("licenses", []),
+            entry.get("maintainers", []),
+            entry.get("copyright_year", None),
+        )
+        if flakeClass is not NixFlake:
+            try:
+                return flakeClass(*arguments)
+            except TypeError as error:
+                cls.logger().warning(
+                    f"Rebuilding {entry['name']}-{entry['version']} as a NixFlake, "
+                    f"since {flakeClass.__name__} has no registered factory: {error}"
+                )
+        return NixFlake(*arguments)
+
+    def save_json(self, path: str):
+        """
+        Writes this catalog to a JSON file.
+        :param path: The path of the file.
+        :type path: str
+        """
+        with open(path, "w") as output:
+            json.dump(self.to_dict(), output, separators=(",", ":"))
+
+    @classmethod
+    def load_json(cls, path: str):
+        """
+        Reads a catalog from a JSON file.
+        :param path: The path of the file.
+        :type path: str
+        :return: The catalog.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeCatalog
+        """
+        with open(path) as source:
+            return cls.from_dict(json.load(source))
+
+    @classmethod
+    def from_store(cls, store):
+        """
+        Builds a catalog from the lookups persisted in a NixFlakeResolutionStore.
+        :param store: The store.
+        :type store: pythoneda.artifact.nix.flake.NixFlakeResolutionStore
+        :return: The catalog.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeCatalog
+        """
+        result = cls()
+        for key, (value, _) in store.load().items():
+            if key[0] == "latest":
+                result.set_latest(key[1], value)
+            elif value is not None and key[0] in ("find", "resolve"):
+                result.add(value)
+        return result
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
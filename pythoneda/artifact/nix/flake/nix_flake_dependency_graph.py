@@ -0,0 +1,311 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_dependency_graph.py
+
+This file defines the NixFlakeDependencyGraph class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_input_set import NixFlakeInputSet
+from .nix_flake_repo import NixFlakeRepo
+from .ttl_lru_cache import TtlLruCache
+from pythoneda import BaseObject
+from pythoneda.shared.nix.flake import NixFlake
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+
+class NixFlakeDependencyGraph(BaseObject):
+    """
+    Computes the transitive closure of the dependencies of Nix flakes.
+
+    Class name: NixFlakeDependencyGraph
+
+    Responsibilities:
+        - Knows the declared dependencies of each flake, by name.
+        - Follows declared dependencies, and optionally flattens the inputs of each flake.
+        - Resolves each declared dependency once per closure, through the repository.
+        - Remembers the subgraph of each flake, and the latest flake of each declared
+          dependency, across closures.
+        - Detects dependency cycles, logging and skipping them.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+        - pythoneda.artifact.nix.flake.TtlLruCache
+    """
+
+    def __init__(
+        self, ttl: float = 600.0, maxEntries: int = 4096, flatten: bool = False
+    ):
+        """
+        Creates a new NixFlakeDependencyGraph instance.
+        :param ttl: How long, in seconds, subgraphs and resolved dependencies are
+        remembered. New upstream versions are picked up at most that late.
+        :type ttl: float
+        :param maxEntries: The maximum number of remembered flakes.
+        :type maxEntries: int
+        :param flatten: Whether the inputs of each flake, transitively, are part of
+        the closure too. Otherwise, only declared dependencies are followed.
+        :type flatten: bool
+        """
+        super().__init__()
+        self._declared = {}
+        self._flatten = flatten
+        self._subgraphs = TtlLruCache(ttl, maxEntries)
+        self._inputs_cache = TtlLruCache(ttl, maxEntries)
+        self._latest = TtlLruCache(ttl, maxEntries)
+        self._repo = None
+        self._lock = threading.Lock()
+
+    @property
+    def flatten(self) -> bool:
+        """
+        Checks whether the inputs of each flake are part of the closure.
+        :return: True in such case.
+        :rtype: bool
+        """
+        return self._flatten
+
+    def declare(self, name: str, dependencies: Iterable[str]):
+        """
+        Declares the dependencies of given flake.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param dependencies: The names of the flakes it depends on.
+        :type dependencies: Iterable[str]
+        """
+        with self._lock:
+            self._declared[name] = tuple(dependencies)
+            self._subgraphs.clear()
+
+    def has_declarations(self) -> bool:
+        """
+        Checks whether any flake has declared dependencies, whose latest versions
+        then depend on the repository.
+        :return: True in such case.
+        :rtype: bool
+        """
+        return any(self._declared.values())
+
+    def dependencies_of(self, name: str) -> Tuple[str, ...]:
+        """
+        Retrieves the declared dependencies of given flake.
+        :param name: The flake name.
+        :type name: str
+        :return: The names of the flakes it depends on.
+        :rtype: Tuple[str, ...]
+        """
+        return self._declared.get(name, ())
+
+    def closure(self, repo: NixFlakeRepo, roots: Iterable[NixFlake]) -> List[NixFlake]:
+        """
+        Computes the transitive closure of given flakes.
+        When several flakes share a name, the first one reached wins, so earlier roots
+        take precedence over later ones.
+        :param repo: The repository, to resolve declared dependencies.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param roots: The flakes to start from. None values are ignored.
+        :type roots: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :return: The flakes of the closure, one per name.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        with self._lock:
+            if self._repo is not repo:
+                self._subgraphs.clear()
+                self._latest.clear()
+                self._repo = repo
+        latest = {}
+        visited = {}
+        partial = set()
+        result = {}
+        for root in roots:
+            if root is None:
+                continue
+            for flake in self._subgraph(repo, root, latest, visited, [], partial):
+                result.setdefault(NixFlakeInputSet.key(flake)[0], flake)
+        return list(result.values())
+
+    def forget(self):
+        """
+        Forgets all remembered subgraphs, inputs and resolved dependencies.
+        """
+        self._subgraphs.clear()
+        self._inputs_cache.clear()
+        self._latest.clear()
+
+    @classmethod
+    def _skip_cycle(cls, path: List, key: Tuple[str, str, str], partial: set):
+        """
+        Logs a dependency cycle, and marks the flakes inside it as partially visited,
+        since their subgraphs lack the edge closing the cycle.
+        :param path: The keys of the flakes being visited.
+        :type path: List[Tuple[str, str, str]]
+        :param key: The key closing the cycle.
+        :type key: Tuple[str, str, str]
+        :param partial: The keys of the partially visited flakes.
+        :type partial: Set[Tuple[str, str, str]]
+        """
+        start = path.index(key)
+        partial.update(path[start + 1 :])
+        cls.logger().warning(
+            "Skipping dependency cycle: "
+            + " -> ".join(
+                f"{name}-{version}" for name, version, _ in path[start:] + [key]
+            )
+        )
+
+    def _subgraph(
+        self,
+        repo: NixFlakeRepo,
+        flake: NixFlake,
+        latest: Dict,
+        visited: Dict,
+        path: List,
+        partial: set,
+    ) -> Tuple[NixFlake, ...]:
+        """
+        Computes the closure of a single flake, including itself.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :param latest: The declared dependencies already resolved in this closure.
+        :type latest: Dict[str, pythoneda.shared.nix.flake.NixFlake]
+        :param visited: The subgraphs already computed in this closure.
+        :type visited: Dict[Tuple[str, str, str], Tuple]
+        :param path: The keys of the flakes being visited.
+        :type path: List[Tuple[str, str, str]]
+        :param partial: The keys of the flakes whose subgraphs may miss part of a
+        cycle, which are not remembered across closures.
+        :type partial: Set[Tuple[str, str, str]]
+        :return: The flakes of the subgraph.
+        :rtype: Tuple[pythoneda.shared.nix.flake.NixFlake, ...]
+        """
+        key = NixFlakeInputSet.key(flake)
+        result = visited.get(key, None)
+        if result is not None:
+            return result
+        if key in path:
+            self.__class__._skip_cycle(path, key, partial)
+            return ()
+        found, result = self._subgraphs.lookup(key)
+        if found:
+            visited[key] = result
+            return result
+        path.append(key)
+        if self._flatten:
+            reached = self._inputs(flake, [], partial)
+        else:
+            reached = (flake,)
+        if any(NixFlakeInputSet.key(node) in partial for node in reached):
+            partial.add(key)
+        nodes = {}
+        for node in reached:
+            nodes.setdefault(NixFlakeInputSet.key(node), node)
+        for node in reached:
+            for child in self._declared_children(repo, node, latest):
+                for descendant in self._subgraph(
+                    repo, child, latest, visited, path, partial
+                ):
+                    nodes.setdefault(NixFlakeInputSet.key(descendant), descendant)
+                if NixFlakeInputSet.key(child) in partial:
+                    partial.add(key)
+        path.pop()
+        result = tuple(nodes.values())
+        visited[key] = result
+        if key not in partial:
+            self._subgraphs.put(key, result)
+        return result
+
+    def _inputs(self, flake: NixFlake, path: List, partial: set) -> Tuple:
+        """
+        Computes the transitive inputs of a flake, including itself. They only
+        depend on the flake itself, so they are remembered by name, version and url.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :param path: The keys of the flakes being visited.
+        :type path: List[Tuple[str, str, str]]
+        :param partial: The keys of the flakes whose inputs may miss part of a
+        cycle, which are not remembered.
+        :type partial: Set[Tuple[str, str, str]]
+        :return: Such flakes.
+        :rtype: Tuple[pythoneda.shared.nix.flake.NixFlake, ...]
+        """
+        key = NixFlakeInputSet.key(flake)
+        if key in path:
+            self.__class__._skip_cycle(path, key, partial)
+            return ()
+        found, result = self._inputs_cache.lookup(key)
+        if found:
+            return result
+        path.append(key)
+        nodes = {key: flake}
+        for child in getattr(flake, "inputs", None) or []:
+            if child is None:
+                continue
+            for node in self._inputs(child, path, partial):
+                nodes.setdefault(NixFlakeInputSet.key(node), node)
+            if NixFlakeInputSet.key(child) in partial:
+                partial.add(key)
+        path.pop()
+        result = tuple(nodes.values())
+        if key not in partial:
+            self._inputs_cache.put(key, result)
+        return result
+
+    def _declared_children(
+        self, repo: NixFlakeRepo, flake: NixFlake, latest: Dict
+    ) -> List[NixFlake]:
+        """
+        Retrieves the latest flakes of the declared dependencies of given flake.
+        Each one is resolved through the repository at most once per closure, and
+        then remembered for later closures until it expires.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :param latest: The declared dependencies already resolved in this closure.
+        :type latest: Dict[str, pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flakes.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        name = NixFlakeInputSet.key(flake)[0]
+        result = []
+        for dependency in self.dependencies_of(name):
+            if dependency not in latest:
+                found, resolved = self._latest.lookup(dependency)
+                if not found:
+                    resolved = repo.latest(dependency)
+                    if resolved is None:
+                        self.__class__.logger().warning(
+                            f"Cannot resolve flake {dependency}, required by {name}"
+                        )
+                    else:
+                        self._latest.put(dependency, resolved)
+                latest[dependency] = resolved
+            if latest[dependency] is not None:
+                result.append(latest[dependency])
+        return result
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
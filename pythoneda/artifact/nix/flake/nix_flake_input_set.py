@@ -0,0 +1,232 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_input_set.py
+
+This file defines the NixFlakeInputSet class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_version import NixFlakeVersion
+from pythoneda.shared.nix.flake import NixFlake
+from typing import Iterable, List, Tuple
+
+
+class NixFlakeInputSet:
+    """
+    An immutable, canonical set of flake inputs.
+
+    Class name: NixFlakeInputSet
+
+    Responsibilities:
+        - Keeps a single flake per name, deduplicating by (name, version, url).
+        - Resolves conflicts between versions of the same flake deterministically.
+        - Iterates over its flakes sorted by name, so identical inputs render identically.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeVersion
+    """
+
+    __slots__ = ("_flakes", "_by_name")
+
+    def __init__(self, flakes: Iterable[NixFlake] = ()):
+        """
+        Creates a new NixFlakeInputSet instance.
+        :param flakes: The flakes. None values are ignored.
+        :type flakes: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        """
+        super().__init__()
+        by_name = {}
+        for flake in flakes:
+            if flake is None:
+                continue
+            name = self.__class__.key(flake)[0]
+            current = by_name.get(name, None)
+            if current is None or self.__class__._precedes(current, flake):
+                by_name[name] = flake
+        self._by_name = by_name
+        self._flakes = tuple(by_name[name] for name in sorted(by_name))
+
+    @classmethod
+    def of(cls, flakes: Iterable[NixFlake]):
+        """
+        Retrieves given flakes as a set, without copying them if they already are one.
+        :param flakes: The flakes.
+        :type flakes: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :return: The set.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeInputSet
+        """
+        if isinstance(flakes, NixFlakeInputSet):
+            return flakes
+        return cls(flakes)
+
+    @classmethod
+    def key(cls, flake: NixFlake) -> Tuple[str, str, str]:
+        """
+        Retrieves the identity of given flake.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: Its name, version and url.
+        :rtype: Tuple[str, str, str]
+        """
+        return tuple(
+            "" if value is None else str(value)
+            for value in (
+                getattr(flake, "name", None),
+                getattr(flake, "version", None),
+                getattr(flake, "url", None),
+            )
+        )
+
+    @classmethod
+    def _precedes(cls, current: NixFlake, candidate: NixFlake) -> bool:
+        """
+        Checks whether a candidate flake should replace the current one with the same name.
+        Higher versions win; among equal versions, the lowest url wins.
+        :param current: The current flake.
+        :type current: pythoneda.shared.nix.flake.NixFlake
+        :param candidate: The candidate flake.
+        :type candidate: pythoneda.shared.nix.flake.NixFlake
+        :return: True if the candidate wins.
+        :rtype: bool
+        """
+        _, current_version, current_url = cls.key(current)
+        _, candidate_version, candidate_url = cls.key(candidate)
+        if current_version != candidate_version:
+            return cls._version_order(candidate_version) > cls._version_order(
+                current_version
+            )
+        return candidate_url < current_url
+
+    @classmethod
+    def _version_order(cls, version: str) -> Tuple:
+        """
+        Builds a sort key for given version; unparseable versions sort first.
+        :param version: The version.
+        :type version: str
+        :return: Such key.
+        :rtype: Tuple
+        """
+        parsed = NixFlakeVersion.parse(version)
+        if parsed is None:
+            return (0, (), version)
+        return (1, parsed, version)
+
+    def union(self, flakes: Iterable[NixFlake]):
+        """
+        Builds a new set with the flakes of this one plus given ones. This set is
+        left untouched, and returned as is if there are no additional flakes.
+        :param flakes: The additional flakes.
+        :type flakes: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :return: The new set.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeInputSet
+        """
+        flakes = list(flakes)
+        if not flakes:
+            return self
+        return NixFlakeInputSet(list(self._flakes) + flakes)
+
+    def get(self, name: str) -> NixFlake:
+        """
+        Retrieves the flake with given name.
+        :param name: The flake name.
+        :type name: str
+        :return: Such flake, or None if not present.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self._by_name.get(name, None)
+
+    def keys(self) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        Retrieves the identities of the flakes, in order.
+        :return: Their names, versions and urls.
+        :rtype: Tuple[Tuple[str, str, str], ...]
+        """
+        return tuple(self.__class__.key(flake) for flake in self._flakes)
+
+    def to_list(self) -> List[NixFlake]:
+        """
+        Retrieves the flakes, sorted by name, as a new list.
+        :return: Such flakes.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return list(self._flakes)
+
+    def __iter__(self):
+        """
+        Iterates over the flakes, sorted by name.
+        :return: Such iterator.
+        :rtype: Iterator[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return iter(self._flakes)
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of flakes.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._flakes)
+
+    def __contains__(self, flake) -> bool:
+        """
+        Checks whether given flake, with the same name, version and url, is present.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: True in such case.
+        :rtype: bool
+        """
+        current = self._by_name.get(self.__class__.key(flake)[0], None)
+        return current is not None and self.__class__.key(
+            current
+        ) == self.__class__.key(flake)
+
+    def __eq__(self, other) -> bool:
+        """
+        Checks whether given set holds the same flakes.
+        :param other: The other set.
+        :type other: pythoneda.artifact.nix.flake.NixFlakeInputSet
+        :return: True in such case.
+        :rtype: bool
+        """
+        if not isinstance(other, NixFlakeInputSet):
+            return NotImplemented
+        return self.keys() == other.keys()
+
+    def __hash__(self) -> int:
+        """
+        Retrieves the hash of this set.
+        :return: Such hash.
+        :rtype: int
+        """
+        return hash(self.keys())
+
+    def __repr__(self) -> str:
+        """
+        Provides a representation of this instance.
+        :return: Such representation.
+        :rtype: str
+        """
+        return f"NixFlakeInputSet({list(self.keys())!r})"
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
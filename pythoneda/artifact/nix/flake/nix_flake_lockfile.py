@@ -0,0 +1,199 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_lockfile.py
+
+This file defines the NixFlakeLockfile class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_catalog import NixFlakeCatalog
+from .nix_flake_registry import NixFlakeRegistry
+from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Dict, Iterable, Tuple
+
+
+class NixFlakeLockfile(NixFlakeCatalog):
+    """
+    A snapshot of the resolved state of a NixFlakeRepo.
+
+    Class name: NixFlakeLockfile
+
+    Responsibilities:
+        - Pins the latest version of each package.
+        - Remembers the flake each specification resolved to, or that it could not
+          be resolved.
+        - Refuses to resolve specifications it has no record of.
+        - Serves as the catalog of a CatalogNixFlakeRepo, so resolutions are
+          reproducible and need no backend.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeCatalog
+        - pythoneda.artifact.nix.flake.CatalogNixFlakeRepo
+        - pythoneda.artifact.nix.flake.RecordingNixFlakeRepo
+    """
+
+    def __init__(self, flakes: Iterable[NixFlake] = (), latest: Dict[str, str] = None):
+        """
+        Creates a new NixFlakeLockfile instance.
+        :param flakes: The flakes.
+        :type flakes: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :param latest: The latest version of each flake.
+        :type latest: Dict[str, str]
+        """
+        self._resolutions = {}
+        super().__init__(flakes, latest)
+
+    @classmethod
+    def capture(cls, repo: NixFlakeRepo, specs: Iterable[NixFlakeSpec] = ()):
+        """
+        Captures the latest version, and its flake, of every registered package,
+        plus the resolution of given specifications.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param specs: The specifications to resolve.
+        :type specs: Iterable[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The lockfile.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeLockfile
+        """
+        result = cls()
+        for entry in NixFlakeRegistry.entries():
+            version = repo.latest_version(entry.name)
+            if version is None:
+                continue
+            result.set_latest(entry.name, version)
+            flake = repo.find(entry.name, version)
+            if flake is not None:
+                result.add(flake)
+        specs = list(specs)
+        if specs:
+            failures = []
+            flakes = repo.resolve_many(specs, failures)
+            failed = {NixFlakeRepoDecorator.spec_key(spec) for spec in failures}
+            for spec, flake in zip(specs, flakes):
+                spec_key = NixFlakeRepoDecorator.spec_key(spec)
+                if flake is not None or spec_key not in failed:
+                    result.record(spec, flake)
+        return result
+
+    def record(self, spec: NixFlakeSpec, flake: NixFlake):
+        """
+        Remembers the flake given specification resolved to.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param flake: The flake, or None if the specification could not be resolved.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        """
+        with self._lock:
+            if flake is not None:
+                self.add(flake)
+            self._resolutions[NixFlakeRepoDecorator.spec_key(spec)] = flake
+
+    def remove(self, flake: NixFlake) -> bool:
+        """
+        Removes the flake with the same name, version and url as given one, and
+        forgets the resolutions to it.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: True if the flake was known.
+        :rtype: bool
+        """
+        key = self.__class__.key(flake)
+        with self._lock:
+            result = super().remove(flake)
+            if result:
+                for spec_key, resolved in list(self._resolutions.items()):
+                    if resolved is not None and self.__class__.key(resolved) == key:
+                        del self._resolutions[spec_key]
+            return result
+
+    def resolutions(self) -> Dict[Tuple, NixFlake]:
+        """
+        Retrieves the recorded resolutions.
+        :return: The flake of each specification key, None for those that could not
+        be resolved.
+        :rtype: Dict[Tuple, pythoneda.shared.nix.flake.NixFlake]
+        """
+        with self._lock:
+            return dict(self._resolutions)
+
+    def resolve(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification as recorded. Specifications without a record
+        are not guessed from the known flakes, since the lockfile would no longer
+        be reproducible.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: The recorded Nix flake, or None if it could not be resolved.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        spec_key = NixFlakeRepoDecorator.spec_key(spec)
+        with self._lock:
+            if spec_key not in self._resolutions:
+                raise LookupError(
+                    f"{NixFlakeRepo.describe_spec(spec)} is not in the lockfile"
+                )
+            return self._resolutions[spec_key]
+
+    def to_dict(self) -> Dict:
+        """
+        Serializes this lockfile. Resolved flakes are always in the catalog, so
+        resolutions reference them by name, version and url, or by a null key if
+        the specification could not be resolved.
+        :return: A JSON-compatible dictionary.
+        :rtype: Dict
+        """
+        result = super().to_dict()
+        with self._lock:
+            resolutions = list(self._resolutions.items())
+        entries = []
+        for spec_key, flake in resolutions:
+            entry = {"spec": list(spec_key), "key": None}
+            if flake is not None:
+                entry["key"] = list(self.__class__.key(flake))
+            entries.append(entry)
+        result["resolutions"] = entries
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """
+        Deserializes a lockfile.
+        :param data: The dictionary built by to_dict().
+        :type data: Dict
+        :return: The lockfile.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeLockfile
+        """
+        result = super().from_dict(data)
+        for entry in data.get("resolutions", []):
+            if entry["key"] is None:
+                result._resolutions[tuple(entry["spec"])] = None
+                continue
+            flake = result.get(*entry["key"])
+            if flake is not None:
+                result._resolutions[tuple(entry["spec"])] = flake
+        return result
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,432 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_metrics.py
+
+This file defines the NixFlakeMetrics class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import bisect
+import contextlib
+import threading
+import time
+from typing import ContextManager, Dict, List
+
+
+class NixFlakeMetrics:
+    """
+    Collects call counts, latencies, errors and cache outcomes of flake lookups.
+
+    Class name: NixFlakeMetrics
+
+    Responsibilities:
+        - Records calls per method and package, with latency histograms and errors.
+        - Records cache hits and misses per cache, method and package.
+        - Records the depth, wait times and shed work of work queues.
+        - Exposes the collected data as a snapshot or in Prometheus text format.
+        - Does nothing, cheaply, while disabled.
+
+    Collaborators:
+        - None
+    """
+
+    _singleton = None
+
+    BUCKETS = (
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    _DISABLED = contextlib.nullcontext()
+
+    def __init__(self, enabled: bool = False):
+        """
+        Creates a new NixFlakeMetrics instance.
+        :param enabled: Whether to record metrics.
+        :type enabled: bool
+        """
+        super().__init__()
+        self._enabled = enabled
+        self._calls = {}
+        self._caches = {}
+        self._queues = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """
+        Retrieves the shared instance, disabled until enable() is called.
+        :return: Such instance.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeMetrics
+        """
+        if cls._singleton is None:
+            cls._singleton = cls()
+
+        return cls._singleton
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Checks whether metrics are being recorded.
+        :return: True if so.
+        :rtype: bool
+        """
+        return self._enabled
+
+    def enable(self):
+        """
+        Starts recording metrics.
+        """
+        self._enabled = True
+
+    def disable(self):
+        """
+        Stops recording metrics. Already recorded ones are kept.
+        """
+        self._enabled = False
+
+    def reset(self):
+        """
+        Discards all recorded metrics.
+        """
+        with self._lock:
+            self._calls.clear()
+            self._caches.clear()
+            self._queues.clear()
+
+    def measure(self, method: str, package: str = "") -> ContextManager:
+        """
+        Builds a context manager recording the duration, and any error, of a call.
+        :param method: The method name.
+        :type method: str
+        :param package: The package name, if any.
+        :type package: str
+        :return: Such context manager; a shared no-op one if disabled.
+        :rtype: ContextManager
+        """
+        if not self._enabled:
+            return self.__class__._DISABLED
+        return self._measuring(method, package)
+
+    @contextlib.contextmanager
+    def _measuring(self, method: str, package: str):
+        """
+        Records the duration, and any error, of the wrapped block.
+        :param method: The method name.
+        :type method: str
+        :param package: The package name.
+        :type package: str
+        """
+        started = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.record_call(method, package, time.perf_counter() - started, error)
+
+    def record_call(
+        self, method: str, package: str, seconds: float, error: bool = False
+    ):
+        """
+        Records a call.
+        :param method: The method name.
+        :type method: str
+        :param package: The package name.
+        :type package: str
+        :param seconds: The duration of the call.
+        :type seconds: float
+        :param error: Whether the call failed.
+        :type error: bool
+        """
+        if not self._enabled:
+            return
+        key = (method, package or "")
+        bucket = bisect.bisect_left(self.__class__.BUCKETS, seconds)
+        with self._lock:
+            stats = self._calls.get(key, None)
+            if stats is None:
+                stats = [0, 0, 0.0, [0] * (len(self.__class__.BUCKETS) + 1)]
+                self._calls[key] = stats
+            stats[0] += 1
+            if error:
+                stats[1] += 1
+            stats[2] += seconds
+            stats[3][bucket] += 1
+
+    def record_cache(self, cache: str, method: str, package: str, hit: bool):
+        """
+        Records a cache lookup.
+        :param cache: The cache name.
+        :type cache: str
+        :param method: The method name.
+        :type method: str
+        :param package: The package name.
+        :type package: str
+        :param hit: Whether the lookup was served from the cache.
+        :type hit: bool
+        """
+        if not self._enabled:
+            return
+        key = (cache, method, package or "")
+        with self._lock:
+            stats = self._caches.get(key, None)
+            if stats is None:
+                stats = [0, 0]
+                self._caches[key] = stats
+            stats[0 if hit else 1] += 1
+
+    def _queue_stats(self, queue: str) -> List:
+        """
+        Retrieves the statistics of given queue, creating them if needed.
+        The caller must hold the lock.
+        :param queue: The queue name.
+        :type queue: str
+        :return: The depth, maximum depth, shed count, wait count, total wait and
+        wait histogram.
+        :rtype: List
+        """
+        result = self._queues.get(queue, None)
+        if result is None:
+            result = [0, 0, 0, 0, 0.0, [0] * (len(self.__class__.BUCKETS) + 1)]
+            self._queues[queue] = result
+        return result
+
+    def record_queue_depth(self, queue: str, depth: int):
+        """
+        Records the current depth of a work queue.
+        :param queue: The queue name.
+        :type queue: str
+        :param depth: The number of queued items.
+        :type depth: int
+        """
+        if not self._enabled:
+            return
+        with self._lock:
+            stats = self._queue_stats(queue)
+            stats[0] = depth
+            stats[1] = max(stats[1], depth)
+
+    def record_queue_wait(self, queue: str, seconds: float):
+        """
+        Records how long an item waited in a work queue.
+        :param queue: The queue name.
+        :type queue: str
+        :param seconds: The wait time.
+        :type seconds: float
+        """
+        if not self._enabled:
+            return
+        bucket = bisect.bisect_left(self.__class__.BUCKETS, seconds)
+        with self._lock:
+            stats = self._queue_stats(queue)
+            stats[3] += 1
+            stats[4] += seconds
+            stats[5][bucket] += 1
+
+    def record_queue_shed(self, queue: str):
+        """
+        Records an item rejected by a full work queue.
+        :param queue: The queue name.
+        :type queue: str
+        """
+        if not self._enabled:
+            return
+        with self._lock:
+            self._queue_stats(queue)[2] += 1
+
+    @classmethod
+    def _histogram(cls, buckets: List[int]) -> Dict:
+        """
+        Converts bucket counts into a cumulative histogram.
+        :param buckets: The number of samples in each bucket.
+        :type buckets: List[int]
+        :return: The cumulative counts, indexed by upper bound.
+        :rtype: Dict
+        """
+        result = {}
+        cumulative = 0
+        for bound, hits in zip(cls.BUCKETS + ("+Inf",), buckets):
+            cumulative += hits
+            result[bound] = cumulative
+        return result
+
+    def snapshot(self) -> Dict:
+        """
+        Retrieves a copy of the recorded metrics.
+        :return: A dictionary with a "calls" entry, indexed by method and package,
+        a "caches" entry, indexed by cache, method and package, and a "queues" entry,
+        indexed by queue.
+        :rtype: Dict
+        """
+        with self._lock:
+            calls = [
+                (key, (stats[0], stats[1], stats[2], list(stats[3])))
+                for key, stats in self._calls.items()
+            ]
+            caches = [(key, tuple(stats)) for key, stats in self._caches.items()]
+            queues = [
+                (queue, tuple(stats[:5]) + (list(stats[5]),))
+                for queue, stats in self._queues.items()
+            ]
+        result = {"calls": {}, "caches": {}, "queues": {}}
+        for (method, package), (count, errors, total, buckets) in sorted(calls):
+            histogram = self.__class__._histogram(buckets)
+            result["calls"].setdefault(method, {})[package] = {
+                "count": count,
+                "errors": errors,
+                "seconds": total,
+                "buckets": histogram,
+            }
+        for (cache, method, package), (hits, misses) in sorted(caches):
+            result["caches"].setdefault(cache, {}).setdefault(method, {})[package] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses),
+            }
+        for queue, (depth, max_depth, shed, waits, waited, buckets) in sorted(queues):
+            result["queues"][queue] = {
+                "depth": depth,
+                "max_depth": max_depth,
+                "shed": shed,
+                "waits": waits,
+                "wait_seconds": waited,
+                "wait_buckets": self.__class__._histogram(buckets),
+            }
+        return result
+
+    @classmethod
+    def _labels(cls, **labels) -> str:
+        """
+        Formats given labels for Prometheus.
+        :param labels: The labels.
+        :type labels: Dict[str, str]
+        :return: The formatted labels.
+        :rtype: str
+        """
+        return ",".join(
+            '{}="{}"'.format(
+                name,
+                str(value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n"),
+            )
+            for name, value in labels.items()
+        )
+
+    def to_prometheus(self, prefix: str = "nix_flake_repo") -> str:
+        """
+        Formats the recorded metrics in the Prometheus text exposition format.
+        :param prefix: The prefix of the metric names.
+        :type prefix: str
+        :return: The metrics.
+        :rtype: str
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_calls_total Number of calls.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        calls = [
+            (method, package, stats)
+            for method, packages in snapshot["calls"].items()
+            for package, stats in packages.items()
+        ]
+        for method, package, stats in calls:
+            labels = self.__class__._labels(method=method, package=package)
+            lines.append(f"{prefix}_calls_total{{{labels}}} {stats['count']}")
+        lines.append(f"# HELP {prefix}_errors_total Number of failed calls.")
+        lines.append(f"# TYPE {prefix}_errors_total counter")
+        for method, package, stats in calls:
+            labels = self.__class__._labels(method=method, package=package)
+            lines.append(f"{prefix}_errors_total{{{labels}}} {stats['errors']}")
+        lines.append(f"# HELP {prefix}_call_duration_seconds Duration of calls.")
+        lines.append(f"# TYPE {prefix}_call_duration_seconds histogram")
+        for method, package, stats in calls:
+            for bound, count in stats["buckets"].items():
+                labels = self.__class__._labels(
+                    method=method, package=package, le=bound
+                )
+                lines.append(
+                    f"{prefix}_call_duration_seconds_bucket{{{labels}}} {count}"
+                )
+            labels = self.__class__._labels(method=method, package=package)
+            lines.append(
+                f"{prefix}_call_duration_seconds_sum{{{labels}}} {stats['seconds']}"
+            )
+            lines.append(
+                f"{prefix}_call_duration_seconds_count{{{labels}}} {stats['count']}"
+            )
+        caches = [
+            (cache, method, package, stats)
+            for cache, methods in snapshot["caches"].items()
+            for method, packages in methods.items()
+            for package, stats in packages.items()
+        ]
+        for outcome in ("hits", "misses"):
+            metric = f"{prefix}_cache_{outcome}_total"
+            lines.append(f"# HELP {metric} Number of cache {outcome}.")
+            lines.append(f"# TYPE {metric} counter")
+            for cache, method, package, stats in caches:
+                labels = self.__class__._labels(
+                    cache=cache, method=method, package=package
+                )
+                lines.append(f"{metric}{{{labels}}} {stats[outcome]}")
+        queues = snapshot["queues"]
+        for metric, field, kind, description in (
+            ("queue_depth", "depth", "gauge", "Number of queued items."),
+            ("queue_max_depth", "max_depth", "gauge", "Highest queue depth."),
+            ("queue_shed_total", "shed", "counter", "Number of rejected items."),
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {description}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for queue, stats in queues.items():
+                labels = self.__class__._labels(queue=queue)
+                lines.append(f"{prefix}_{metric}{{{labels}}} {stats[field]}")
+        metric = f"{prefix}_queue_wait_seconds"
+        lines.append(f"# HELP {metric} Time items waited in the queue.")
+        lines.append(f"# TYPE {metric} histogram")
+        for queue, stats in queues.items():
+            for bound, count in stats["wait_buckets"].items():
+                labels = self.__class__._labels(queue=queue, le=bound)
+                lines.append(f"{metric}_bucket{{{labels}}} {count}")
+            labels = self.__class__._labels(queue=queue)
+            lines.append(f"{metric}_sum{{{labels}}} {stats['wait_seconds']}")
+            lines.append(f"{metric}_count{{{labels}}} {stats['waits']}")
+        return "\n".join(lines) + "\n"
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
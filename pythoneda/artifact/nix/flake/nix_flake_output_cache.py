@@ -0,0 +1,238 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_output_cache.py
+
+This file defines the NixFlakeOutputCache class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from collections import OrderedDict
+import hashlib
+from .nix_flake_input_set import NixFlakeInputSet
+from .nix_flake_version_range import NixFlakeVersionRange
+from pythoneda.shared.code_requests import CodeRequest
+import threading
+from typing import Any, Iterable, Tuple
+
+
+class NixFlakeOutputCache:
+    """
+    A content-addressed cache of the flakes built for code requests.
+
+    Class name: NixFlakeOutputCache
+
+    Responsibilities:
+        - Computes a digest from a code request and its canonical resolved inputs.
+        - Remembers the flake built for each digest.
+        - Maps code requests with exact dependencies to their flake, so re-runs skip
+          resolution entirely.
+        - Evicts the least recently used entries beyond a number of entries.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeInputSet
+        - pythoneda.artifact.nix.flake.NixFlakeVersionRange
+    """
+
+    def __init__(self, maxEntries: int = 256):
+        """
+        Creates a new NixFlakeOutputCache instance.
+        :param maxEntries: The maximum number of cached flakes, and of cached
+        code requests.
+        :type maxEntries: int
+        """
+        super().__init__()
+        self._max_entries = maxEntries
+        self._entries = OrderedDict()
+        self._requests = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def fingerprint(cls, codeRequest: CodeRequest) -> str:
+        """
+        Retrieves a stable textual representation of given code request.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such representation, or None if the code request cannot provide
+        one, in which case it must not be cached.
+        :rtype: str
+        """
+        to_json = getattr(codeRequest, "to_json", None)
+        if callable(to_json):
+            return to_json()
+        return None
+
+    @classmethod
+    def _hash(cls, kind: str, fingerprint: str, keys: Iterable[Tuple]) -> str:
+        """
+        Hashes a flake kind, a code request fingerprint and some keys.
+        :param kind: The kind of flake.
+        :type kind: str
+        :param fingerprint: The fingerprint of the code request.
+        :type fingerprint: str
+        :param keys: The keys, as tuples of strings.
+        :type keys: Iterable[Tuple]
+        :return: The digest.
+        :rtype: str
+        """
+        result = hashlib.sha256()
+        result.update(kind.encode("utf-8"))
+        result.update(b"\0")
+        result.update(fingerprint.encode("utf-8"))
+        for key in keys:
+            result.update(b"\0")
+            text = "\x1f".join("" if item is None else str(item) for item in key)
+            result.update(text.encode("utf-8"))
+        return result.hexdigest()
+
+    @classmethod
+    def digest(
+        cls, kind: str, codeRequest: CodeRequest, inputs: Iterable[Any]
+    ) -> str:
+        """
+        Computes the digest identifying a flake.
+        :param kind: The kind of flake, usually its class name.
+        :type kind: str
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :param inputs: The resolved inputs.
+        :type inputs: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :return: The digest, or None if the code request has no fingerprint.
+        :rtype: str
+        """
+        fingerprint = cls.fingerprint(codeRequest)
+        if fingerprint is None:
+            return None
+        return cls._hash(kind, fingerprint, NixFlakeInputSet.of(inputs).keys())
+
+    @classmethod
+    def request_digest(
+        cls, kind: str, codeRequest: CodeRequest, inputs: Iterable[Any]
+    ) -> str:
+        """
+        Computes the digest identifying a code request before resolving it, from
+        its fingerprint, its declared dependencies and the inputs given to the factory.
+        :param kind: The kind of flake, usually its class name.
+        :type kind: str
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :param inputs: The inputs given to the factory.
+        :type inputs: Iterable[pythoneda.shared.nix.flake.NixFlake]
+        :return: The digest, or None if the code request has no fingerprint or
+        any dependency is not pinned to an exact version.
+        :rtype: str
+        """
+        fingerprint = cls.fingerprint(codeRequest)
+        if fingerprint is None:
+            return None
+        keys = []
+        for dependency in codeRequest.dependencies:
+            version = getattr(dependency, "version", None)
+            if NixFlakeVersionRange.is_range(version):
+                return None
+            keys.append(
+                (
+                    type(dependency).__name__,
+                    getattr(dependency, "name", None),
+                    version,
+                    getattr(dependency, "url", None),
+                )
+            )
+        keys.append(("inputs",))
+        keys.extend(NixFlakeInputSet.of(inputs).keys())
+        return cls._hash(kind, fingerprint, keys)
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of cached flakes.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def get(self, digest: str) -> Any:
+        """
+        Retrieves the flake cached under given digest.
+        :param digest: The digest.
+        :type digest: str
+        :return: Such flake, or None if not cached.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        with self._lock:
+            result = self._entries.get(digest, None)
+            if result is not None:
+                self._entries.move_to_end(digest)
+            return result
+
+    def put(self, digest: str, flake: Any):
+        """
+        Caches a flake.
+        :param digest: The digest.
+        :type digest: str
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        """
+        with self._lock:
+            self._entries[digest] = flake
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def lookup(self, requestDigest: str) -> Any:
+        """
+        Retrieves the flake last built for a code request.
+        :param requestDigest: The digest computed by request_digest().
+        :type requestDigest: str
+        :return: Such flake, or None if not cached.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        with self._lock:
+            digest = self._requests.get(requestDigest, None)
+            if digest is None:
+                return None
+            self._requests.move_to_end(requestDigest)
+        return self.get(digest)
+
+    def remember(self, requestDigest: str, digest: str):
+        """
+        Maps a code request to the digest of the flake built for it.
+        :param requestDigest: The digest computed by request_digest().
+        :type requestDigest: str
+        :param digest: The digest of the flake.
+        :type digest: str
+        """
+        with self._lock:
+            self._requests[requestDigest] = digest
+            self._requests.move_to_end(requestDigest)
+            while len(self._requests) > self._max_entries:
+                self._requests.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._requests.clear()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
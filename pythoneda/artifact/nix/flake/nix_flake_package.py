@@ -19,7 +19,12 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import asyncio
+from .async_nix_flake_repo import AsyncNixFlakeRepo
+from .executor_async_nix_flake_repo import ExecutorAsyncNixFlakeRepo
 from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_resolution_batcher import NixFlakeResolutionBatcher
+from .nix_flake_work_queue import NixFlakeWorkQueue
 from pythoneda import listen, Event, EventEmitter, EventListener, Ports
 from pythoneda.shared.code_requests import CodeRequest
 from pythoneda.shared.artifact.events.code import (
@@ -29,6 +34,7 @@ from pythoneda.shared.artifact.events.code import (
     ChangeStagingCodePackaged,
 )
 from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec, NixFlakeSpecForExecution
+from typing import Awaitable, Callable
 
 
 class NixFlakePackage(EventListener):
@@ -45,6 +51,9 @@ class NixFlakePackage(EventListener):
     """
 
     _singleton = None
+    _async_nix_flake_repo = None
+    _execution_batcher = None
+    _work_queue = None
 
     def __init__(self):
         """
@@ -73,7 +82,18 @@ class NixFlakePackage(EventListener):
         :type event: pythoneda.shared.artifact.events.code.ChangeStagingCodeDescribed
         """
         NixFlakePackage.logger().info(f"Received {type(event)}")
-        nix_flake = cls.resolve_nix_flake(event.code_request)
+        return await cls.admit(cls.package_code, event)
+
+    @classmethod
+    async def package_code(cls, event: ChangeStagingCodeDescribed):
+        """
+        Packages the code of a ChangeStagingCodeDescribed event.
+        :param event: The event.
+        :type event: pythoneda.shared.artifact.events.code.ChangeStagingCodeDescribed
+        :return: The emitted event.
+        :rtype: pythoneda.shared.artifact.events.code.ChangeStagingCodePackaged
+        """
+        nix_flake = await cls.resolve_nix_flake_async(event.code_request)
         result = ChangeStagingCodePackaged(nix_flake, event.id)
 
         NixFlakePackage.logger().info(f"Emitting {type(result)}")
@@ -91,13 +111,90 @@ class NixFlakePackage(EventListener):
         :type event: pythoneda.shared.artifact.events.code.ChangeStagingCodeExecutionRequested
         """
         NixFlakePackage.logger().info(f"Received {type(event)}")
-        nix_flake = cls.resolve_nix_flake_for_execution(event.code_request)
+        return await cls.admit(cls.package_code_for_execution, event)
+
+    @classmethod
+    async def package_code_for_execution(
+        cls, event: ChangeStagingCodeExecutionRequested
+    ):
+        """
+        Packages the code of a ChangeStagingCodeExecutionRequested event.
+        :param event: The event.
+        :type event: pythoneda.shared.artifact.events.code.ChangeStagingCodeExecutionRequested
+        :return: The emitted event.
+        :rtype: pythoneda.shared.artifact.events.code.ChangeStagingCodeExecutionPackaged
+        """
+        nix_flake = await cls.resolve_nix_flake_for_execution_async(
+            event.code_request
+        )
         result = ChangeStagingCodeExecutionPackaged(nix_flake, event.id)
 
         NixFlakePackage.logger().info(f"Emitting {type(result)}")
         await Ports.instance().resolve(EventEmitter).emit(result)
         return result
 
+    @classmethod
+    async def admit(cls, handler: Callable[[Event], Awaitable], event: Event):
+        """
+        Runs given handler, through the work queue if enabled.
+        :param handler: The handler.
+        :type handler: Callable[[pythoneda.Event], Awaitable]
+        :param event: The event.
+        :type event: pythoneda.Event
+        :return: The handler result, or None if the event was shed.
+        :rtype: pythoneda.Event
+        """
+        work_queue = cls._work_queue
+        if work_queue is None:
+            return await handler(event)
+        try:
+            return await work_queue.submit(handler, event)
+        except asyncio.QueueFull:
+            NixFlakePackage.logger().warning(
+                f"Discarding {type(event)}: {work_queue.name} queue is full"
+            )
+            return None
+
+    @classmethod
+    def use_work_queue(
+        cls,
+        enabled: bool = True,
+        maxSize: int = 256,
+        workers: int = 8,
+        policy: str = NixFlakeWorkQueue.BLOCK,
+    ):
+        """
+        Enables or disables the bounded queue both listeners submit their work to.
+        The previous queue, if any, is closed once it has processed its pending work.
+        :param enabled: Whether to use the queue.
+        :type enabled: bool
+        :param maxSize: The maximum number of queued events.
+        :type maxSize: int
+        :param workers: The number of events processed at once.
+        :type workers: int
+        :param policy: What to do when the queue is full: NixFlakeWorkQueue.BLOCK
+        waits for room, and NixFlakeWorkQueue.SHED discards the event.
+        :type policy: str
+        """
+        previous = cls._work_queue
+        if enabled:
+            cls._work_queue = NixFlakeWorkQueue(
+                "NixFlakePackage", maxSize, workers, policy
+            )
+        else:
+            cls._work_queue = None
+        if previous is not None:
+            previous.close_later()
+
+    @classmethod
+    def work_queue(cls) -> NixFlakeWorkQueue:
+        """
+        Retrieves the work queue, if enabled.
+        :return: Such queue, or None.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeWorkQueue
+        """
+        return cls._work_queue
+
     @classmethod
     def resolve_nix_flake(cls, codeRequest: CodeRequest) -> NixFlake:
         """
@@ -124,6 +221,78 @@ class NixFlakePackage(EventListener):
             NixFlakeSpecForExecution(codeRequest.nix_flake_spec)
         )
 
+    @classmethod
+    def async_nix_flake_repo(cls) -> AsyncNixFlakeRepo:
+        """
+        Retrieves the asynchronous NixFlakeRepo.
+        If no AsyncNixFlakeRepo adapter is available, the NixFlakeRepo adapter
+        is run in the default executor.
+        :return: Such repository.
+        :rtype: pythoneda.artifact.nix.flake.AsyncNixFlakeRepo
+        """
+        result = Ports.instance().resolve(AsyncNixFlakeRepo)
+        if result is None:
+            nix_flake_repo = Ports.instance().resolve(NixFlakeRepo)
+            result = cls._async_nix_flake_repo
+            if result is None or result.repo is not nix_flake_repo:
+                result = ExecutorAsyncNixFlakeRepo(nix_flake_repo)
+                cls._async_nix_flake_repo = result
+        return result
+
+    @classmethod
+    async def resolve_nix_flake_async(cls, codeRequest: CodeRequest) -> NixFlake:
+        """
+        Resolves a NixFlake based on the code request specification, without
+        blocking the event loop.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: A compatible NixFlake.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return await cls.async_nix_flake_repo().resolve(codeRequest.nix_flake_spec)
+
+    @classmethod
+    async def resolve_nix_flake_for_execution_async(
+        cls, codeRequest: CodeRequest
+    ) -> NixFlake:
+        """
+        Resolves a NixFlake to execute the code request, without blocking the
+        event loop.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: A compatible NixFlake.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        spec = NixFlakeSpecForExecution(codeRequest.nix_flake_spec)
+        if cls._execution_batcher is not None:
+            return await cls._execution_batcher.resolve(spec)
+        return await cls.async_nix_flake_repo().resolve(spec)
+
+    @classmethod
+    def use_execution_batching(
+        cls, enabled: bool = True, maxBatchSize: int = 64, maxDelay: float = 0.005
+    ):
+        """
+        Enables or disables micro-batching of the resolutions triggered by
+        ChangeStagingCodeExecutionRequested events: the specs requested within a short
+        window are resolved in a single, deduplicated call, and each event still gets
+        its own ChangeStagingCodeExecutionPackaged.
+        :param enabled: Whether to batch resolutions.
+        :type enabled: bool
+        :param maxBatchSize: The number of pending resolutions that triggers a batch.
+        :type maxBatchSize: int
+        :param maxDelay: The maximum time, in seconds, a resolution waits for its batch.
+        :type maxDelay: float
+        """
+        if enabled:
+            cls._execution_batcher = NixFlakeResolutionBatcher(
+                lambda specs: cls.async_nix_flake_repo().resolve_many(specs),
+                maxBatchSize,
+                maxDelay,
+            )
+        else:
+            cls._execution_batcher = None
+
 
 # vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
 # Local Variables:
@@ -0,0 +1,233 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_ref.py
+
+This file defines the NixFlakeRef class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_repo import NixFlakeRepo
+from pythoneda.shared.nix.flake import NixFlake
+import sys
+import threading
+from typing import Tuple, Type
+
+
+class NixFlakeRef:
+    """
+    A compact, immutable reference to a resolved Nix flake.
+
+    Class name: NixFlakeRef
+
+    Responsibilities:
+        - Holds the name, version, url and flake class of a flake, and nothing else.
+        - Shares repeated names and versions, and identifies flake classes by number.
+        - Hydrates into the full NixFlake on demand.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    __slots__ = ("_name", "_version", "_url", "_flake_class_id")
+
+    _flake_classes = []
+    _flake_class_ids = {}
+    _flake_classes_lock = threading.Lock()
+
+    def __init__(
+        self, name: str, version: str, url: str = None, flakeClassId: int = 0
+    ):
+        """
+        Creates a new NixFlakeRef instance.
+        :param name: The flake name.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :param url: The url, if any.
+        :type url: str
+        :param flakeClassId: The id of the flake class, as returned by flake_class_id().
+        :type flakeClassId: int
+        """
+        super().__init__()
+        self._name = sys.intern(name)
+        self._version = sys.intern(version)
+        self._url = url
+        self._flake_class_id = flakeClassId
+
+    @classmethod
+    def of(cls, flake: NixFlake):
+        """
+        Builds a reference to given flake.
+        :param flake: The flake.
+        :type flake: pythoneda.shared.nix.flake.NixFlake
+        :return: The reference.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeRef
+        """
+        return cls(
+            str(flake.name),
+            str(flake.version),
+            flake.url,
+            cls.flake_class_id(type(flake)),
+        )
+
+    @classmethod
+    def flake_class_id(cls, flakeClass: Type[NixFlake]) -> int:
+        """
+        Retrieves the id of given flake class, assigning a new one if needed.
+        :param flakeClass: The flake class.
+        :type flakeClass: Type[pythoneda.shared.nix.flake.NixFlake]
+        :return: Such id.
+        :rtype: int
+        """
+        result = cls._flake_class_ids.get(flakeClass, None)
+        if result is None:
+            with cls._flake_classes_lock:
+                result = cls._flake_class_ids.get(flakeClass, None)
+                if result is None:
+                    cls._flake_classes.append(flakeClass)
+                    result = len(cls._flake_classes)
+                    cls._flake_class_ids[flakeClass] = result
+        return result
+
+    @property
+    def name(self) -> str:
+        """
+        Retrieves the flake name.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._name
+
+    @property
+    def version(self) -> str:
+        """
+        Retrieves the version.
+        :return: Such version.
+        :rtype: str
+        """
+        return self._version
+
+    @property
+    def url(self) -> str:
+        """
+        Retrieves the url.
+        :return: Such url, or None.
+        :rtype: str
+        """
+        return self._url
+
+    @property
+    def flake_class(self) -> Type[NixFlake]:
+        """
+        Retrieves the flake class.
+        :return: Such class, or NixFlake if unknown.
+        :rtype: Type[pythoneda.shared.nix.flake.NixFlake]
+        """
+        if self._flake_class_id <= 0:
+            return NixFlake
+        return self.__class__._flake_classes[self._flake_class_id - 1]
+
+    def key(self) -> Tuple[str, str, str]:
+        """
+        Retrieves the identity of the referenced flake, as NixFlakeInputSet.key() does.
+        :return: Its name, version and url.
+        :rtype: Tuple[str, str, str]
+        """
+        return (self._name, self._version, "" if self._url is None else self._url)
+
+    def hydrate(self, repo: NixFlakeRepo) -> NixFlake:
+        """
+        Retrieves the referenced flake: by name, version and url from repositories
+        supporting find_by_pk(), such as CatalogNixFlakeRepo, or by name and version
+        otherwise.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        try:
+            result = repo.find_by_pk(self.key())
+        except NotImplementedError:
+            result = None
+        if result is None:
+            result = repo.find(self._name, self._version)
+        return result
+
+    def __eq__(self, other) -> bool:
+        """
+        Checks whether given reference points to the same flake.
+        :param other: The other reference.
+        :type other: pythoneda.artifact.nix.flake.NixFlakeRef
+        :return: True in such case.
+        :rtype: bool
+        """
+        if not isinstance(other, NixFlakeRef):
+            return NotImplemented
+        return (
+            self.key() == other.key()
+            and self._flake_class_id == other._flake_class_id
+        )
+
+    def __hash__(self) -> int:
+        """
+        Retrieves the hash of this reference.
+        :return: Such hash.
+        :rtype: int
+        """
+        return hash((self._name, self._version, self._url))
+
+    def __getstate__(self) -> Tuple:
+        """
+        Retrieves the state to pickle. The flake class is stored by reference,
+        since ids are only meaningful within a process.
+        :return: Such state.
+        :rtype: Tuple
+        """
+        return (self._name, self._version, self._url, self.flake_class)
+
+    def __setstate__(self, state: Tuple):
+        """
+        Restores a pickled state.
+        :param state: The state.
+        :type state: Tuple
+        """
+        name, version, url, flake_class = state
+        self._name = sys.intern(name)
+        self._version = sys.intern(version)
+        self._url = url
+        self._flake_class_id = self.__class__.flake_class_id(flake_class)
+
+    def __repr__(self) -> str:
+        """
+        Provides a representation of this instance.
+        :return: Such representation.
+        :rtype: str
+        """
+        return (
+            f"NixFlakeRef({self._name!r}, {self._version!r}, {self._url!r}, "
+            f"{self.flake_class.__name__})"
+        )
+
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
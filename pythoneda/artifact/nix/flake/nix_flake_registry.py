@@ -0,0 +1,283 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_registry.py
+
+This file defines the NixFlakeRegistry class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_registry_entry import NixFlakeRegistryEntry
+from pythoneda.shared.nix.flake import (
+    FlakeUtilsNixFlake,
+    NixFlake,
+    NixosNixFlake,
+    PythonedaSharedPythonedaBannerNixFlake,
+    PythonedaSharedPythonedaDomainNixFlake,
+)
+from typing import Dict, List
+
+
+class NixFlakeRegistry:
+    """
+    The table of packages known to NixFlakeRepo.
+
+    Class name: NixFlakeRegistry
+
+    Responsibilities:
+        - Maps each flake name to its NixFlakeRegistryEntry.
+        - Maps each NixFlakeRepo method stem to its NixFlakeRegistryEntry.
+        - Allows iterating over all known packages.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRegistryEntry
+    """
+
+    _entries: Dict[str, NixFlakeRegistryEntry] = {}
+    _entries_by_key: Dict[str, NixFlakeRegistryEntry] = {}
+
+    @classmethod
+    def register(cls, entry: NixFlakeRegistryEntry):
+        """
+        Registers a new package.
+        :param entry: The entry describing the package.
+        :type entry: pythoneda.artifact.nix.flake.NixFlakeRegistryEntry
+        """
+        cls._entries[entry.name] = entry
+        cls._entries_by_key[entry.key] = entry
+
+    @classmethod
+    def get(cls, name: str) -> NixFlakeRegistryEntry:
+        """
+        Retrieves the entry of given flake.
+        :param name: The flake name.
+        :type name: str
+        :return: Such entry, or None if the flake is unknown.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeRegistryEntry
+        """
+        return cls._entries.get(name, None)
+
+    @classmethod
+    def get_by_key(cls, key: str) -> NixFlakeRegistryEntry:
+        """
+        Retrieves the entry of given NixFlakeRepo method stem.
+        :param key: The stem, i.e. "Nixos" for latest_Nixos_version.
+        :type key: str
+        :return: Such entry, or None if the stem is unknown.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeRegistryEntry
+        """
+        return cls._entries_by_key.get(key, None)
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """
+        Retrieves the names of all known flakes.
+        :return: Such names.
+        :rtype: List[str]
+        """
+        return list(cls._entries)
+
+    @classmethod
+    def entries(cls) -> List[NixFlakeRegistryEntry]:
+        """
+        Retrieves the entries of all known flakes.
+        :return: Such entries.
+        :rtype: List[pythoneda.artifact.nix.flake.NixFlakeRegistryEntry]
+        """
+        return list(cls._entries.values())
+
+
+for _entry in (
+    NixFlakeRegistryEntry("cachetools", "Cachetools", NixFlake, "cachetools"),
+    NixFlakeRegistryEntry("dbus-next", "DbusNext", NixFlake, "dbus-next"),
+    NixFlakeRegistryEntry("dulwich", "Dulwich", NixFlake, "dulwich"),
+    NixFlakeRegistryEntry(
+        "flake-utils",
+        "FlakeUtils",
+        FlakeUtilsNixFlake,
+        "FlakeUtils",
+    ),
+    NixFlakeRegistryEntry("gitpython", "GitPython", NixFlake, "GitPython"),
+    NixFlakeRegistryEntry("grpcio", "Grpcio", NixFlake, "grpcio"),
+    NixFlakeRegistryEntry("joblib", "Joblib", NixFlake, "Joblib"),
+    NixFlakeRegistryEntry("jupyterlab", "Jupyterlab", NixFlake, "Jupyterlab"),
+    NixFlakeRegistryEntry("nbformat", "Nbformat", NixFlake, "nbformat"),
+    NixFlakeRegistryEntry("nixos", "Nixos", NixosNixFlake, "NixOS"),
+    NixFlakeRegistryEntry("paramiko", "Paramiko", NixFlake, "paramiko"),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-code-request-application",
+        "PythonedaArtifactCodeRequestApplication",
+        NixFlake,
+        "pythoneda-artifact/code-request-application",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-code-request-infrastructure",
+        "PythonedaArtifactCodeRequestInfrastructure",
+        NixFlake,
+        "pythoneda-artifact/code-request-infrastructure",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-git",
+        "PythonedaArtifactGit",
+        NixFlake,
+        "pythoneda-artifact/git",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-git-application",
+        "PythonedaArtifactGitApplication",
+        NixFlake,
+        "pythoneda-artifact/git-application",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-git-infrastructure",
+        "PythonedaArtifactGitInfrastructure",
+        NixFlake,
+        "pythoneda-artifact/git-infrastructure",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-nix-flake",
+        "PythonedaArtifactNixFlake",
+        NixFlake,
+        "pythoneda-artifact/nix-flake",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-nix-flake-application",
+        "PythonedaArtifactNixFlakeApplication",
+        NixFlake,
+        "pythoneda-artifact/nix-flake-application",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-artifact-nix-flake-infrastructure",
+        "PythonedaArtifactNixFlakeInfrastructure",
+        NixFlake,
+        "pythoneda-artifact/nix-flake-infrastructure",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-realm-rydnr-application",
+        "PythonedaRealmRydnrApplication",
+        NixFlake,
+        "pythoneda-realm-rydnr/application",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-realm-rydnr-infrastructure",
+        "PythonedaRealmRydnrInfrastructure",
+        NixFlake,
+        "pythoneda-realm-rydnr/infrastructure",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-realm-rydnr-realm",
+        "PythonedaRealmRydnrRealm",
+        NixFlake,
+        "pythoneda-realm-rydnr/realm",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-artifact-changes-events",
+        "PythonedaSharedArtifactChangesEvents",
+        NixFlake,
+        "pythoneda-shared-artifact-changes/events",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-artifact-changes-events-infrastructure",
+        "PythonedaSharedArtifactChangesEventsInfrastructure",
+        NixFlake,
+        "pythoneda-shared-artifact-changes/events-infrastructure",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-artifact-changes-shared",
+        "PythonedaSharedArtifactChangesShared",
+        NixFlake,
+        "pythoneda-shared-artifact-changes/shared",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-code-requests-events",
+        "PythonedaSharedCodeRequestsEvents",
+        NixFlake,
+        "pythoneda-shared-code-requests/events",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-code-requests-events-infrastructure",
+        "PythonedaSharedCodeRequestsEventsInfrastructure",
+        NixFlake,
+        "pythoneda-shared-code-requests/events-infrastructure",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-code-requests-jupyterlab",
+        "PythonedaSharedCodeRequestsJupyterlab",
+        NixFlake,
+        "pythoneda-shared-code-requests/jupyterlab",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-code-requests-shared",
+        "PythonedaSharedCodeRequestsShared",
+        NixFlake,
+        "pythoneda-shared-code-requests/shared",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-git-shared",
+        "PythonedaSharedGitShared",
+        NixFlake,
+        "pythoneda-shared-git/shared",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-nix-flake-shared",
+        "PythonedaSharedNixFlakeShared",
+        NixFlake,
+        "pythoneda-shared-nix-flake/shared",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-pythoneda-application",
+        "PythonedaSharedPythonedaApplication",
+        NixFlake,
+        "pythoneda-shared-pythoneda/application",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-pythoneda-banner",
+        "PythonedaSharedPythonedaBanner",
+        PythonedaSharedPythonedaBannerNixFlake,
+        "PythonEDA banner",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-pythoneda-domain",
+        "PythonedaSharedPythonedaDomain",
+        PythonedaSharedPythonedaDomainNixFlake,
+        "PythonEDA domain",
+    ),
+    NixFlakeRegistryEntry(
+        "pythoneda-shared-pythoneda-infrastructure",
+        "PythonedaSharedPythonedaInfrastructure",
+        NixFlake,
+        "pythoneda-shared-pythoneda/infrastructure",
+    ),
+    NixFlakeRegistryEntry("requests", "Requests", NixFlake, "requests"),
+    NixFlakeRegistryEntry("semver", "Semver", NixFlake, "semver"),
+    NixFlakeRegistryEntry(
+        "stringtemplate3",
+        "Stringtemplate3",
+        NixFlake,
+        "stringtemplate3",
+    ),
+    NixFlakeRegistryEntry("unidiff", "Unidiff", NixFlake, "unidiff"),
+):
+    NixFlakeRegistry.register(_entry)
+del _entry
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
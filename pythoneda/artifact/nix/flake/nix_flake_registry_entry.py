@@ -0,0 +1,140 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_registry_entry.py
+
+This file defines the NixFlakeRegistryEntry class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.shared.nix.flake import NixFlake
+from typing import Type
+
+
+class NixFlakeRegistryEntry:
+    """
+    Describes a package known to NixFlakeRepo.
+
+    Class name: NixFlakeRegistryEntry
+
+    Responsibilities:
+        - Knows the flake name, the NixFlakeRepo method stem and the flake class of a package.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRegistry
+    """
+
+    __slots__ = ("_name", "_key", "_flake_class", "_description")
+
+    def __init__(
+        self, name: str, key: str, flakeClass: Type[NixFlake], description: str
+    ):
+        """
+        Creates a new NixFlakeRegistryEntry instance.
+        :param name: The flake name.
+        :type name: str
+        :param key: The stem of the NixFlakeRepo methods, i.e. latest_[key]_version.
+        :type key: str
+        :param flakeClass: The class of the flakes.
+        :type flakeClass: Type[pythoneda.shared.nix.flake.NixFlake]
+        :param description: A human-readable description.
+        :type description: str
+        """
+        super().__init__()
+        self._name = name
+        self._key = key
+        self._flake_class = flakeClass
+        self._description = description
+
+    @property
+    def name(self) -> str:
+        """
+        Retrieves the flake name.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._name
+
+    @property
+    def key(self) -> str:
+        """
+        Retrieves the stem of the NixFlakeRepo methods.
+        :return: Such stem.
+        :rtype: str
+        """
+        return self._key
+
+    @property
+    def flake_class(self) -> Type[NixFlake]:
+        """
+        Retrieves the class of the flakes.
+        :return: Such class.
+        :rtype: Type[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return self._flake_class
+
+    @property
+    def description(self) -> str:
+        """
+        Retrieves the description.
+        :return: Such description.
+        :rtype: str
+        """
+        return self._description
+
+    @property
+    def latest_method(self) -> str:
+        """
+        Retrieves the name of the NixFlakeRepo method retrieving the latest flake.
+        :return: Such name.
+        :rtype: str
+        """
+        return f"latest_{self._key}"
+
+    @property
+    def latest_version_method(self) -> str:
+        """
+        Retrieves the name of the NixFlakeRepo method retrieving the latest version.
+        :return: Such name.
+        :rtype: str
+        """
+        return f"latest_{self._key}_version"
+
+    @property
+    def find_version_method(self) -> str:
+        """
+        Retrieves the name of the NixFlakeRepo method retrieving a specific version.
+        :return: Such name.
+        :rtype: str
+        """
+        return f"find_{self._key}_version"
+
+    def __repr__(self) -> str:
+        """
+        Provides a representation of this instance.
+        :return: Such representation.
+        :rtype: str
+        """
+        return f"NixFlakeRegistryEntry({self._name!r}, {self._key!r}, {self._flake_class.__name__})"
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -20,6 +20,12 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import abc
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from .nix_flake_registry import NixFlakeRegistry
+from .nix_flake_version import NixFlakeVersion
+from .nix_flake_version_index import NixFlakeVersionIndex
+from .nix_flake_version_range import NixFlakeVersionRange
 from pythoneda.shared import Repo
 from pythoneda.shared.code_requests import CodeExecutionNixFlake, CodeRequest
 from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequestNixFlake
@@ -31,6 +37,8 @@ from pythoneda.shared.nix.flake import (
     PythonedaSharedPythonedaBannerNixFlake,
     PythonedaSharedPythonedaDomainNixFlake,
 )
+import threading
+import time
 from typing import Dict, List
 
 
@@ -52,6 +60,11 @@ class NixFlakeRepo(Repo, abc.ABC):
         Creates a new NixFlakeRepo instance.
         """
         super().__init__(NixFlake)
+        self._version_index = None
+        self._max_concurrency = 8
+        self._resolution_timeout = None
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
     def default_latest_flakes(self) -> List:
         """
@@ -61,30 +74,133 @@ class NixFlakeRepo(Repo, abc.ABC):
         :rtype: List[pythoneda.shared.nix.flake.NixFlake]
         """
         return [
-            self.latest_Nixos(),
-            self.latest_FlakeUtils(),
-            self.latest_PythonedaSharedPythonedaBanner(),
-            self.latest_PythonedaSharedPythonedaDomain(),
+            self.latest(name)
+            for name in [
+                "nixos",
+                "flake-utils",
+                "pythoneda-shared-pythoneda-banner",
+                "pythoneda-shared-pythoneda-domain",
+            ]
         ]
 
+    def latest(self, name: str) -> NixFlake:
+        """
+        Retrieves the latest Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        version = self.latest_version(name)
+        if version is None:
+            return None
+        return self.find(name, version)
+
+    @abc.abstractmethod
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the version of the latest Nix flake of given package.
+        The latest_[key]_version methods rely on this one.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such version, or None if the package is unknown.
+        :rtype: str
+        """
+        pass
+
+    @abc.abstractmethod
+    def find(self, name: str, version: str) -> NixFlake:
+        """
+        Retrieves a specific version of the Nix flake of given package.
+        The find_[key]_version methods rely on this one.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        pass
+
+    def versions(self, name: str, newerThan: str = None) -> List[str]:
+        """
+        Retrieves the available versions of given package.
+        Adapters able to list every published version should override this method.
+        By default, only the latest version is known.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param newerThan: If provided, only versions newer than this one are retrieved.
+        :type newerThan: str
+        :return: Such versions.
+        :rtype: List[str]
+        """
+        latest = self.latest_version(name)
+        if latest is None:
+            return []
+        if newerThan is not None:
+            latest_version = NixFlakeVersion.parse(latest)
+            newer_than_version = NixFlakeVersion.parse(newerThan)
+            if (
+                latest_version is not None
+                and newer_than_version is not None
+                and latest_version <= newer_than_version
+            ):
+                return []
+        return [latest]
+
+    def version_index(self) -> NixFlakeVersionIndex:
+        """
+        Retrieves the index of the versions this repository has seen.
+        :return: Such index.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeVersionIndex
+        """
+        if self._version_index is None:
+            self._version_index = NixFlakeVersionIndex()
+        return self._version_index
+
+    def find_compatible(self, name: str, constraint: str) -> NixFlake:
+        """
+        Retrieves the Nix flake of the highest version of given package satisfying
+        a constraint.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param constraint: The constraint, such as ">=0.0.3,<0.1".
+        :type constraint: str
+        :return: Such flake, or None if no version matches.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        index = self.version_index()
+        index.refresh(self, name)
+        version = index.highest_compatible(name, constraint)
+        if version is None:
+            return None
+        return self.find(name, version)
+
+    @classmethod
+    def known_flakes(cls) -> List[str]:
+        """
+        Retrieves the names of all packages this repository knows about.
+        :return: Such names.
+        :rtype: List[str]
+        """
+        return NixFlakeRegistry.names()
+
     def latest_Cachetools(self) -> NixFlake:
         """
         Retrieves the latest Nix flake for grpcio.
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Cachetools_version(self.latest_Cachetools_version())
+        return self.latest("cachetools")
 
-    @abc.abstractmethod
     def latest_Cachetools_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for grpcio.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("cachetools")
 
-    @abc.abstractmethod
     def find_Cachetools_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for cachetools.
@@ -93,7 +209,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("cachetools", version)
 
     def latest_DbusNext(self) -> NixFlake:
         """
@@ -101,18 +217,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_DbusNext_version(self.latest_DbusNext_version())
+        return self.latest("dbus-next")
 
-    @abc.abstractmethod
     def latest_DbusNext_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for dbus-next.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("dbus-next")
 
-    @abc.abstractmethod
     def find_DbusNext_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for dbus-next.
@@ -121,7 +235,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("dbus-next", version)
 
     def latest_Dulwich(self) -> NixFlake:
         """
@@ -129,18 +243,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Dulwich_version(self.latest_Dulwich_version())
+        return self.latest("dulwich")
 
-    @abc.abstractmethod
     def latest_Dulwich_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for dulwich.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("dulwich")
 
-    @abc.abstractmethod
     def find_Dulwich_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for dulwich.
@@ -149,7 +261,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("dulwich", version)
 
     @abc.abstractmethod
     def latest_code_execution(self, codeRequest: CodeRequest) -> CodeExecutionNixFlake:
@@ -168,19 +280,17 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.FlakeUtilsNixFlake
         """
-        return self.find_FlakeUtils_version(self.latest_FlakeUtils_version())
+        return self.latest("flake-utils")
 
-    @abc.abstractmethod
     def latest_FlakeUtils_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for FlakeUtils.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("flake-utils")
 
-    @abc.abstractmethod
-    def find_FlakeUtils_version(self, version: str) -> str:
+    def find_FlakeUtils_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for FlakeUtils.
         :param version: The version.
@@ -188,7 +298,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.FlakeUtilsNixFlake
         """
-        pass
+        return self.find("flake-utils", version)
 
     def latest_GitPython(self) -> NixFlake:
         """
@@ -196,18 +306,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_GitPython_version(self.latest_GitPython_version())
+        return self.latest("gitpython")
 
-    @abc.abstractmethod
     def latest_GitPython_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for GitPython.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("gitpython")
 
-    @abc.abstractmethod
     def find_GitPython_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for GitPython.
@@ -216,7 +324,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("gitpython", version)
 
     def latest_Grpcio(self) -> NixFlake:
         """
@@ -224,18 +332,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Grpcio_version(self.latest_Grpcio_version())
+        return self.latest("grpcio")
 
-    @abc.abstractmethod
     def latest_Grpcio_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for grpcio.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("grpcio")
 
-    @abc.abstractmethod
     def find_Grpcio_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for grpcio.
@@ -244,7 +350,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("grpcio", version)
 
     def latest_Joblib(self) -> NixFlake:
         """
@@ -252,19 +358,17 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Joblib_version(self.latest_Joblib_version())
+        return self.latest("joblib")
 
-    @abc.abstractmethod
     def latest_Joblib_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for Joblib.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("joblib")
 
-    @abc.abstractmethod
-    def find_Joblib_version(self, version: str) -> str:
+    def find_Joblib_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for Joblib.
         :param version: The version.
@@ -272,7 +376,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("joblib", version)
 
     @abc.abstractmethod
     def latest_Jupyterlab_for_code_requests(
@@ -293,18 +397,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Jupyterlab_version(self.latest_Jupyterlab_version())
+        return self.latest("jupyterlab")
 
-    @abc.abstractmethod
     def latest_Jupyterlab_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for Jupyterlab.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("jupyterlab")
 
-    @abc.abstractmethod
     def find_Jupyterlab_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for Jupyterlab.
@@ -313,7 +415,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("jupyterlab", version)
 
     def latest_Nbformat(self) -> NixFlake:
         """
@@ -321,18 +423,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Nbformat_version(self.latest_Nbformat_version())
+        return self.latest("nbformat")
 
-    @abc.abstractmethod
     def latest_Nbformat_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for nbformat.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("nbformat")
 
-    @abc.abstractmethod
     def find_Nbformat_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for nbformat.
@@ -341,7 +441,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("nbformat", version)
 
     def latest_Nixos(self) -> NixosNixFlake:
         """
@@ -349,18 +449,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Nixos_version(self.latest_Nixos_version())
+        return self.latest("nixos")
 
-    @abc.abstractmethod
     def latest_Nixos_version(self) -> str:
         """
         Retrieves the version of the latest NixOS flake.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("nixos")
 
-    @abc.abstractmethod
     def find_Nixos_version(self, version: str) -> NixosNixFlake:
         """
         Retrieves a specific version of the NixOS flake.
@@ -369,7 +467,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("nixos", version)
 
     def latest_Paramiko(self) -> NixFlake:
         """
@@ -377,18 +475,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Paramiko_version(self.latest_Paramiko_version())
+        return self.latest("paramiko")
 
-    @abc.abstractmethod
     def latest_Paramiko_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for paramiko.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("paramiko")
 
-    @abc.abstractmethod
     def find_Paramiko_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for paramiko.
@@ -397,7 +493,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("paramiko", version)
 
     def latest_PythonedaArtifactCodeRequestApplication(self) -> NixFlake:
         """
@@ -405,20 +501,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactCodeRequestApplication_version(
-            self.latest_PythonedaArtifactCodeRequestApplication_version()
-        )
+        return self.latest("pythoneda-artifact-code-request-application")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactCodeRequestApplication_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/code-request-application.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-code-request-application")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactCodeRequestApplication_version(
         self, version: str
     ) -> NixFlake:
@@ -429,7 +521,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-code-request-application", version)
 
     def latest_PythonedaArtifactCodeRequestInfrastructure(self) -> NixFlake:
         """
@@ -437,20 +529,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactCodeRequestInfrastructure_version(
-            self.latest_PythonedaArtifactCodeRequestInfrastructure_version()
-        )
+        return self.latest("pythoneda-artifact-code-request-infrastructure")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactCodeRequestInfrastructure_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/code-request-infrastructure.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-code-request-infrastructure")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactCodeRequestInfrastructure_version(
         self, version: str
     ) -> NixFlake:
@@ -461,7 +549,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-code-request-infrastructure", version)
 
     def latest_PythonedaArtifactGit(self) -> NixFlake:
         """
@@ -469,20 +557,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactGit_version(
-            self.latest_PythonedaActifactGit_version()
-        )
+        return self.latest("pythoneda-artifact-git")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactGit_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/git.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-git")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactGit_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-artifact/git
@@ -491,7 +575,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-git", version)
 
     def latest_PythonedaArtifactGitApplication(self) -> NixFlake:
         """
@@ -499,20 +583,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactGitApplication_version(
-            self.latest_PythonedaActifactGitApplication_version()
-        )
+        return self.latest("pythoneda-artifact-git-application")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactGitApplication_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/git-application.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-git-application")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactGitApplication_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-artifact/git-application
@@ -521,7 +601,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-git-application", version)
 
     def latest_PythonedaArtifactGitInfrastructure(self) -> NixFlake:
         """
@@ -529,20 +609,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactGitInfrastructure_version(
-            self.latest_PythonedaActifactGitInfrastructure_version()
-        )
+        return self.latest("pythoneda-artifact-git-infrastructure")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactGitInfrastructure_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/git-infrastructure.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-git-infrastructure")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactGitInfrastructure_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-artifact/git-infrastructure
@@ -551,7 +627,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-git-infrastructure", version)
 
     def latest_PythonedaArtifactNixFlake(self) -> NixFlake:
         """
@@ -559,20 +635,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactNixFlake_version(
-            self.latest_PythonedaActifactNixFlake_version()
-        )
+        return self.latest("pythoneda-artifact-nix-flake")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactNixFlake_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/nix-flake.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-nix-flake")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactNixFlake_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-artifact/nix-flake
@@ -581,7 +653,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-nix-flake", version)
 
     def latest_PythonedaArtifactNixFlakeApplication(self) -> NixFlake:
         """
@@ -589,20 +661,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactNixFlakeApplication_version(
-            self.latest_PythonedaActifactNixFlakeApplication_version()
-        )
+        return self.latest("pythoneda-artifact-nix-flake-application")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactNixFlakeApplication_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/nix-flake-application.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-nix-flake-application")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactNixFlakeApplication_version(
         self, version: str
     ) -> NixFlake:
@@ -613,7 +681,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-nix-flake-application", version)
 
     def latest_PythonedaArtifactNixFlakeInfrastructure(self) -> NixFlake:
         """
@@ -621,20 +689,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaArtifactNixFlakeInfrastructure_version(
-            self.latest_PythonedaActifactNixFlakeInfrastructure_version()
-        )
+        return self.latest("pythoneda-artifact-nix-flake-infrastructure")
 
-    @abc.abstractmethod
     def latest_PythonedaArtifactNixFlakeInfrastructure_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-artifact/nix-flake-infrastructure.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-artifact-nix-flake-infrastructure")
 
-    @abc.abstractmethod
     def find_PythonedaArtifactNixFlakeInfrastructure_version(
         self, version: str
     ) -> NixFlake:
@@ -645,7 +709,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-artifact-nix-flake-infrastructure", version)
 
     def latest_PythonedaRealmRydnrApplication(self) -> NixFlake:
         """
@@ -653,20 +717,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaRealmRydnrApplication_version(
-            self.latest_PythonedaRealmRydnrApplication_version()
-        )
+        return self.latest("pythoneda-realm-rydnr-application")
 
-    @abc.abstractmethod
     def latest_PythonedaRealmRydnrApplication_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-realm-rydnr/application.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-realm-rydnr-application")
 
-    @abc.abstractmethod
     def find_PythonedaRealmRydnrApplication_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-realm-rydnr/application
@@ -675,7 +735,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-realm-rydnr-application", version)
 
     def latest_PythonedaRealmRydnrInfrastructure(self) -> NixFlake:
         """
@@ -683,20 +743,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaRealmRydnrInfrastructure_version(
-            self.latest_PythonedaRealmRydnrInfrastructure_version()
-        )
+        return self.latest("pythoneda-realm-rydnr-infrastructure")
 
-    @abc.abstractmethod
     def latest_PythonedaRealmRydnrInfrastructure_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-realm-rydnr/infrastructure.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-realm-rydnr-infrastructure")
 
-    @abc.abstractmethod
     def find_PythonedaRealmRydnrInfrastructure_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-realm-rydnr/infrastructure
@@ -705,7 +761,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-realm-rydnr-infrastructure", version)
 
     def latest_PythonedaRealmRydnrRealm(self) -> NixFlake:
         """
@@ -713,20 +769,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaRealmRydnrRealm_version(
-            self.latest_PythonedaRealmRydnrRealm_version()
-        )
+        return self.latest("pythoneda-realm-rydnr-realm")
 
-    @abc.abstractmethod
     def latest_PythonedaRealmRydnrRealm_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-realm-rydnr/realm.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-realm-rydnr-realm")
 
-    @abc.abstractmethod
     def find_PythonedaRealmRydnrRealm_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-realm-rydnr/realm
@@ -735,7 +787,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-realm-rydnr-realm", version)
 
     def latest_PythonedaSharedArtifactChangesEvents(self) -> NixFlake:
         """
@@ -743,20 +795,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedArtifactChangesEvents_version(
-            self.latest_PythonedaSharedArtifactChangesEvents_version()
-        )
+        return self.latest("pythoneda-shared-artifact-changes-events")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedArtifactChangesEvents_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-artifact-changes/events.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-artifact-changes-events")
 
-    @abc.abstractmethod
     def find_PythonedaSharedArtifactChangesEvents_version(
         self, version: str
     ) -> NixFlake:
@@ -767,7 +815,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-artifact-changes-events", version)
 
     def latest_PythonedaSharedArtifactChangesEventsInfrastructure(self) -> NixFlake:
         """
@@ -775,20 +823,18 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedArtifactChangesEventsInfrastructure_version(
-            self.latest_PythonedaSharedArtifactChangesEventsInfrastructure_version()
-        )
+        return self.latest("pythoneda-shared-artifact-changes-events-infrastructure")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedArtifactChangesEventsInfrastructure_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-artifact-changes/events-infrastructure.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version(
+            "pythoneda-shared-artifact-changes-events-infrastructure"
+        )
 
-    @abc.abstractmethod
     def find_PythonedaSharedArtifactChangesEventsInfrastructure_version(
         self, version: str
     ) -> NixFlake:
@@ -799,7 +845,9 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find(
+            "pythoneda-shared-artifact-changes-events-infrastructure", version
+        )
 
     def latest_PythonedaSharedArtifactChangesShared(self) -> NixFlake:
         """
@@ -807,20 +855,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedArtifactChangesShared_version(
-            self.latest_PythonedaSharedArtifactChangesShared_version()
-        )
+        return self.latest("pythoneda-shared-artifact-changes-shared")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedArtifactChangesShared_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-artifact-changes/shared.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-artifact-changes-shared")
 
-    @abc.abstractmethod
     def find_PythonedaSharedArtifactChangesShared_version(
         self, version: str
     ) -> NixFlake:
@@ -831,7 +875,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-artifact-changes-shared", version)
 
     def latest_PythonedaSharedCodeRequestsEvents(self) -> NixFlake:
         """
@@ -839,20 +883,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedCodeRequestsEvents_version(
-            self.latest_PythonedaSharedCodeRequestsEvents_version()
-        )
+        return self.latest("pythoneda-shared-code-requests-events")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedCodeRequestsEvents_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-code-requests/events.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-code-requests-events")
 
-    @abc.abstractmethod
     def find_PythonedaSharedCodeRequestsEvents_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-shared-code-requests/events.
@@ -861,7 +901,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-code-requests-events", version)
 
     def latest_PythonedaSharedCodeRequestsEventsInfrastructure(self) -> NixFlake:
         """
@@ -869,20 +909,18 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedCodeRequestsEventsInfrastructure_version(
-            self.latest_PythonedaSharedCodeRequestsEventsInfrastructure_version()
-        )
+        return self.latest("pythoneda-shared-code-requests-events-infrastructure")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedCodeRequestsEventsInfrastructure_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-code-requests/events-infrastructure.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version(
+            "pythoneda-shared-code-requests-events-infrastructure"
+        )
 
-    @abc.abstractmethod
     def find_PythonedaSharedCodeRequestsEventsInfrastructure_version(
         self, version: str
     ) -> NixFlake:
@@ -893,7 +931,9 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find(
+            "pythoneda-shared-code-requests-events-infrastructure", version
+        )
 
     def latest_PythonedaSharedCodeRequestsJupyterlab(self) -> NixFlake:
         """
@@ -901,20 +941,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedCodeRequestsJupyterlab_version(
-            self.latest_PythonedaSharedCodeRequestsJupyterlab_version()
-        )
+        return self.latest("pythoneda-shared-code-requests-jupyterlab")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedCodeRequestsJupyterlab_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-code-requests/jupyterlab.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-code-requests-jupyterlab")
 
-    @abc.abstractmethod
     def find_PythonedaSharedCodeRequestsJupyterlab_version(
         self, version: str
     ) -> NixFlake:
@@ -925,7 +961,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-code-requests-jupyterlab", version)
 
     def latest_PythonedaSharedCodeRequestsShared(self) -> NixFlake:
         """
@@ -933,20 +969,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedCodeRequestsShared_version(
-            self.latest_PythonedaSharedCodeRequestsShared_version()
-        )
+        return self.latest("pythoneda-shared-code-requests-shared")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedCodeRequestsShared_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-code-requests/shared.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-code-requests-shared")
 
-    @abc.abstractmethod
     def find_PythonedaSharedCodeRequestsShared_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-shared-code-requests/shared.
@@ -955,7 +987,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-code-requests-shared", version)
 
     def latest_PythonedaSharedGitShared(self) -> NixFlake:
         """
@@ -963,20 +995,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedGitShared_version(
-            self.latest_PythonedaSharedGitShared_version()
-        )
+        return self.latest("pythoneda-shared-git-shared")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedGitShared_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-git/shared.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-git-shared")
 
-    @abc.abstractmethod
     def find_PythonedaSharedGitShared_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-shared-git/shared.
@@ -985,7 +1013,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-git-shared", version)
 
     def latest_PythonedaSharedNixFlakeShared(self) -> NixFlake:
         """
@@ -993,20 +1021,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedGitShared_version(
-            self.latest_PythonedaSharedGitShared_version()
-        )
+        return self.latest("pythoneda-shared-nix-flake-shared")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedNixFlakeShared_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-nix-flake/shared.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-nix-flake-shared")
 
-    @abc.abstractmethod
     def find_PythonedaSharedNixFlakeShared_version(self, version: str) -> NixFlake:
         """
         Retrieves a specific version of the Nix flake for pythoneda-shared-nix-flake/shared.
@@ -1015,7 +1039,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-nix-flake-shared", version)
 
     def latest_PythonedaSharedPythonedaApplication(self) -> NixFlake:
         """
@@ -1023,20 +1047,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedPythonedaApplication_version(
-            self.latest_PythonedaSharedPythonedaApplication_version()
-        )
+        return self.latest("pythoneda-shared-pythoneda-application")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedPythonedaApplication_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-pythoneda/application.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-pythoneda-application")
 
-    @abc.abstractmethod
     def find_PythonedaSharedPythonedaApplication_version(
         self, version: str
     ) -> NixFlake:
@@ -1047,7 +1067,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-pythoneda-application", version)
 
     def latest_PythonedaSharedPythonedaBanner(
         self,
@@ -1057,20 +1077,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.artifact.nix.flake.PythonedaSharedPythonedaBannerNixFlake
         """
-        return self.find_PythonedaSharedPythonedaBanner_version(
-            self.latest_PythonedaSharedPythonedaBanner_version()
-        )
+        return self.latest("pythoneda-shared-pythoneda-banner")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedPythonedaBanner_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for PythonEDA banner.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-pythoneda-banner")
 
-    @abc.abstractmethod
     def find_PythonedaSharedPythonedaBanner_version(
         self, version: str
     ) -> PythonedaSharedPythonedaBannerNixFlake:
@@ -1081,7 +1097,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.PythonedaSharedPythonedaBannerNixFlake
         """
-        pass
+        return self.find("pythoneda-shared-pythoneda-banner", version)
 
     def latest_PythonedaSharedPythonedaDomain(
         self,
@@ -1091,20 +1107,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.artifact.nix.flake.PythonedaSharedPythonedaDomainNixFlake
         """
-        return self.find_PythonedaSharedPythonedaDomain_version(
-            self.latest_PythonedaSharedPythonedaDomain_version()
-        )
+        return self.latest("pythoneda-shared-pythoneda-domain")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedPythonedaDomain_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for PythonEDA domain.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-pythoneda-domain")
 
-    @abc.abstractmethod
     def find_PythonedaSharedPythonedaDomain_version(
         self, version: str
     ) -> PythonedaSharedPythonedaDomainNixFlake:
@@ -1115,7 +1127,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.PythonedaSharedPythonedaDomainNixFlake
         """
-        pass
+        return self.find("pythoneda-shared-pythoneda-domain", version)
 
     def latest_PythonedaSharedPythonedaInfrastructure(self) -> NixFlake:
         """
@@ -1123,20 +1135,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_PythonedaSharedPythonedaInfrastructure_version(
-            self.latest_PythonedaSharedPythonedaInfrastructure_version()
-        )
+        return self.latest("pythoneda-shared-pythoneda-infrastructure")
 
-    @abc.abstractmethod
     def latest_PythonedaSharedPythonedaInfrastructure_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for pythoneda-shared-pythoneda/infrastructure.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("pythoneda-shared-pythoneda-infrastructure")
 
-    @abc.abstractmethod
     def find_PythonedaSharedPythonedaInfrastructure_version(
         self, version: str
     ) -> NixFlake:
@@ -1147,7 +1155,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        pass
+        return self.find("pythoneda-shared-pythoneda-infrastructure", version)
 
     def latest_Requests(self) -> NixFlake:
         """
@@ -1155,18 +1163,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such version.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Requests_version(self.latest_Requests_version())
+        return self.latest("requests")
 
-    @abc.abstractmethod
     def latest_Requests_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for requests.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("requests")
 
-    @abc.abstractmethod
     def find_Requests_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for requests.
@@ -1175,7 +1181,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("requests", version)
 
     def latest_Semver(self) -> NixFlake:
         """
@@ -1183,18 +1189,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Semver_version(self.latest_Semver_version())
+        return self.latest("semver")
 
-    @abc.abstractmethod
     def latest_Semver_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for semver.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("semver")
 
-    @abc.abstractmethod
     def find_Semver_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for semver.
@@ -1203,7 +1207,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("semver", version)
 
     def latest_Stringtemplate3(self) -> NixFlake:
         """
@@ -1211,18 +1215,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Stringtemplate3_version(self.latest_Stringtemplate3_version())
+        return self.latest("stringtemplate3")
 
-    @abc.abstractmethod
     def latest_Stringtemplate3_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for stringtemplate3.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("stringtemplate3")
 
-    @abc.abstractmethod
     def find_Stringtemplate3_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for stringtemplate3.
@@ -1231,7 +1233,7 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("stringtemplate3", version)
 
     def latest_Unidiff(self) -> NixFlake:
         """
@@ -1239,18 +1241,16 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
-        return self.find_Unidiff_version(self.latest_Unidiff_version())
+        return self.latest("unidiff")
 
-    @abc.abstractmethod
     def latest_Unidiff_version(self) -> str:
         """
         Retrieves the version of the latest Nix flake for unidiff.
         :return: Such version.
         :rtype: str
         """
-        pass
+        return self.latest_version("unidiff")
 
-    @abc.abstractmethod
     def find_Unidiff_version(self, version: str) -> NixFlake:
         """
         Retrieves the latest version of the nix flake for unidiff.
@@ -1259,17 +1259,189 @@ class NixFlakeRepo(Repo, abc.ABC):
         :return: Such flake, or None if not found.
         :rtype: pythoneda.artifact.nix.flake.NixFlake
         """
-        pass
+        return self.find("unidiff", version)
 
-    @abc.abstractmethod
     def resolve(self, spec: NixFlakeSpec) -> NixFlake:
         """
         Resolves given specification.
+        Versions of registered packages given as ranges, such as ">=0.0.3,<0.1" or
+        "latest", resolve to the highest compatible version, via find_compatible().
+        Any other specification is resolved via resolve_exact().
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        name = getattr(spec, "name", None)
+        version = getattr(spec, "version", None)
+        if NixFlakeRegistry.get(name) is not None and NixFlakeVersionRange.is_range(
+            version
+        ):
+            return self.find_compatible(name, version or "")
+        return self.resolve_exact(spec)
+
+    @abc.abstractmethod
+    def resolve_exact(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification, whose version is not a range.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
         :return: A compatible Nix flake, or None if none found.
         :rtype: pythoneda.shared.nix.flake.NixFlake
         """
         pass
 
+    def resolve_many(self, specs: List, failures: List = None) -> List:
+        """
+        Resolves given specifications.
+        Adapters able to answer several specifications with a single backend query
+        should override this method. By default, each specification is resolved
+        concurrently via resolve(), as set up by configure_resolution().
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param failures: If given, the list receiving the specifications whose
+        resolution failed or timed out, so callers can tell them apart from those
+        without a compatible flake.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return self.resolve_concurrently(specs, self._resolution_timeout, failures)
+
+    def configure_resolution(self, maxConcurrency: int = 8, timeout: float = None):
+        """
+        Configures how resolve_many() resolves specifications by default.
+        The resolutions run in a single thread pool of maxConcurrency workers, shared
+        by every call. Reconfiguring replaces such pool; the previous one finishes
+        its pending resolutions and then releases its threads.
+        :param maxConcurrency: The maximum number of concurrent resolutions.
+        :type maxConcurrency: int
+        :param timeout: The maximum time, in seconds, to wait for each resolution,
+        or None to wait indefinitely.
+        :type timeout: float
+        """
+        if maxConcurrency < 1:
+            raise ValueError("maxConcurrency must be positive")
+        executor = ThreadPoolExecutor(
+            max_workers=maxConcurrency,
+            thread_name_prefix=f"{self.__class__.__name__}-resolve",
+        )
+        with self._executor_lock:
+            previous = self._executor
+            self._executor = executor
+            self._max_concurrency = maxConcurrency
+            self._resolution_timeout = timeout
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+    def resolution_executor(self) -> ThreadPoolExecutor:
+        """
+        Retrieves the thread pool running the resolutions of resolve_many(),
+        creating it as set up by configure_resolution() if needed.
+        :return: Such pool.
+        :rtype: concurrent.futures.ThreadPoolExecutor
+        """
+        with self._executor_lock:
+            result = self._executor
+        if result is None:
+            self.configure_resolution(self._max_concurrency, self._resolution_timeout)
+            with self._executor_lock:
+                result = self._executor
+        return result
+
+    def resolve_concurrently(
+        self, specs: List, timeout: float = None, failures: List = None
+    ) -> List:
+        """
+        Resolves given specifications via resolve(), concurrently, in the pool
+        returned by resolution_executor().
+        At most maxConcurrency resolutions run at the same time; the rest wait for a
+        free worker, so the i-th specification is given until
+        (i // maxConcurrency + 1) * timeout seconds since the call started.
+        Resolutions not finished by then, or failing, count as unresolved.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param timeout: The maximum time, in seconds, to wait for each resolution,
+        or None to wait indefinitely.
+        :type timeout: float
+        :param failures: If given, the list receiving the specifications whose
+        resolution failed or timed out.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved in time.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        specs = list(specs)
+        if not specs:
+            return []
+        if len(specs) < 2 and timeout is None:
+            return [self._resolve_or_none(spec, failures) for spec in specs]
+        executor = self.resolution_executor()
+        max_concurrency = self._max_concurrency
+        futures = [executor.submit(self.resolve, spec) for spec in specs]
+        started = time.monotonic()
+        result = []
+        for position, (spec, future) in enumerate(zip(specs, futures)):
+            remaining = None
+            if timeout is not None:
+                remaining = max(
+                    0.0,
+                    started
+                    + (position // max_concurrency + 1) * timeout
+                    - time.monotonic(),
+                )
+            try:
+                result.append(future.result(timeout=remaining))
+            except FuturesTimeoutError:
+                future.cancel()
+                NixFlakeRepo.logger().warning(
+                    f"Timed out resolving {self.__class__.describe_spec(spec)}"
+                )
+                if failures is not None:
+                    failures.append(spec)
+                result.append(None)
+            except Exception as error:
+                NixFlakeRepo.logger().error(
+                    f"Could not resolve {self.__class__.describe_spec(spec)}: {error}"
+                )
+                if failures is not None:
+                    failures.append(spec)
+                result.append(None)
+        return result
+
+    def _resolve_or_none(self, spec: NixFlakeSpec, failures: List = None) -> NixFlake:
+        """
+        Resolves given specification, logging any error.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param failures: If given, the list receiving the specification if its
+        resolution fails.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: A compatible Nix flake, or None if none found or the resolution failed.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        try:
+            return self.resolve(spec)
+        except Exception as error:
+            NixFlakeRepo.logger().error(
+                f"Could not resolve {self.__class__.describe_spec(spec)}: {error}"
+            )
+            if failures is not None:
+                failures.append(spec)
+            return None
+
+    @classmethod
+    def describe_spec(cls, spec: NixFlakeSpec) -> str:
+        """
+        Describes given specification, for logging purposes.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: Its name and version.
+        :rtype: str
+        """
+        return f"{getattr(spec, 'name', spec)}-{getattr(spec, 'version', '')}"
+
     def find_by_id(self, idValue: str) -> NixFlake:
         """
         Retrieves a flake by its id.
@@ -0,0 +1,283 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_repo_decorator.py
+
+This file defines the NixFlakeRepoDecorator class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_repo import NixFlakeRepo
+from pythoneda.shared.code_requests import CodeExecutionNixFlake, CodeRequest
+from pythoneda.shared.code_requests.jupyterlab import JupyterlabCodeRequestNixFlake
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Callable, List, Tuple
+
+
+class NixFlakeRepoDecorator(NixFlakeRepo):
+    """
+    A NixFlakeRepo that forwards every operation to another NixFlakeRepo.
+
+    Class name: NixFlakeRepoDecorator
+
+    Responsibilities:
+        - Delegates all lookups to the wrapped repository.
+        - Provides hooks for subclasses to intercept version, flake and spec lookups.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    def __init__(self, delegate: NixFlakeRepo):
+        """
+        Creates a new NixFlakeRepoDecorator instance.
+        :param delegate: The decorated repository.
+        :type delegate: pythoneda.artifact.nix.flake.NixFlakeRepo
+        """
+        super().__init__()
+        self._delegate = delegate
+
+    @property
+    def delegate(self) -> NixFlakeRepo:
+        """
+        Retrieves the decorated repository.
+        :return: Such repository.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeRepo
+        """
+        return self._delegate
+
+    @classmethod
+    def spec_key(cls, spec: NixFlakeSpec) -> Tuple:
+        """
+        Builds a hashable key for given specification.
+        Specifications wrapping another one, such as NixFlakeSpecForExecution,
+        take their name, version and url from the wrapped one.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: The key, made of the spec type, name, version and url.
+        :rtype: Tuple
+        """
+        fields = cls._spec_fields(spec)
+        wrapped = spec
+        while fields == (None, None, None):
+            inner = getattr(wrapped, "spec", None)
+            if inner is None:
+                inner = getattr(wrapped, "_spec", None)
+            if inner is None or inner is wrapped:
+                raise ValueError(
+                    f"Cannot identify {type(spec).__name__} without name, version "
+                    "or url"
+                )
+            wrapped = inner
+            fields = cls._spec_fields(wrapped)
+        return (type(spec).__name__,) + fields
+
+    @classmethod
+    def _spec_fields(cls, spec: NixFlakeSpec) -> Tuple:
+        """
+        Retrieves the name, version and url of given specification.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: Such fields, None for the missing ones.
+        :rtype: Tuple
+        """
+        return (
+            getattr(spec, "name", None),
+            getattr(spec, "version", None),
+            getattr(spec, "url", None),
+        )
+
+    def lookup_latest_version(self, package: str, retrieve: Callable[[], str]) -> str:
+        """
+        Retrieves the latest version of given package.
+        :param package: The package.
+        :type package: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], str]
+        :return: Such version.
+        :rtype: str
+        """
+        return retrieve()
+
+    def lookup_version(
+        self, package: str, version: str, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return retrieve()
+
+    def lookup_spec(
+        self, spec: NixFlakeSpec, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Resolves given specification.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return retrieve()
+
+    def lookup_specs(
+        self, specs: List, retrieve: Callable[[List], List], failures: List
+    ) -> List:
+        """
+        Resolves given specifications.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param retrieve: The function querying the decorated repository, given the
+        list receiving the specifications whose resolution fails.
+        :type retrieve: Callable[[List], List[pythoneda.shared.nix.flake.NixFlake]]
+        :param failures: The list receiving the specifications whose resolution
+        failed or timed out, as opposed to those without a compatible flake.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        return retrieve(failures)
+
+    def latest_code_execution(self, codeRequest: CodeRequest) -> CodeExecutionNixFlake:
+        """
+        Retrieves the latest version of the nix flake for executing code.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.CodeExecutionNixFlake
+        """
+        return self._delegate.latest_code_execution(codeRequest)
+
+    def latest_Jupyterlab_for_code_requests(
+        self, codeRequest: CodeRequest
+    ) -> JupyterlabCodeRequestNixFlake:
+        """
+        Retrieves the latest version of the nix flake for Jupyterlab.
+        :param codeRequest: The code request.
+        :type codeRequest: pythoneda.shared.code_requests.CodeRequest
+        :return: Such flake.
+        :rtype: pythoneda.shared.code_requests.jupyter.JupyterlabCodeRequestNixFlake
+        """
+        return self._delegate.latest_Jupyterlab_for_code_requests(codeRequest)
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the version of the latest Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :return: Such version, or None if the package is unknown.
+        :rtype: str
+        """
+        return self.lookup_latest_version(
+            name, lambda: self._delegate.latest_version(name)
+        )
+
+    def find(self, name: str, version: str) -> NixFlake:
+        """
+        Retrieves a specific version of the Nix flake of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self.lookup_version(
+            name, version, lambda: self._delegate.find(name, version)
+        )
+
+    def resolve(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self.lookup_spec(spec, lambda: self._delegate.resolve(spec))
+
+    def resolve_exact(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification, whose version is not a range.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self.lookup_spec(spec, lambda: self._delegate.resolve_exact(spec))
+
+    def resolve_many(self, specs: List, failures: List = None) -> List:
+        """
+        Resolves given specifications.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param failures: If given, the list receiving the specifications whose
+        resolution failed or timed out.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        specs = list(specs)
+        if failures is None:
+            failures = []
+        return self.lookup_specs(
+            specs, lambda sink: self._delegate.resolve_many(specs, sink), failures
+        )
+
+    def configure_resolution(self, maxConcurrency: int = 8, timeout: float = None):
+        """
+        Configures how resolve_many() resolves specifications by default, both in
+        this repository and in the decorated one.
+        :param maxConcurrency: The maximum number of concurrent resolutions.
+        :type maxConcurrency: int
+        :param timeout: The maximum time, in seconds, to wait for each resolution,
+        or None to wait indefinitely.
+        :type timeout: float
+        """
+        super().configure_resolution(maxConcurrency, timeout)
+        self._delegate.configure_resolution(maxConcurrency, timeout)
+
+    def versions(self, name: str, newerThan: str = None) -> List[str]:
+        """
+        Retrieves the available versions of given package.
+        :param name: The flake name, as registered in NixFlakeRegistry.
+        :type name: str
+        :param newerThan: If provided, only versions newer than this one are retrieved.
+        :type newerThan: str
+        :return: Such versions.
+        :rtype: List[str]
+        """
+        return self._delegate.versions(name, newerThan)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
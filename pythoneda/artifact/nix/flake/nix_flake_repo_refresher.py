@@ -0,0 +1,178 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_repo_refresher.py
+
+This file defines the NixFlakeRepoRefresher class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .caching_nix_flake_repo import CachingNixFlakeRepo
+from concurrent.futures import ThreadPoolExecutor
+from .nix_flake_registry import NixFlakeRegistry
+from pythoneda import BaseObject
+import random
+import threading
+from typing import Dict, List
+
+
+class NixFlakeRepoRefresher(BaseObject):
+    """
+    Keeps the cache of a CachingNixFlakeRepo warm, in the background.
+
+    Class name: NixFlakeRepoRefresher
+
+    Responsibilities:
+        - Periodically refreshes the latest version and flake of every known package.
+        - Limits how many packages are refreshed at the same time.
+        - Spreads refreshes over time with random jitter.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.CachingNixFlakeRepo
+        - pythoneda.artifact.nix.flake.NixFlakeRegistry
+    """
+
+    def __init__(
+        self,
+        repo: CachingNixFlakeRepo,
+        interval: float = 60.0,
+        maxConcurrency: int = 4,
+        jitter: float = 0.1,
+        packages: List[str] = None,
+    ):
+        """
+        Creates a new NixFlakeRepoRefresher instance.
+        :param repo: The caching repository.
+        :type repo: pythoneda.artifact.nix.flake.CachingNixFlakeRepo
+        :param interval: The average time between refreshes, in seconds.
+        :type interval: float
+        :param maxConcurrency: The maximum number of packages refreshed at the same time.
+        :type maxConcurrency: int
+        :param jitter: The maximum relative deviation of each interval, between 0 and 1.
+        :type jitter: float
+        :param packages: The flake names to refresh, or None for all registered ones.
+        :type packages: List[str]
+        """
+        super().__init__()
+        if maxConcurrency < 1:
+            raise ValueError("maxConcurrency must be positive")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self._repo = repo
+        self._interval = interval
+        self._max_concurrency = maxConcurrency
+        self._jitter = jitter
+        self._packages = packages
+        self._stop = None
+        self._thread = None
+        ttl = repo.cache.ttl
+        if ttl is not None and interval * (1 + jitter) >= ttl:
+            NixFlakeRepoRefresher.logger().warning(
+                f"Refreshing every {interval}s (+/- {jitter:.0%}) does not keep entries "
+                f"with a TTL of {ttl}s warm"
+            )
+
+    @property
+    def packages(self) -> List[str]:
+        """
+        Retrieves the flake names to refresh.
+        :return: Such names.
+        :rtype: List[str]
+        """
+        if self._packages is None:
+            return NixFlakeRegistry.names()
+        return list(self._packages)
+
+    @property
+    def running(self) -> bool:
+        """
+        Checks whether the background thread is running.
+        :return: True in such case.
+        :rtype: bool
+        """
+        return self._thread is not None
+
+    def _refresh(self, package: str) -> str:
+        """
+        Refreshes given package, logging any error.
+        :param package: The flake name.
+        :type package: str
+        :return: Its latest version, or None if it could not be refreshed.
+        :rtype: str
+        """
+        try:
+            return self._repo.refresh(package)
+        except Exception as error:
+            NixFlakeRepoRefresher.logger().error(
+                f"Cannot refresh {package}: {error}"
+            )
+            return None
+
+    def refresh_all(self) -> Dict[str, str]:
+        """
+        Refreshes all packages once.
+        :return: A dictionary mapping each flake name to its latest version.
+        :rtype: Dict[str, str]
+        """
+        packages = self.packages
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            return dict(zip(packages, executor.map(self._refresh, packages)))
+
+    def next_interval(self) -> float:
+        """
+        Computes the time to wait before the next refresh.
+        :return: Such time, in seconds.
+        :rtype: float
+        """
+        return self._interval * (1 + random.uniform(-self._jitter, self._jitter))
+
+    def start(self):
+        """
+        Starts refreshing in a background thread.
+        The first refresh happens right away.
+        """
+        self.stop()
+        stop = threading.Event()
+
+        def run():
+            while not stop.is_set():
+                self.refresh_all()
+                stop.wait(self.next_interval())
+
+        self._stop = stop
+        self._thread = threading.Thread(
+            target=run, name="NixFlakeRepoRefresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread, if running.
+        """
+        if self._stop is not None:
+            self._stop.set()
+            self._thread.join()
+            self._stop = None
+            self._thread = None
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
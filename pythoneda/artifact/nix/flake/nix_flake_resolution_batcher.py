@@ -0,0 +1,153 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_resolution_batcher.py
+
+This file defines the NixFlakeResolutionBatcher class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Awaitable, Callable, List
+
+
+class NixFlakeResolutionBatcher:
+    """
+    Groups the resolutions requested within a short window into a single batch.
+
+    Class name: NixFlakeResolutionBatcher
+
+    Responsibilities:
+        - Collects specifications until the batch is full or its window elapses.
+        - Resolves each distinct specification of the batch once, in a single call.
+        - Hands each caller the flake for its own specification.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepoDecorator
+    """
+
+    def __init__(
+        self,
+        resolveMany: Callable[[List], Awaitable[List]],
+        maxBatchSize: int = 64,
+        maxDelay: float = 0.005,
+    ):
+        """
+        Creates a new NixFlakeResolutionBatcher instance.
+        :param resolveMany: The coroutine function resolving a list of specifications.
+        :type resolveMany: Callable[[List], Awaitable[List]]
+        :param maxBatchSize: The number of pending resolutions that triggers a batch.
+        :type maxBatchSize: int
+        :param maxDelay: The maximum time, in seconds, a resolution waits for its batch.
+        :type maxDelay: float
+        """
+        super().__init__()
+        if maxBatchSize < 1:
+            raise ValueError("maxBatchSize must be positive")
+        self._resolve_many = resolveMany
+        self._max_batch_size = maxBatchSize
+        self._max_delay = maxDelay
+        self._loop = None
+        self._pending = []
+        self._timer = None
+        self._batches = set()
+
+    @property
+    def pending(self) -> int:
+        """
+        Retrieves the number of resolutions waiting for their batch.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._pending)
+
+    async def resolve(self, spec: NixFlakeSpec) -> NixFlake:
+        """
+        Resolves given specification as part of the next batch.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+        future = loop.create_future()
+        self._pending.append((spec, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        """
+        Starts resolving the pending specifications as a batch.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._pending
+        self._pending = []
+        if batch:
+            task = self._loop.create_task(self._resolve_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _resolve_batch(self, batch: List):
+        """
+        Resolves a batch, once per distinct specification. If anything fails, every
+        caller still waiting gets the error.
+        :param batch: The (specification, future) pairs.
+        :type batch: List[Tuple[pythoneda.shared.nix.flake.NixFlakeSpec, asyncio.Future]]
+        """
+        try:
+            keys = [NixFlakeRepoDecorator.spec_key(spec) for spec, _ in batch]
+            positions = {}
+            specs = []
+            for key, (spec, _) in zip(keys, batch):
+                if key not in positions:
+                    positions[key] = len(specs)
+                    specs.append(spec)
+            flakes = list(await self._resolve_many(specs))
+            if len(flakes) != len(specs):
+                raise ValueError(
+                    f"Expected {len(specs)} resolutions, but got {len(flakes)}"
+                )
+            for key, (_, future) in zip(keys, batch):
+                if not future.done():
+                    future.set_result(flakes[positions[key]])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
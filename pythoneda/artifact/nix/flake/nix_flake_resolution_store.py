@@ -0,0 +1,283 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_resolution_store.py
+
+This file defines the NixFlakeResolutionStore class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import json
+from pythoneda import BaseObject
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+
+class NixFlakeResolutionStore(BaseObject):
+    """
+    A SQLite file remembering resolved Nix flakes across restarts.
+
+    Class name: NixFlakeResolutionStore
+
+    Responsibilities:
+        - Persists lookup results as JSON, together with a format version and a
+          checksum.
+        - Loads every valid entry at once, discarding outdated or corrupt ones.
+        - Keeps at most a number of entries, discarding the oldest ones.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeCatalog
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, path: str, maxEntries: int = 4096):
+        """
+        Creates a new NixFlakeResolutionStore instance.
+        :param path: The path of the SQLite file.
+        :type path: str
+        :param maxEntries: The maximum number of entries kept.
+        :type maxEntries: int
+        """
+        super().__init__()
+        self._path = path
+        self._max_entries = maxEntries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS resolutions ("
+                "key TEXT PRIMARY KEY, "
+                "format_version INTEGER NOT NULL, "
+                "payload BLOB NOT NULL, "
+                "checksum TEXT NOT NULL, "
+                "stored_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS resolutions_stored_at "
+                "ON resolutions (stored_at)"
+            )
+            self._prune()
+
+    @property
+    def path(self) -> str:
+        """
+        Retrieves the path of the SQLite file.
+        :return: Such path.
+        :rtype: str
+        """
+        return self._path
+
+    @classmethod
+    def encode_key(cls, key: Tuple) -> str:
+        """
+        Encodes given key as text.
+        :param key: The key.
+        :type key: Tuple
+        :return: The encoded key.
+        :rtype: str
+        """
+        return json.dumps(list(key))
+
+    @classmethod
+    def decode_key(cls, text: str) -> Tuple:
+        """
+        Decodes given text as a key.
+        :param text: The encoded key.
+        :type text: str
+        :return: The key.
+        :rtype: Tuple
+        """
+        return tuple(json.loads(text))
+
+    @property
+    def max_entries(self) -> int:
+        """
+        Retrieves the maximum number of entries kept.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._max_entries
+
+    @classmethod
+    def encode_value(cls, value: Any) -> bytes:
+        """
+        Serializes a lookup result: a version, or a flake described as in
+        NixFlakeCatalog.encode_flakes(), inputs included.
+        :param value: The value.
+        :type value: Any
+        :return: The JSON payload.
+        :rtype: bytes
+        """
+        from .nix_flake_catalog import NixFlakeCatalog
+
+        if isinstance(value, str):
+            document = {"version": value}
+        else:
+            document = {"flakes": NixFlakeCatalog.encode_flakes([value])}
+        return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def decode_value(cls, payload: bytes) -> Any:
+        """
+        Deserializes a lookup result written by encode_value().
+        :param payload: The JSON payload.
+        :type payload: bytes
+        :return: The value.
+        :rtype: Any
+        """
+        from .nix_flake_catalog import NixFlakeCatalog
+
+        document = json.loads(bytes(payload).decode("utf-8"))
+        if "version" in document:
+            return document["version"]
+        entries = document["flakes"]
+        return NixFlakeCatalog.decode_flakes(entries)[
+            NixFlakeCatalog.entry_key(entries[0])
+        ]
+
+    @classmethod
+    def checksum(cls, key: str, formatVersion: int, payload: bytes) -> str:
+        """
+        Computes the checksum of an entry.
+        :param key: The encoded key.
+        :type key: str
+        :param formatVersion: The format version.
+        :type formatVersion: int
+        :param payload: The serialized value.
+        :type payload: bytes
+        :return: The checksum.
+        :rtype: str
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{formatVersion}:{key}:".encode("utf-8"))
+        digest.update(payload)
+        return digest.hexdigest()
+
+    def save(self, key: Tuple, value: Any):
+        """
+        Persists given value, discarding the oldest entries beyond the maximum.
+        :param key: The key.
+        :type key: Tuple
+        :param value: The value: a version, or a flake.
+        :type value: Any
+        """
+        encoded_key = self.__class__.encode_key(key)
+        payload = self.__class__.encode_value(value)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?, ?)",
+                (
+                    encoded_key,
+                    self.__class__.FORMAT_VERSION,
+                    payload,
+                    self.__class__.checksum(
+                        encoded_key, self.__class__.FORMAT_VERSION, payload
+                    ),
+                    time.time(),
+                ),
+            )
+            self._prune()
+
+    def _prune(self):
+        """
+        Discards the oldest entries beyond the maximum. Callers hold the lock.
+        """
+        self._connection.execute(
+            "DELETE FROM resolutions WHERE key IN (SELECT key FROM resolutions "
+            "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
+
+    def load(self) -> Dict[Tuple, Tuple[Any, float]]:
+        """
+        Loads all valid entries, oldest first.
+        Entries written with another format version, or whose checksum does not
+        match, are discarded.
+        :return: A dictionary mapping each key to its value and storage time.
+        :rtype: Dict[Tuple, Tuple[Any, float]]
+        """
+        result = {}
+        invalid = []
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, format_version, payload, checksum, stored_at "
+                "FROM resolutions ORDER BY stored_at"
+            ).fetchall()
+        for key, format_version, payload, checksum, stored_at in rows:
+            if format_version != self.__class__.FORMAT_VERSION or checksum != (
+                self.__class__.checksum(key, format_version, payload)
+            ):
+                invalid.append(key)
+                continue
+            try:
+                result[self.__class__.decode_key(key)] = (
+                    self.__class__.decode_value(payload),
+                    stored_at,
+                )
+            except Exception as error:
+                NixFlakeResolutionStore.logger().warning(
+                    f"Discarding unreadable entry {key}: {error}"
+                )
+                invalid.append(key)
+        if invalid:
+            NixFlakeResolutionStore.logger().warning(
+                f"Discarding {len(invalid)} invalid entries from {self._path}"
+            )
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "DELETE FROM resolutions WHERE key = ?",
+                    [(key,) for key in invalid],
+                )
+        return result
+
+    def delete(self, key: Tuple):
+        """
+        Removes given entry.
+        :param key: The key.
+        :type key: Tuple
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM resolutions WHERE key = ?",
+                (self.__class__.encode_key(key),),
+            )
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM resolutions")
+
+    def close(self):
+        """
+        Closes the underlying SQLite connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,192 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_version.py
+
+This file defines the NixFlakeVersion class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import functools
+import re
+from typing import Tuple
+
+
+@functools.total_ordering
+class NixFlakeVersion:
+    """
+    A semver-aware, comparable flake version.
+
+    Class name: NixFlakeVersion
+
+    Responsibilities:
+        - Parses version strings such as "0.0.3", "v1.2" or "1.0.0-rc.1".
+        - Orders versions according to semantic versioning precedence.
+
+    Collaborators:
+        - None
+    """
+
+    __slots__ = ("_text", "_release", "_prerelease")
+
+    _pattern = re.compile(
+        r"v?(?P<release>\d+(?:\.\d+)*)"
+        r"(?:-(?P<prerelease>[0-9A-Za-z.-]+))?"
+        r"(?:\+[0-9A-Za-z.-]+)?"
+    )
+
+    def __init__(self, text: str):
+        """
+        Creates a new NixFlakeVersion instance.
+        :param text: The version.
+        :type text: str
+        """
+        super().__init__()
+        match = self.__class__._pattern.fullmatch(text.strip())
+        if match is None:
+            raise ValueError(f"Invalid version: {text}")
+        release = [int(part) for part in match.group("release").split(".")]
+        while len(release) > 1 and release[-1] == 0:
+            release.pop()
+        self._text = text
+        self._release = tuple(release)
+        prerelease = match.group("prerelease")
+        self._prerelease = (
+            None
+            if prerelease is None
+            else tuple(
+                (0, int(part), "") if part.isdigit() else (1, 0, part)
+                for part in prerelease.split(".")
+            )
+        )
+
+    @classmethod
+    def parse(cls, text: str):
+        """
+        Parses given version, if valid.
+        :param text: The version.
+        :type text: str
+        :return: The parsed version, or None if invalid.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeVersion
+        """
+        try:
+            return cls(text)
+        except (AttributeError, ValueError):
+            return None
+
+    @property
+    def text(self) -> str:
+        """
+        Retrieves the original version string.
+        :return: Such string.
+        :rtype: str
+        """
+        return self._text
+
+    @property
+    def release(self) -> Tuple[int, ...]:
+        """
+        Retrieves the numeric release components, without trailing zeros.
+        :return: Such components.
+        :rtype: Tuple[int, ...]
+        """
+        return self._release
+
+    @property
+    def written_release(self) -> Tuple[int, ...]:
+        """
+        Retrieves the numeric release components as written, trailing zeros included.
+        :return: Such components.
+        :rtype: Tuple[int, ...]
+        """
+        match = self.__class__._pattern.fullmatch(self._text.strip())
+        return tuple(int(part) for part in match.group("release").split("."))
+
+    @property
+    def is_prerelease(self) -> bool:
+        """
+        Checks whether this is a pre-release version.
+        :return: True in such case.
+        :rtype: bool
+        """
+        return self._prerelease is not None
+
+    def _key(self) -> Tuple:
+        """
+        Retrieves the key used for comparisons.
+        :return: Such key.
+        :rtype: Tuple
+        """
+        if self._prerelease is None:
+            return (self._release, 1, ())
+        return (self._release, 0, self._prerelease)
+
+    def __eq__(self, other) -> bool:
+        """
+        Checks whether given version has the same precedence.
+        :param other: The other version.
+        :type other: pythoneda.artifact.nix.flake.NixFlakeVersion
+        :return: True in such case.
+        :rtype: bool
+        """
+        if not isinstance(other, NixFlakeVersion):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __lt__(self, other) -> bool:
+        """
+        Checks whether this version precedes given one.
+        :param other: The other version.
+        :type other: pythoneda.artifact.nix.flake.NixFlakeVersion
+        :return: True in such case.
+        :rtype: bool
+        """
+        if not isinstance(other, NixFlakeVersion):
+            return NotImplemented
+        return self._key() < other._key()
+
+    def __hash__(self) -> int:
+        """
+        Retrieves the hash of this version.
+        :return: Such hash.
+        :rtype: int
+        """
+        return hash(self._key())
+
+    def __str__(self) -> str:
+        """
+        Retrieves the original version string.
+        :return: Such string.
+        :rtype: str
+        """
+        return self._text
+
+    def __repr__(self) -> str:
+        """
+        Provides a representation of this instance.
+        :return: Such representation.
+        :rtype: str
+        """
+        return f"NixFlakeVersion({self._text!r})"
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,208 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_version_index.py
+
+This file defines the NixFlakeVersionIndex class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import bisect
+from .nix_flake_version import NixFlakeVersion
+from .nix_flake_version_range import NixFlakeVersionRange
+import threading
+from typing import Iterable, List, Tuple
+
+
+class NixFlakeVersionIndex:
+    """
+    A sorted index of the known versions of each flake.
+
+    Class name: NixFlakeVersionIndex
+
+    Responsibilities:
+        - Keeps the versions of each flake sorted by semver precedence.
+        - Answers range queries, and picks the highest compatible version, via bisection.
+        - Refreshes incrementally, fetching only versions newer than the highest indexed one.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeVersion
+        - pythoneda.artifact.nix.flake.NixFlakeVersionRange
+    """
+
+    def __init__(self):
+        """
+        Creates a new NixFlakeVersionIndex instance.
+        """
+        super().__init__()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, versions: Iterable[str]) -> int:
+        """
+        Indexes given versions of a flake.
+        Invalid or already known versions are ignored. Versions with the same
+        precedence but written differently, such as "1.0" and "1.0.0", are all kept,
+        sorted by their text.
+        :param name: The flake name.
+        :type name: str
+        :param versions: The versions.
+        :type versions: Iterable[str]
+        :return: The number of newly indexed versions.
+        :rtype: int
+        """
+        result = 0
+        with self._lock:
+            known = self._versions.setdefault(name, [])
+            for text in versions:
+                version = NixFlakeVersion.parse(text)
+                if version is None:
+                    continue
+                position = bisect.bisect_left(known, version)
+                while (
+                    position < len(known)
+                    and known[position] == version
+                    and known[position].text < version.text
+                ):
+                    position += 1
+                if (
+                    position < len(known)
+                    and known[position] == version
+                    and known[position].text == version.text
+                ):
+                    continue
+                known.insert(position, version)
+                result += 1
+        return result
+
+    def versions(self, name: str) -> List[str]:
+        """
+        Retrieves the indexed versions of a flake, in ascending order.
+        :param name: The flake name.
+        :type name: str
+        :return: Such versions.
+        :rtype: List[str]
+        """
+        return [version.text for version in self._versions.get(name, [])]
+
+    def highest(self, name: str) -> str:
+        """
+        Retrieves the highest indexed version of a flake.
+        :param name: The flake name.
+        :type name: str
+        :return: Such version, or None if none is indexed.
+        :rtype: str
+        """
+        known = self._versions.get(name, [])
+        if not known:
+            return None
+        return known[-1].text
+
+    def _bounds(
+        self, known: List[NixFlakeVersion], versionRange: NixFlakeVersionRange
+    ) -> Tuple[int, int]:
+        """
+        Finds the slice of given sorted versions delimited by the range bounds.
+        :param known: The sorted versions.
+        :type known: List[pythoneda.artifact.nix.flake.NixFlakeVersion]
+        :param versionRange: The range.
+        :type versionRange: pythoneda.artifact.nix.flake.NixFlakeVersionRange
+        :return: The start and end positions.
+        :rtype: Tuple[int, int]
+        """
+        lower, lower_inclusive = versionRange.lower
+        upper, upper_inclusive = versionRange.upper
+        start = 0
+        if lower is not None:
+            start = (bisect.bisect_left if lower_inclusive else bisect.bisect_right)(
+                known, lower
+            )
+        end = len(known)
+        if upper is not None:
+            end = (bisect.bisect_right if upper_inclusive else bisect.bisect_left)(
+                known, upper
+            )
+        return start, end
+
+    def matching(self, name: str, constraint: str) -> List[str]:
+        """
+        Retrieves the indexed versions of a flake satisfying given constraint.
+        :param name: The flake name.
+        :type name: str
+        :param constraint: The constraint, such as ">=0.0.3,<0.1".
+        :type constraint: str
+        :return: The matching versions, in ascending order.
+        :rtype: List[str]
+        """
+        version_range = NixFlakeVersionRange(constraint)
+        known = self._versions.get(name, [])
+        start, end = self._bounds(known, version_range)
+        return [
+            version.text
+            for version in known[start:end]
+            if version_range.contains(version)
+        ]
+
+    def highest_compatible(self, name: str, constraint: str) -> str:
+        """
+        Retrieves the highest indexed version of a flake satisfying given constraint.
+        :param name: The flake name.
+        :type name: str
+        :param constraint: The constraint, such as ">=0.0.3,<0.1".
+        :type constraint: str
+        :return: Such version, or None if none matches.
+        :rtype: str
+        """
+        version_range = NixFlakeVersionRange(constraint)
+        known = self._versions.get(name, [])
+        start, end = self._bounds(known, version_range)
+        for position in range(end - 1, start - 1, -1):
+            if version_range.contains(known[position]):
+                return known[position].text
+        return None
+
+    def refresh(self, repo, name: str) -> int:
+        """
+        Indexes the versions of a flake newer than the highest one already indexed.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param name: The flake name.
+        :type name: str
+        :return: The number of newly indexed versions.
+        :rtype: int
+        """
+        return self.add(name, repo.versions(name, self.highest(name)))
+
+    def clear(self, name: str = None):
+        """
+        Forgets the versions of given flake, or of all of them.
+        :param name: The flake name, or None to forget everything.
+        :type name: str
+        """
+        with self._lock:
+            if name is None:
+                self._versions.clear()
+            else:
+                self._versions.pop(name, None)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
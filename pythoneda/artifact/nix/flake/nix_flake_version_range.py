@@ -0,0 +1,277 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_version_range.py
+
+This file defines the NixFlakeVersionRange class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_version import NixFlakeVersion
+import operator
+import re
+from typing import List, Tuple
+
+
+class NixFlakeVersionRange:
+    """
+    A set of constraints on flake versions, such as ">=0.0.3,<0.1".
+
+    Class name: NixFlakeVersionRange
+
+    Responsibilities:
+        - Parses comma-separated constraints using >=, >, <=, <, ==, !=, ^ and ~,
+          on full versions or partial ones such as "1.2" or "0.0.x".
+        - Checks whether a version satisfies all constraints.
+        - Exposes its lower and upper bounds, to narrow down sorted searches.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeVersion
+    """
+
+    _operators = {
+        ">=": operator.ge,
+        ">": operator.gt,
+        "<=": operator.le,
+        "<": operator.lt,
+        "==": operator.eq,
+        "=": operator.eq,
+        "!=": operator.ne,
+    }
+
+    _clause = re.compile(r"(?P<operator>>=|<=|==|!=|>|<|=|\^|~)?\s*(?P<version>\S+)")
+
+    _wildcards = ("", "*", "latest")
+
+    _partial = re.compile(r"v?(?:(?P<release>\d+(?:\.\d+)*)\.)?[xX*](?:\.[xX*])*")
+
+    def __init__(self, text: str):
+        """
+        Creates a new NixFlakeVersionRange instance.
+        :param text: The constraints, separated by commas.
+        :type text: str
+        """
+        super().__init__()
+        self._text = text
+        self._constraints = []
+        for clause in (text or "").split(","):
+            clause = clause.strip()
+            if clause in self.__class__._wildcards:
+                continue
+            match = self.__class__._clause.fullmatch(clause)
+            if match is None:
+                raise ValueError(f"Invalid version constraint: {clause}")
+            operator_symbol = match.group("operator") or "=="
+            partial = self.__class__._partial.fullmatch(match.group("version"))
+            if partial is None:
+                self._constraints.extend(
+                    self.__class__._expand(
+                        operator_symbol, NixFlakeVersion(match.group("version"))
+                    )
+                )
+            else:
+                release = (partial.group("release") or "").split(".")
+                self._constraints.extend(
+                    self.__class__._expand_partial(
+                        operator_symbol, [int(part) for part in release if part], clause
+                    )
+                )
+        self._allows_prereleases = any(
+            version.is_prerelease for _, version in self._constraints
+        )
+
+    @classmethod
+    def is_range(cls, text: str) -> bool:
+        """
+        Checks whether given text is a range rather than a single, exact version.
+        :param text: The text.
+        :type text: str
+        :return: True in such case.
+        :rtype: bool
+        """
+        if text is None or text.strip() in cls._wildcards:
+            return True
+        return re.search(r"[<>=!^~*,]|(?:^v?|\.)[xX](?:\.|$)", text.strip()) is not None
+
+    @classmethod
+    def _expand(
+        cls, operatorSymbol: str, version: NixFlakeVersion
+    ) -> List[Tuple[str, NixFlakeVersion]]:
+        """
+        Translates a constraint into basic comparisons.
+        :param operatorSymbol: The operator.
+        :type operatorSymbol: str
+        :param version: The version.
+        :type version: pythoneda.artifact.nix.flake.NixFlakeVersion
+        :return: The comparisons.
+        :rtype: List[Tuple[str, pythoneda.artifact.nix.flake.NixFlakeVersion]]
+        """
+        if operatorSymbol == "=":
+            operatorSymbol = "=="
+        if operatorSymbol not in ("^", "~"):
+            return [(operatorSymbol, version)]
+        release = list(version.written_release)
+        if operatorSymbol == "~":
+            index = min(1, len(release) - 1)
+        else:
+            index = next(
+                (position for position, part in enumerate(release) if part != 0),
+                len(release) - 1,
+            )
+        upper = release[:index] + [release[index] + 1]
+        return [
+            (">=", version),
+            ("<", NixFlakeVersion(".".join(str(part) for part in upper))),
+        ]
+
+    @classmethod
+    def _expand_partial(
+        cls, operatorSymbol: str, release: List[int], clause: str
+    ) -> List[Tuple[str, NixFlakeVersion]]:
+        """
+        Translates a constraint on a partial version, such as "^0.0.x", into basic
+        comparisons. The missing components match any value.
+        :param operatorSymbol: The operator.
+        :type operatorSymbol: str
+        :param release: The given components of the version.
+        :type release: List[int]
+        :param clause: The constraint, for error messages.
+        :type clause: str
+        :return: The comparisons.
+        :rtype: List[Tuple[str, pythoneda.artifact.nix.flake.NixFlakeVersion]]
+        """
+        if operatorSymbol == "!=":
+            raise ValueError(f"Invalid version constraint: {clause}")
+        if not release:
+            if operatorSymbol in ("<", ">"):
+                raise ValueError(f"Invalid version constraint: {clause}")
+            return []
+        lower = NixFlakeVersion(".".join(str(part) for part in release))
+        if operatorSymbol == "^":
+            index = next(
+                (position for position, part in enumerate(release) if part != 0),
+                len(release) - 1,
+            )
+        elif operatorSymbol == "~":
+            index = min(1, len(release) - 1)
+        else:
+            index = len(release) - 1
+        upper = NixFlakeVersion(
+            ".".join(str(part) for part in release[:index] + [release[index] + 1])
+        )
+        if operatorSymbol == ">=":
+            return [(">=", lower)]
+        if operatorSymbol == ">":
+            return [(">=", upper)]
+        if operatorSymbol == "<":
+            return [("<", lower)]
+        if operatorSymbol == "<=":
+            return [("<", upper)]
+        return [(">=", lower), ("<", upper)]
+
+    @property
+    def text(self) -> str:
+        """
+        Retrieves the original constraints.
+        :return: Such text.
+        :rtype: str
+        """
+        return self._text
+
+    @property
+    def lower(self) -> Tuple[NixFlakeVersion, bool]:
+        """
+        Retrieves the lower bound.
+        :return: A tuple (version, inclusive), or (None, True) if unbounded.
+        :rtype: Tuple[pythoneda.artifact.nix.flake.NixFlakeVersion, bool]
+        """
+        result = (None, True)
+        for symbol, version in self._constraints:
+            if symbol in (">=", ">", "=="):
+                inclusive = symbol != ">"
+                if (
+                    result[0] is None
+                    or version > result[0]
+                    or (version == result[0] and not inclusive)
+                ):
+                    result = (version, inclusive)
+        return result
+
+    @property
+    def upper(self) -> Tuple[NixFlakeVersion, bool]:
+        """
+        Retrieves the upper bound.
+        :return: A tuple (version, inclusive), or (None, True) if unbounded.
+        :rtype: Tuple[pythoneda.artifact.nix.flake.NixFlakeVersion, bool]
+        """
+        result = (None, True)
+        for symbol, version in self._constraints:
+            if symbol in ("<=", "<", "=="):
+                inclusive = symbol != "<"
+                if (
+                    result[0] is None
+                    or version < result[0]
+                    or (version == result[0] and not inclusive)
+                ):
+                    result = (version, inclusive)
+        return result
+
+    def contains(self, version: NixFlakeVersion) -> bool:
+        """
+        Checks whether given version satisfies all constraints.
+        Pre-releases only match if some constraint mentions a pre-release.
+        :param version: The version.
+        :type version: pythoneda.artifact.nix.flake.NixFlakeVersion
+        :return: True in such case.
+        :rtype: bool
+        """
+        if version.is_prerelease and not self._allows_prereleases:
+            return False
+        return all(
+            self.__class__._operators[symbol](version, bound)
+            for symbol, bound in self._constraints
+        )
+
+    def __contains__(self, version) -> bool:
+        """
+        Checks whether given version, or version string, satisfies all constraints.
+        :param version: The version.
+        :type version: pythoneda.artifact.nix.flake.NixFlakeVersion
+        :return: True in such case.
+        :rtype: bool
+        """
+        if not isinstance(version, NixFlakeVersion):
+            version = NixFlakeVersion.parse(version)
+            if version is None:
+                return False
+        return self.contains(version)
+
+    def __repr__(self) -> str:
+        """
+        Provides a representation of this instance.
+        :return: Such representation.
+        :rtype: str
+        """
+        return f"NixFlakeVersionRange({self._text!r})"
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
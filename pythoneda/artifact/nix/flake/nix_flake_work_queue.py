@@ -0,0 +1,221 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/nix_flake_work_queue.py
+
+This file defines the NixFlakeWorkQueue class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+from .nix_flake_metrics import NixFlakeMetrics
+import time
+from typing import Any, Awaitable, Callable
+
+
+class NixFlakeWorkQueue:
+    """
+    A bounded queue, served by a fixed number of workers, for asynchronous work.
+
+    Class name: NixFlakeWorkQueue
+
+    Responsibilities:
+        - Limits how many submitted coroutines run at once.
+        - Limits how many wait, either making submitters wait or rejecting new work.
+        - Records its depth, wait times and rejected work.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeMetrics
+    """
+
+    BLOCK = "block"
+    SHED = "shed"
+
+    def __init__(
+        self,
+        name: str = "default",
+        maxSize: int = 256,
+        workers: int = 8,
+        policy: str = BLOCK,
+        metrics: NixFlakeMetrics = None,
+    ):
+        """
+        Creates a new NixFlakeWorkQueue instance.
+        :param name: The queue name, used to label its metrics.
+        :type name: str
+        :param maxSize: The maximum number of queued items.
+        :type maxSize: int
+        :param workers: The number of items processed at once.
+        :type workers: int
+        :param policy: What to do when the queue is full: NixFlakeWorkQueue.BLOCK waits
+        for room, and NixFlakeWorkQueue.SHED rejects the item with asyncio.QueueFull.
+        :type policy: str
+        :param metrics: The metrics, or None to use the shared instance.
+        :type metrics: pythoneda.artifact.nix.flake.NixFlakeMetrics
+        """
+        super().__init__()
+        if maxSize < 1:
+            raise ValueError("maxSize must be positive")
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if policy not in (self.__class__.BLOCK, self.__class__.SHED):
+            raise ValueError(f"Unknown policy {policy}")
+        self._name = name
+        self._max_size = maxSize
+        self._worker_count = workers
+        self._policy = policy
+        self._metrics = metrics or NixFlakeMetrics.instance()
+        self._loop = None
+        self._queue = None
+        self._workers = []
+
+    @property
+    def name(self) -> str:
+        """
+        Retrieves the queue name.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._name
+
+    @property
+    def policy(self) -> str:
+        """
+        Retrieves the policy applied when the queue is full.
+        :return: Such policy.
+        :rtype: str
+        """
+        return self._policy
+
+    @property
+    def depth(self) -> int:
+        """
+        Retrieves the number of queued items.
+        :return: Such number.
+        :rtype: int
+        """
+        if self._queue is None:
+            return 0
+        return self._queue.qsize()
+
+    def _start(self):
+        """
+        Creates the queue and its workers on the running event loop, if not done yet.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(self._max_size)
+            self._workers = [
+                loop.create_task(self._work()) for _ in range(self._worker_count)
+            ]
+
+    async def submit(self, function: Callable[..., Awaitable], *args) -> Any:
+        """
+        Queues a coroutine function, and waits for its result.
+        :param function: The coroutine function.
+        :type function: Callable[..., Awaitable]
+        :param args: Its arguments.
+        :type args: List
+        :return: Its result.
+        :rtype: Any
+        """
+        self._start()
+        future = self._loop.create_future()
+        item = (time.perf_counter(), future, function, args)
+        if self._policy == self.__class__.SHED:
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self._metrics.record_queue_shed(self._name)
+                raise
+        else:
+            await self._queue.put(item)
+        self._metrics.record_queue_depth(self._name, self._queue.qsize())
+        return await future
+
+    async def _work(self):
+        """
+        Processes queued items, one at a time, forever.
+        """
+        while True:
+            queued_at, future, function, args = await self._queue.get()
+            try:
+                self._metrics.record_queue_wait(
+                    self._name, time.perf_counter() - queued_at
+                )
+                self._metrics.record_queue_depth(self._name, self._queue.qsize())
+                if future.cancelled():
+                    continue
+                try:
+                    result = await function(*args)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as error:
+                    if not future.done():
+                        # Keep this worker out of the traceback: clearing its
+                        # frames would finalize this coroutine.
+                        future.set_exception(
+                            error.with_traceback(error.__traceback__.tb_next)
+                        )
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    async def close(self, drain: bool = False):
+        """
+        Stops the workers. Items still queued are cancelled, unless drained first.
+        :param drain: Whether to wait for the queued items to be processed.
+        :type drain: bool
+        """
+        if drain and self._queue is not None:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()[1].cancel()
+        self._loop = None
+        self._queue = None
+        self._workers = []
+
+    def close_later(self, drain: bool = True):
+        """
+        Schedules close() on the event loop serving this queue, from any thread.
+        :param drain: Whether to process the queued items before stopping.
+        :type drain: bool
+        :return: The future of the scheduled close, or None if the queue was not
+        serving any running event loop.
+        :rtype: concurrent.futures.Future
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            return None
+        return asyncio.run_coroutine_threadsafe(self.close(drain), loop)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,278 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/persistent_nix_flake_repo.py
+
+This file defines the PersistentNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from .nix_flake_resolution_store import NixFlakeResolutionStore
+from .nix_flake_version_range import NixFlakeVersionRange
+from collections import OrderedDict
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+import threading
+import time
+from typing import Any, Callable, List, Tuple
+
+
+class PersistentNixFlakeRepo(NixFlakeRepoDecorator):
+    """
+    A NixFlakeRepo remembering what it learns across restarts.
+
+    Class name: PersistentNixFlakeRepo
+
+    Responsibilities:
+        - Loads previously resolved flakes and versions at startup.
+        - Answers known specs and package versions without querying the decorated repository.
+        - Writes every new lookup result through to the store.
+        - Keeps at most a number of entries in memory, evicting the least recently
+          used ones.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepoDecorator
+        - pythoneda.artifact.nix.flake.NixFlakeResolutionStore
+    """
+
+    def __init__(
+        self,
+        delegate: NixFlakeRepo,
+        store: NixFlakeResolutionStore,
+        latestVersionTtl: float = 3600.0,
+        maxEntries: int = 4096,
+    ):
+        """
+        Creates a new PersistentNixFlakeRepo instance.
+        :param delegate: The decorated repository.
+        :type delegate: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param store: The persistent store.
+        :type store: pythoneda.artifact.nix.flake.NixFlakeResolutionStore
+        :param latestVersionTtl: How long, in seconds, a persisted latest version,
+        or resolution of a version range, is trusted. None means forever.
+        :type latestVersionTtl: float
+        :param maxEntries: The maximum number of entries kept in memory.
+        :type maxEntries: int
+        """
+        super().__init__(delegate)
+        self._store = store
+        self._latest_version_ttl = latestVersionTtl
+        self._max_entries = maxEntries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        for key, entry in store.load().items():
+            self._entries[key] = entry
+            self._evict()
+
+    @property
+    def store(self) -> NixFlakeResolutionStore:
+        """
+        Retrieves the persistent store.
+        :return: Such store.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeResolutionStore
+        """
+        return self._store
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of known entries.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def _lookup(
+        self, key: Tuple, retrieve: Callable[[], Any], ttl: float = None
+    ) -> Any:
+        """
+        Retrieves the value for given key, from memory if possible, or from the
+        decorated repository otherwise.
+        :param key: The key.
+        :type key: Tuple
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], Any]
+        :param ttl: How long, in seconds, the value can be trusted, if limited.
+        :type ttl: float
+        :return: The value.
+        :rtype: Any
+        """
+        found, result = self._cached(key, ttl)
+        if found:
+            return result
+        result = retrieve()
+        if result is not None:
+            self._remember(key, result)
+        return result
+
+    def _remember(self, key: Tuple, value: Any):
+        """
+        Keeps given value in memory and writes it through to the store.
+        :param key: The key.
+        :type key: Tuple
+        :param value: The value.
+        :type value: Any
+        """
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            self._evict()
+        self._store.save(key, value)
+
+    def _evict(self):
+        """
+        Evicts the least recently used entries beyond the maximum. Evicted entries
+        stay in the store, which is bounded on its own.
+        """
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _cached(self, key: Tuple, ttl: float = None) -> Tuple[bool, Any]:
+        """
+        Retrieves the value for given key, from memory.
+        :param key: The key.
+        :type key: Tuple
+        :param ttl: How long, in seconds, the value can be trusted, if limited.
+        :type ttl: float
+        :return: A tuple (found, value), where found is False if the value is
+        unknown or expired.
+        :rtype: Tuple[bool, Any]
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                value, stored_at = entry
+                if ttl is None or time.time() - stored_at < ttl:
+                    self._entries.move_to_end(key)
+                    return (True, value)
+        return (False, None)
+
+    def _spec_ttl(self, spec: NixFlakeSpec) -> float:
+        """
+        Retrieves how long the resolution of given specification can be trusted.
+        Exact versions always resolve to the same flake, but ranges follow the
+        latest version.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :return: The latest version TTL for ranges, None otherwise.
+        :rtype: float
+        """
+        if NixFlakeVersionRange.is_range(self.__class__.spec_key(spec)[2]):
+            return self._latest_version_ttl
+        return None
+
+    def lookup_latest_version(self, package: str, retrieve: Callable[[], str]) -> str:
+        """
+        Retrieves the latest version of given package, from the store if still valid.
+        :param package: The package.
+        :type package: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], str]
+        :return: Such version.
+        :rtype: str
+        """
+        return self._lookup(("latest", package), retrieve, self._latest_version_ttl)
+
+    def lookup_version(
+        self, package: str, version: str, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package, from the store if possible.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self._lookup(("find", package, version), retrieve)
+
+    def lookup_spec(
+        self, spec: NixFlakeSpec, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Resolves given specification, from the store if possible. Resolutions of
+        version ranges expire as latest versions do.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self._lookup(
+            ("resolve",) + self.__class__.spec_key(spec),
+            retrieve,
+            self._spec_ttl(spec),
+        )
+
+    def lookup_specs(
+        self, specs: List, retrieve: Callable[[List], List], failures: List
+    ) -> List:
+        """
+        Resolves given specifications, querying the decorated repository only for
+        the unknown or expired ones.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param retrieve: The function querying the decorated repository, given the
+        list receiving the specifications whose resolution fails.
+        :type retrieve: Callable[[List], List[pythoneda.shared.nix.flake.NixFlake]]
+        :param failures: The list receiving the specifications whose resolution
+        failed or timed out, as opposed to those without a compatible flake.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        keys = [("resolve",) + self.__class__.spec_key(spec) for spec in specs]
+        result = [
+            self._cached(key, self._spec_ttl(spec))[1] for key, spec in zip(keys, specs)
+        ]
+        missing = [index for index, flake in enumerate(result) if flake is None]
+        if missing:
+            resolved = self._delegate.resolve_many(
+                [specs[index] for index in missing], failures
+            )
+            for index, flake in zip(missing, resolved):
+                result[index] = flake
+                if flake is not None:
+                    self._remember(keys[index], flake)
+        return result
+
+    def forget(self, key: Tuple = None):
+        """
+        Forgets given entry, or all of them.
+        :param key: The key, or None to forget everything.
+        :type key: Tuple
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._store.clear()
+            else:
+                self._entries.pop(key, None)
+                self._store.delete(key)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
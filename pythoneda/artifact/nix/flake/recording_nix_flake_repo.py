@@ -0,0 +1,150 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/recording_nix_flake_repo.py
+
+This file defines the RecordingNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_lockfile import NixFlakeLockfile
+from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from typing import Callable, List
+
+
+class RecordingNixFlakeRepo(NixFlakeRepoDecorator):
+    """
+    A NixFlakeRepo recording every lookup of another one into a lockfile.
+
+    Class name: RecordingNixFlakeRepo
+
+    Responsibilities:
+        - Pins the latest versions it retrieves.
+        - Remembers the flakes it finds, and what each specification resolved to.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepoDecorator
+        - pythoneda.artifact.nix.flake.NixFlakeLockfile
+    """
+
+    def __init__(self, delegate: NixFlakeRepo, lockfile: NixFlakeLockfile = None):
+        """
+        Creates a new RecordingNixFlakeRepo instance.
+        :param delegate: The decorated repository.
+        :type delegate: pythoneda.artifact.nix.flake.NixFlakeRepo
+        :param lockfile: The lockfile to record into, or None to start a new one.
+        :type lockfile: pythoneda.artifact.nix.flake.NixFlakeLockfile
+        """
+        super().__init__(delegate)
+        self._lockfile = lockfile if lockfile is not None else NixFlakeLockfile()
+
+    @property
+    def lockfile(self) -> NixFlakeLockfile:
+        """
+        Retrieves the lockfile.
+        :return: Such lockfile.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeLockfile
+        """
+        return self._lockfile
+
+    def lookup_latest_version(self, package: str, retrieve: Callable[[], str]) -> str:
+        """
+        Retrieves the latest version of given package, and pins it.
+        :param package: The package.
+        :type package: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], str]
+        :return: Such version.
+        :rtype: str
+        """
+        result = retrieve()
+        if result is not None:
+            self._lockfile.set_latest(package, result)
+        return result
+
+    def lookup_version(
+        self, package: str, version: str, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package, and records it.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        result = retrieve()
+        if result is not None:
+            self._lockfile.add(result)
+        return result
+
+    def lookup_spec(
+        self, spec: NixFlakeSpec, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Resolves given specification, and records the resolution.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        result = retrieve()
+        self._lockfile.record(spec, result)
+        return result
+
+    def lookup_specs(
+        self, specs: List, retrieve: Callable[[List], List], failures: List
+    ) -> List:
+        """
+        Resolves given specifications, and records their resolutions, except for
+        those that failed or timed out.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param retrieve: The function querying the decorated repository, given the
+        list receiving the specifications whose resolution fails.
+        :type retrieve: Callable[[List], List[pythoneda.shared.nix.flake.NixFlake]]
+        :param failures: The list receiving the specifications whose resolution
+        failed or timed out, as opposed to those without a compatible flake.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        failed = []
+        result = retrieve(failed)
+        failures.extend(failed)
+        failed = {self.__class__.spec_key(spec) for spec in failed}
+        for spec, flake in zip(specs, result):
+            if flake is not None or self.__class__.spec_key(spec) not in failed:
+                self._lockfile.record(spec, flake)
+        return result
+
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,96 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/single_flight.py
+
+This file defines the SingleFlight class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from concurrent.futures import Future
+import threading
+from typing import Any, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing the same key.
+
+    Class name: SingleFlight
+
+    Responsibilities:
+        - Runs a single call per key at a time.
+        - Hands the outcome of that call to every concurrent caller with the same key.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self):
+        """
+        Creates a new SingleFlight instance.
+        """
+        super().__init__()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Retrieves the number of calls currently running.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._in_flight)
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Runs given function, unless a call with the same key is already running,
+        in which case its outcome is awaited and shared.
+        :param key: The key.
+        :type key: Hashable
+        :param function: The function.
+        :type function: Callable[[], Any]
+        :return: The function result.
+        :rtype: Any
+        """
+        with self._lock:
+            future = self._in_flight.get(key, None)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = function()
+            future.set_result(result)
+            return result
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
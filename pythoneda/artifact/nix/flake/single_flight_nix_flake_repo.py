@@ -0,0 +1,144 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/single_flight_nix_flake_repo.py
+
+This file defines the SingleFlightNixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_repo import NixFlakeRepo
+from .nix_flake_repo_decorator import NixFlakeRepoDecorator
+from pythoneda.shared.nix.flake import NixFlake, NixFlakeSpec
+from .single_flight import SingleFlight
+from typing import Callable, List
+
+
+class SingleFlightNixFlakeRepo(NixFlakeRepoDecorator):
+    """
+    A NixFlakeRepo that shares in-flight lookups among concurrent callers.
+
+    Class name: SingleFlightNixFlakeRepo
+
+    Responsibilities:
+        - Performs at most one concurrent lookup per spec, package or version.
+        - Hands the result of each lookup to every caller waiting for it.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepoDecorator
+        - pythoneda.artifact.nix.flake.SingleFlight
+    """
+
+    def __init__(self, delegate: NixFlakeRepo):
+        """
+        Creates a new SingleFlightNixFlakeRepo instance.
+        :param delegate: The decorated repository.
+        :type delegate: pythoneda.artifact.nix.flake.NixFlakeRepo
+        """
+        super().__init__(delegate)
+        self._single_flight = SingleFlight()
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Retrieves the number of lookups currently running.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._single_flight.in_flight
+
+    def lookup_latest_version(self, package: str, retrieve: Callable[[], str]) -> str:
+        """
+        Retrieves the latest version of given package, joining any running lookup.
+        :param package: The package.
+        :type package: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], str]
+        :return: Such version.
+        :rtype: str
+        """
+        return self._single_flight.do(("latest", package), retrieve)
+
+    def lookup_version(
+        self, package: str, version: str, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package, joining any running lookup.
+        :param package: The package.
+        :type package: str
+        :param version: The version.
+        :type version: str
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: Such flake, or None if not found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self._single_flight.do(("find", package, version), retrieve)
+
+    def lookup_spec(
+        self, spec: NixFlakeSpec, retrieve: Callable[[], NixFlake]
+    ) -> NixFlake:
+        """
+        Resolves given specification, joining any running resolution.
+        :param spec: The specification.
+        :type spec: pythoneda.shared.nix.flake.NixFlakeSpec
+        :param retrieve: The function querying the decorated repository.
+        :type retrieve: Callable[[], pythoneda.shared.nix.flake.NixFlake]
+        :return: A compatible Nix flake, or None if none found.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        return self._single_flight.do(
+            ("resolve",) + self.__class__.spec_key(spec), retrieve
+        )
+
+    def lookup_specs(
+        self, specs: List, retrieve: Callable[[List], List], failures: List
+    ) -> List:
+        """
+        Resolves given specifications, joining any running identical batch, whose
+        failures are then reported to every caller.
+        :param specs: The specifications.
+        :type specs: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :param retrieve: The function querying the decorated repository, given the
+        list receiving the specifications whose resolution fails.
+        :type retrieve: Callable[[List], List[pythoneda.shared.nix.flake.NixFlake]]
+        :param failures: The list receiving the specifications whose resolution
+        failed or timed out, as opposed to those without a compatible flake.
+        :type failures: List[pythoneda.shared.nix.flake.NixFlakeSpec]
+        :return: The compatible Nix flakes, in the same order as the specifications,
+        with None for those that could not be resolved.
+        :rtype: List[pythoneda.shared.nix.flake.NixFlake]
+        """
+        key = ("resolve_many",) + tuple(
+            self.__class__.spec_key(spec) for spec in specs
+        )
+
+        def run():
+            collected = []
+            return tuple(retrieve(collected)), tuple(collected)
+
+        result, failed = self._single_flight.do(key, run)
+        failures.extend(failed)
+        return list(result)
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
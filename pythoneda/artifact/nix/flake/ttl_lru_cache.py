@@ -0,0 +1,204 @@
+# vim: set fileencoding=utf-8
+"""
+pythoneda/artifact/nix/flake/ttl_lru_cache.py
+
+This file defines the TtlLruCache class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Callable, Hashable, Tuple
+
+
+class TtlLruCache:
+    """
+    A thread-safe, size-bounded cache whose entries expire after a while.
+
+    Class name: TtlLruCache
+
+    Responsibilities:
+        - Stores values under hashable keys.
+        - Expires entries once their time-to-live has elapsed.
+        - Evicts the least recently used entry when full.
+
+    Collaborators:
+        - None
+    """
+
+    _MISSING = object()
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        maxEntries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Creates a new TtlLruCache instance.
+        :param ttl: The time-to-live of each entry, in seconds. None means no expiration.
+        :type ttl: float
+        :param maxEntries: The maximum number of entries.
+        :type maxEntries: int
+        :param clock: The clock used to check expiration.
+        :type clock: Callable[[], float]
+        """
+        super().__init__()
+        if maxEntries < 1:
+            raise ValueError("maxEntries must be positive")
+        self._ttl = ttl
+        self._max_entries = maxEntries
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        """
+        Retrieves the time-to-live of the entries.
+        :return: Such time, in seconds.
+        :rtype: float
+        """
+        return self._ttl
+
+    @property
+    def max_entries(self) -> int:
+        """
+        Retrieves the maximum number of entries.
+        :return: Such limit.
+        :rtype: int
+        """
+        return self._max_entries
+
+    def __len__(self) -> int:
+        """
+        Retrieves the number of entries, including expired ones not yet purged.
+        :return: Such number.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Looks up given key.
+        :param key: The key.
+        :type key: Hashable
+        :return: A tuple (found, value).
+        :rtype: Tuple[bool, Any]
+        """
+        with self._lock:
+            entry = self._entries.get(key, self.__class__._MISSING)
+            if entry is self.__class__._MISSING:
+                return False, None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieves the value stored under given key.
+        :param key: The key.
+        :type key: Hashable
+        :param default: The value to return if the key is missing or expired.
+        :type default: Any
+        :return: The value, or the default.
+        :rtype: Any
+        """
+        found, value = self.lookup(key)
+        if found:
+            return value
+        return default
+
+    def put(self, key: Hashable, value: Any, ttl: float = None):
+        """
+        Stores a value.
+        :param key: The key.
+        :type key: Hashable
+        :param value: The value.
+        :type value: Any
+        :param ttl: A specific time-to-live for this entry, if any.
+        :type ttl: float
+        """
+        if ttl is None:
+            ttl = self._ttl
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Removes given key.
+        :param key: The key.
+        :type key: Hashable
+        :return: True if the key was present.
+        :rtype: bool
+        """
+        with self._lock:
+            return self._entries.pop(key, self.__class__._MISSING) is not (
+                self.__class__._MISSING
+            )
+
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Removes all keys matching given predicate.
+        :param predicate: The predicate.
+        :type predicate: Callable[[Hashable], bool]
+        :return: The number of removed entries.
+        :rtype: int
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def items(self):
+        """
+        Retrieves a snapshot of the non-expired entries.
+        :return: The (key, value) pairs.
+        :rtype: List[Tuple[Hashable, Any]]
+        """
+        now = self._clock()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (expires_at, value) in self._entries.items()
+                if expires_at is None or expires_at > now
+            ]
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,163 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_caching_nix_flake_repo.py
+
+This file tests the CachingNixFlakeRepoTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import CachingNixFlakeRepo
+import unittest
+
+
+class CountingRepo:
+    """
+    A stand-in repository counting the lookups it answers.
+
+    Class name: CountingRepo
+
+    Responsibilities:
+        - Answers version and flake lookups from a dictionary of latest versions.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, latest: dict):
+        """
+        Creates a new CountingRepo instance.
+        :param latest: The latest version of each package.
+        :type latest: dict
+        """
+        self.latest = latest
+        self.lookups = []
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the latest version of given package.
+        :param name: The package.
+        :type name: str
+        :return: Such version, or None if unknown.
+        :rtype: str
+        """
+        self.lookups.append(("latest", name))
+        return self.latest.get(name, None)
+
+    def find(self, name: str, version: str) -> str:
+        """
+        Retrieves a stand-in for the flake of given package and version.
+        :param name: The package.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: The stand-in, or None if the package is unknown.
+        :rtype: str
+        """
+        self.lookups.append(("find", name, version))
+        if name not in self.latest:
+            return None
+        return f"{name}-{version}"
+
+
+class CachingNixFlakeRepoTest(unittest.TestCase):
+    """
+    Tests CachingNixFlakeRepo.
+
+    Class name: CachingNixFlakeRepoTest
+
+    Responsibilities:
+        - Checks lookups are remembered, refreshed and invalidated.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.CachingNixFlakeRepo
+    """
+
+    def test_lookups_are_remembered(self):
+        """
+        Checks repeated lookups reach the decorated repository once.
+        """
+        delegate = CountingRepo({"nixos": "23.05"})
+        repo = CachingNixFlakeRepo(delegate)
+        for _ in range(2):
+            self.assertEqual("nixos-23.05", repo.latest("nixos"))
+            self.assertEqual("nixos-1.0", repo.find_Nixos_version("1.0"))
+        self.assertEqual(
+            [("latest", "nixos"), ("find", "nixos", "23.05"), ("find", "nixos", "1.0")],
+            delegate.lookups,
+        )
+
+    def test_misses_are_not_remembered(self):
+        """
+        Checks unknown packages are asked for again.
+        """
+        delegate = CountingRepo({})
+        repo = CachingNixFlakeRepo(delegate)
+        self.assertIsNone(repo.latest_version("nixos"))
+        self.assertIsNone(repo.latest_version("nixos"))
+        self.assertEqual(2, len(delegate.lookups))
+
+    def test_refresh_renews_the_latest_version(self):
+        """
+        Checks refresh() picks up a new release and caches its flake.
+        """
+        delegate = CountingRepo({"nixos": "23.05"})
+        repo = CachingNixFlakeRepo(delegate)
+        repo.latest_version("nixos")
+        delegate.latest["nixos"] = "23.11"
+        self.assertEqual("23.05", repo.latest_version("nixos"))
+        self.assertEqual("23.11", repo.refresh("nixos"))
+        delegate.lookups.clear()
+        self.assertEqual("nixos-23.11", repo.latest("nixos"))
+        self.assertEqual([], delegate.lookups)
+
+    def test_invalidation(self):
+        """
+        Checks invalidated entries are looked up again.
+        """
+        delegate = CountingRepo({"nixos": "23.05", "grpcio": "1.0"})
+        repo = CachingNixFlakeRepo(delegate)
+        repo.latest("nixos")
+        repo.latest("grpcio")
+        self.assertEqual(2, repo.invalidate("nixos"))
+        self.assertTrue(repo.invalidate_version("grpcio", "1.0"))
+        self.assertFalse(repo.invalidate_version("grpcio", "1.0"))
+        delegate.lookups.clear()
+        repo.latest("nixos")
+        repo.latest("grpcio")
+        self.assertEqual(
+            [
+                ("latest", "nixos"),
+                ("find", "nixos", "23.05"),
+                ("find", "grpcio", "1.0"),
+            ],
+            delegate.lookups,
+        )
+        self.assertEqual(4, repo.invalidate())
+        self.assertEqual(0, len(repo.cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,146 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_executor_async_nix_flake_repo.py
+
+This file tests the ExecutorAsyncNixFlakeRepoTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pythoneda.artifact.nix.flake import ExecutorAsyncNixFlakeRepo
+import threading
+import types
+import unittest
+
+
+class ThreadRecordingRepo:
+    """
+    A stand-in synchronous repository recording the threads serving it.
+
+    Class name: ThreadRecordingRepo
+
+    Responsibilities:
+        - Answers lookups, noting the thread of each call.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self):
+        """
+        Creates a new ThreadRecordingRepo instance.
+        """
+        self.threads = []
+        self.batches = []
+
+    def latest(self, name: str) -> str:
+        """
+        Retrieves a stand-in for the latest flake of given package.
+        :param name: The package.
+        :type name: str
+        :return: The stand-in.
+        :rtype: str
+        """
+        self.threads.append(threading.current_thread())
+        return f"{name}-latest"
+
+    def find(self, name: str, version: str) -> str:
+        """
+        Retrieves a stand-in for the flake of given package and version.
+        :param name: The package.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: The stand-in.
+        :rtype: str
+        """
+        self.threads.append(threading.current_thread())
+        return f"{name}-{version}"
+
+    def resolve_many(self, specs: list) -> list:
+        """
+        Resolves given specifications.
+        :param specs: The specifications.
+        :type specs: list
+        :return: Their names.
+        :rtype: list
+        """
+        self.threads.append(threading.current_thread())
+        self.batches.append(len(specs))
+        return [item.name for item in specs]
+
+
+class ExecutorAsyncNixFlakeRepoTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests ExecutorAsyncNixFlakeRepo.
+
+    Class name: ExecutorAsyncNixFlakeRepoTest
+
+    Responsibilities:
+        - Checks lookups run in the executor, off the event loop.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.ExecutorAsyncNixFlakeRepo
+    """
+
+    async def test_lookups_run_in_the_executor(self):
+        """
+        Checks each lookup is answered by the synchronous repository, in the
+        executor, and batches stay batches.
+        """
+        delegate = ThreadRecordingRepo()
+        with ThreadPoolExecutor(1, thread_name_prefix="offloaded") as executor:
+            repo = ExecutorAsyncNixFlakeRepo(delegate, executor)
+            self.assertEqual("nixos-latest", await repo.latest("nixos"))
+            self.assertEqual("nixos-1.0", await repo.find("nixos", "1.0"))
+            specs = [
+                types.SimpleNamespace(name=name, version="1.0", url=None)
+                for name in ["a", "b"]
+            ]
+            self.assertEqual(["a", "b"], await repo.resolve_many(specs))
+        self.assertEqual([2], delegate.batches)
+        self.assertEqual(3, len(delegate.threads))
+        for thread in delegate.threads:
+            self.assertTrue(thread.name.startswith("offloaded"))
+
+    async def test_default_flakes_are_retrieved_concurrently(self):
+        """
+        Checks default_latest_flakes() retrieves the default packages in order.
+        """
+        repo = ExecutorAsyncNixFlakeRepo(ThreadRecordingRepo())
+        self.assertEqual(
+            [
+                "nixos-latest",
+                "flake-utils-latest",
+                "pythoneda-shared-pythoneda-banner-latest",
+                "pythoneda-shared-pythoneda-domain-latest",
+            ],
+            await repo.default_latest_flakes(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
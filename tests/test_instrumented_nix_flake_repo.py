@@ -0,0 +1,131 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_instrumented_nix_flake_repo.py
+
+This file tests the InstrumentedNixFlakeRepoTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import InstrumentedNixFlakeRepo, NixFlakeMetrics
+import types
+import unittest
+
+
+class EchoRepo:
+    """
+    A stand-in repository resolving every specification to its name.
+
+    Class name: EchoRepo
+
+    Responsibilities:
+        - Resolves specifications one by one, or in batches.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self):
+        """
+        Creates a new EchoRepo instance.
+        """
+        self.batches = 0
+
+    def configure_resolution(self, maxConcurrency: int, timeout: float):
+        """
+        Ignores the resolution settings.
+        :param maxConcurrency: The maximum number of concurrent resolutions.
+        :type maxConcurrency: int
+        :param timeout: The timeout of each resolution.
+        :type timeout: float
+        """
+        pass
+
+    def resolve(self, spec) -> str:
+        """
+        Resolves given specification.
+        :param spec: The specification.
+        :type spec: types.SimpleNamespace
+        :return: Its name.
+        :rtype: str
+        """
+        return spec.name
+
+    def resolve_many(self, specs: list, failures: list = None) -> list:
+        """
+        Resolves given specifications.
+        :param specs: The specifications.
+        :type specs: list
+        :param failures: The list receiving the failed specifications.
+        :type failures: list
+        :return: Their names.
+        :rtype: list
+        """
+        self.batches += 1
+        return [item.name for item in specs]
+
+
+class InstrumentedNixFlakeRepoTest(unittest.TestCase):
+    """
+    Tests InstrumentedNixFlakeRepo.
+
+    Class name: InstrumentedNixFlakeRepoTest
+
+    Responsibilities:
+        - Checks batches are measured per package.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.InstrumentedNixFlakeRepo
+        - pythoneda.artifact.nix.flake.NixFlakeMetrics
+    """
+
+    def test_batches_are_measured_per_package(self):
+        """
+        Checks each specification of a batch is recorded under its package.
+        """
+        metrics = NixFlakeMetrics(enabled=True)
+        repo = InstrumentedNixFlakeRepo(EchoRepo(), metrics)
+        specs = [
+            types.SimpleNamespace(name=name, version="1.0", url=None)
+            for name in ["a", "b"]
+        ]
+        self.assertEqual(["a", "b"], repo.resolve_many(specs))
+        calls = metrics.snapshot()["calls"]
+        self.assertEqual({"a", "b"}, set(calls["resolve"].keys()))
+        self.assertEqual(1, calls["resolve_many"][""]["count"])
+
+    def test_disabled_metrics_keep_batches(self):
+        """
+        Checks batches reach the decorated repository as such without metrics.
+        """
+        delegate = EchoRepo()
+        repo = InstrumentedNixFlakeRepo(delegate, NixFlakeMetrics())
+        spec = types.SimpleNamespace(name="a", version="1.0", url=None)
+        self.assertEqual(["a"], repo.resolve_many([spec]))
+        self.assertEqual(1, delegate.batches)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
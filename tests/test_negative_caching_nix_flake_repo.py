@@ -0,0 +1,170 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_negative_caching_nix_flake_repo.py
+
+This file tests the NegativeCachingNixFlakeRepoTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import (
+    NegativeCachingNixFlakeRepo,
+    SingleFlightNixFlakeRepo,
+)
+import threading
+import time
+import types
+import unittest
+
+
+def spec(name: str, version: str = "1.0"):
+    """
+    Builds a stand-in for a specification.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(name=name, version=version, url=None)
+
+
+class FlakyRepo:
+    """
+    A stand-in repository that finds some flakes, and fails to resolve others.
+
+    Class name: FlakyRepo
+
+    Responsibilities:
+        - Resolves "found" specifications, fails "flaky" ones, and misses the rest.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, release: threading.Event = None):
+        """
+        Creates a new FlakyRepo instance.
+        :param release: If given, the event each batch waits for.
+        :type release: threading.Event
+        """
+        self.batches = []
+        self.release = release
+
+    def resolve_many(self, specs: list, failures: list = None) -> list:
+        """
+        Resolves given specifications.
+        :param specs: The specifications.
+        :type specs: list
+        :param failures: The list receiving the failed specifications.
+        :type failures: list
+        :return: The flakes.
+        :rtype: list
+        """
+        self.batches.append([item.name for item in specs])
+        if self.release is not None:
+            self.release.wait(5)
+        result = []
+        for item in specs:
+            if item.name == "flaky" and failures is not None:
+                failures.append(item)
+            if item.name == "found":
+                result.append(f"{item.name}-{item.version}")
+            else:
+                result.append(None)
+        return result
+
+
+class NegativeCachingNixFlakeRepoTest(unittest.TestCase):
+    """
+    Tests NegativeCachingNixFlakeRepo.
+
+    Class name: NegativeCachingNixFlakeRepoTest
+
+    Responsibilities:
+        - Checks misses are remembered, but failed resolutions are not.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NegativeCachingNixFlakeRepo
+        - pythoneda.artifact.nix.flake.SingleFlightNixFlakeRepo
+    """
+
+    def test_misses_are_remembered(self):
+        """
+        Checks a specification without a flake is not resolved again.
+        """
+        delegate = FlakyRepo()
+        repo = NegativeCachingNixFlakeRepo(delegate)
+        result = repo.resolve_many([spec("found"), spec("gone")])
+        self.assertEqual(["found-1.0", None], result)
+        self.assertTrue(repo.is_known_miss(spec("gone")))
+        result = repo.resolve_many([spec("gone"), spec("found")])
+        self.assertEqual([None, "found-1.0"], result)
+        self.assertEqual([["found", "gone"], ["found"]], delegate.batches)
+
+    def test_failures_are_not_remembered(self):
+        """
+        Checks a failed resolution is reported, and retried next time.
+        """
+        delegate = FlakyRepo()
+        repo = NegativeCachingNixFlakeRepo(delegate)
+        failures = []
+        self.assertEqual([None], repo.resolve_many([spec("flaky")], failures))
+        self.assertEqual(["flaky"], [item.name for item in failures])
+        self.assertFalse(repo.is_known_miss(spec("flaky")))
+        repo.resolve_many([spec("flaky")])
+        self.assertEqual([["flaky"], ["flaky"]], delegate.batches)
+
+    def test_failures_reach_callers_joining_a_batch(self):
+        """
+        Checks callers sharing a single-flight batch all learn about its failures,
+        even though the batch runs in another thread.
+        """
+        release = threading.Event()
+        delegate = FlakyRepo(release)
+        repo = NegativeCachingNixFlakeRepo(SingleFlightNixFlakeRepo(delegate))
+        outcomes = {}
+
+        def run(caller):
+            failures = []
+            outcomes[caller] = (repo.resolve_many([spec("flaky")], failures), failures)
+
+        threads = [threading.Thread(target=run, args=(caller,)) for caller in range(2)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual([["flaky"]], delegate.batches)
+        for result, failures in outcomes.values():
+            self.assertEqual([None], result)
+            self.assertEqual(["flaky"], [item.name for item in failures])
+        self.assertFalse(repo.is_known_miss(spec("flaky")))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,157 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_base_inputs.py
+
+This file tests the NixFlakeBaseInputsTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake.nix_flake_base_inputs import NixFlakeBaseInputs
+import unittest
+
+
+class VersionedRepo:
+    """
+    A stand-in repository whose latest versions can be changed.
+
+    Class name: VersionedRepo
+
+    Responsibilities:
+        - Answers latest_version() and find() from a dictionary, recording lookups.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, versions: dict):
+        """
+        Creates a new VersionedRepo instance.
+        :param versions: The latest version of each package.
+        :type versions: dict
+        """
+        self.versions = dict(versions)
+        self.found = []
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the latest version of given package.
+        :param name: The package.
+        :type name: str
+        :return: Such version.
+        :rtype: str
+        """
+        return self.versions.get(name)
+
+    def find(self, name: str, version: str):
+        """
+        Retrieves a flake.
+        :param name: The package.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: The flake, as a name-version string.
+        :rtype: str
+        """
+        self.found.append(name)
+        return None if version is None else f"{name}-{version}"
+
+
+class NixFlakeBaseInputsTest(unittest.TestCase):
+    """
+    Tests NixFlakeBaseInputs.
+
+    Class name: NixFlakeBaseInputsTest
+
+    Responsibilities:
+        - Checks inputs are resolved once per repository, and refreshed when stale.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeBaseInputs
+    """
+
+    def test_inputs_are_resolved_once(self):
+        """
+        Checks fresh inputs are reused without querying the repository.
+        """
+        repo = VersionedRepo({"a": "1", "b": "2"})
+        inputs = NixFlakeBaseInputs(["a", "b"])
+        self.assertEqual(("a-1", "b-2"), inputs.flakes(repo))
+        self.assertEqual(("b-2",), inputs.flakes(repo, exclude=("a",)))
+        self.assertEqual(["a", "b"], repo.found)
+
+    def test_unresolvable_packages_are_skipped(self):
+        """
+        Checks packages without a flake are left out.
+        """
+        repo = VersionedRepo({"a": "1"})
+        self.assertEqual(("a-1",), NixFlakeBaseInputs(["a", "b"]).flakes(repo))
+
+    def test_snapshots_are_kept_per_repository(self):
+        """
+        Checks each repository gets its own inputs.
+        """
+        inputs = NixFlakeBaseInputs(["a"])
+        self.assertEqual(("a-1",), inputs.flakes(VersionedRepo({"a": "1"})))
+        self.assertEqual(("a-2",), inputs.flakes(VersionedRepo({"a": "2"})))
+
+    def test_stale_inputs_refetch_only_changed_versions(self):
+        """
+        Checks expired inputs pick up new upstream versions, re-fetching only those.
+        """
+        repo = VersionedRepo({"a": "1", "b": "2"})
+        inputs = NixFlakeBaseInputs(["a", "b"], maxAge=0)
+        inputs.flakes(repo)
+        repo.versions["b"] = "3"
+        self.assertEqual(("a-1", "b-3"), inputs.flakes(repo))
+        self.assertEqual(["a", "b", "b"], repo.found)
+
+    def test_refresh_reports_changes(self):
+        """
+        Checks refresh() tells whether the inputs changed.
+        """
+        repo = VersionedRepo({"a": "1"})
+        inputs = NixFlakeBaseInputs(["a"], maxAge=None)
+        self.assertTrue(inputs.refresh(repo))
+        self.assertFalse(inputs.refresh(repo))
+        repo.versions["a"] = "2"
+        self.assertTrue(inputs.refresh(repo))
+        self.assertEqual(("a-2",), inputs.flakes(repo))
+
+    def test_invalidate_discards_inputs(self):
+        """
+        Checks invalidated inputs are resolved again.
+        """
+        repo = VersionedRepo({"a": "1"})
+        inputs = NixFlakeBaseInputs(["a"], maxAge=None)
+        inputs.flakes(repo)
+        repo.versions["a"] = "2"
+        self.assertEqual(("a-1",), inputs.flakes(repo))
+        inputs.invalidate(repo)
+        self.assertEqual(("a-2",), inputs.flakes(repo))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,224 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_catalog.py
+
+This file tests the NixFlakeCatalog class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+from pythoneda.artifact.nix.flake import NixFlakeCatalog
+from pythoneda.shared.nix.flake import NixFlake
+import types
+import unittest
+
+
+def flake(name: str, version: str, url: str = None, inputs: list = None):
+    """
+    Builds a stand-in for a flake, with the attributes NixFlakeCatalog reads.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :param url: The url.
+    :type url: str
+    :param inputs: The inputs.
+    :type inputs: List
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(
+        name=name, version=version, url=url, inputs=inputs or []
+    )
+
+
+class VersionedNixFlake(NixFlake):
+    """
+    A flake whose constructor only takes its version.
+
+    Class name: VersionedNixFlake
+
+    Responsibilities:
+        - Fills in its own name and url.
+
+    Collaborators:
+        - pythoneda.shared.nix.flake.NixFlake
+    """
+
+    def __init__(self, version: str):
+        """
+        Creates a new VersionedNixFlake instance.
+        :param version: The version.
+        :type version: str
+        """
+        super().__init__(
+            "versioned",
+            version,
+            f"github:o/versioned/{version}",
+            [],
+            None,
+            "versioned",
+            None,
+            [],
+            [],
+            None,
+        )
+
+
+class NixFlakeCatalogTest(unittest.TestCase):
+    """
+    Tests NixFlakeCatalog.
+
+    Class name: NixFlakeCatalogTest
+
+    Responsibilities:
+        - Checks removing flakes keeps every index consistent.
+        - Checks compound and range queries.
+        - Checks catalogs survive a JSON round trip.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeCatalog
+    """
+
+    def setUp(self):
+        """
+        Builds a catalog with two versions of a flake, one of them at two urls.
+        """
+        self.base = flake("base", "1.0", "github:o/base/1.0")
+        self.old = flake("app", "0.1", "github:o/app/0.1", [self.base])
+        self.new = flake("app", "0.2", "github:o/app/0.2", [self.base])
+        self.mirror = flake("app", "0.2", "https://mirror/app/0.2")
+        self.catalog = NixFlakeCatalog([self.base, self.old, self.new, self.mirror])
+
+    def test_remove_updates_the_indexes(self):
+        """
+        Checks a removed flake cannot be found through any index.
+        """
+        self.assertTrue(self.catalog.remove(self.old))
+        self.assertFalse(self.catalog.remove(self.old))
+        self.assertEqual(3, len(self.catalog))
+        self.assertIsNone(self.catalog.get("app", "0.1"))
+        self.assertEqual([], self.catalog.find_by_attribute("version", "0.1"))
+        self.assertEqual([], self.catalog.find_by_attribute("url", self.old.url))
+        self.assertEqual([], self.catalog.filter({"url_prefix": "github:o/app/0.1"}))
+        self.assertEqual(
+            [self.new], self.catalog.filter({"name": "app", "inputs": "base"})
+        )
+        self.assertEqual(["0.2"], self.catalog.versions("app"))
+        self.assertEqual([], self.catalog.matching("app", "<0.2"))
+
+    def test_remove_keeps_other_urls_of_the_same_version(self):
+        """
+        Checks removing a flake falls back to another url for the same version.
+        """
+        self.assertIs(self.new, self.catalog.get("app", "0.2"))
+        self.catalog.remove(self.new)
+        self.assertIs(self.mirror, self.catalog.get("app", "0.2"))
+        self.assertEqual(["0.1", "0.2"], self.catalog.versions("app"))
+        self.catalog.remove(self.mirror)
+        self.assertIsNone(self.catalog.get("app", "0.2"))
+        self.assertEqual(["0.1"], self.catalog.versions("app"))
+        self.assertEqual("0.1", self.catalog.latest_version("app"))
+
+    def test_remove_drops_empty_index_entries(self):
+        """
+        Checks index values without flakes are not kept around.
+        """
+        self.catalog.remove(self.old)
+        self.catalog.remove(self.new)
+        self.assertEqual([], self.catalog.find_by_attribute("inputs", "base"))
+        self.assertNotIn("base", self.catalog._indexes["inputs"])
+        self.assertNotIn("0.1", self.catalog._indexes["version"])
+
+    def test_filter_intersects_criteria(self):
+        """
+        Checks compound queries only retrieve flakes matching every criterion.
+        """
+        self.assertEqual(
+            [self.mirror],
+            self.catalog.filter({"version": "0.2", "url_prefix": "https://"}),
+        )
+        self.assertEqual(
+            [self.old, self.new], self.catalog.filter({"url_prefix": "github:o/app"})
+        )
+        with self.assertRaises(ValueError):
+            self.catalog.filter({"colour": "blue"})
+
+    def test_resolve_picks_the_highest_compatible_version(self):
+        """
+        Checks ranges resolve to the highest known version satisfying them.
+        """
+        spec = types.SimpleNamespace(name="app", version="^0.1", url=None)
+        self.assertIs(self.old, self.catalog.resolve(spec))
+        spec = types.SimpleNamespace(name="app", version=">=0.1", url=None)
+        self.assertIs(self.new, self.catalog.resolve(spec))
+        spec = types.SimpleNamespace(name="app", version=">=0.3", url=None)
+        self.assertIsNone(self.catalog.resolve(spec))
+
+    def test_json_round_trip(self):
+        """
+        Checks flakes are rebuilt with their classes and shared inputs.
+        """
+        NixFlakeCatalog.register_flake_factory(
+            VersionedNixFlake,
+            lambda entry, inputs: VersionedNixFlake(entry["version"]),
+        )
+        self.addCleanup(NixFlakeCatalog._flake_factories.pop, VersionedNixFlake)
+        base = NixFlake(
+            "base", "1.0", "github:o/base/1.0", [], None, "base", None, [], [], None
+        )
+        app = NixFlake(
+            "app", "0.2", "github:o/app/0.2", [base], None, "app", None, [], [], None
+        )
+        catalog = NixFlakeCatalog([app, VersionedNixFlake("0.3")], {"app": "0.2"})
+        restored = NixFlakeCatalog.from_dict(json.loads(json.dumps(catalog.to_dict())))
+        self.assertEqual(2, len(restored))
+        self.assertEqual("0.2", restored.latest_version("app"))
+        restored_app = restored.get("app", "0.2")
+        self.assertIs(NixFlake, type(restored_app))
+        self.assertEqual("github:o/app/0.2", restored_app.url)
+        self.assertEqual(
+            [("base", "1.0", "github:o/base/1.0")],
+            [(item.name, item.version, item.url) for item in restored_app.inputs],
+        )
+        restored_versioned = restored.get("versioned", "0.3")
+        self.assertIs(VersionedNixFlake, type(restored_versioned))
+        self.assertEqual("github:o/versioned/0.3", restored_versioned.url)
+
+    def test_classes_without_factory_are_rebuilt_as_nix_flakes(self):
+        """
+        Checks a flake class rejecting NixFlake's arguments falls back to NixFlake.
+        """
+        entries = NixFlakeCatalog.encode_flakes([VersionedNixFlake("0.3")])
+        with self.assertLogs(level="WARNING"):
+            flakes = NixFlakeCatalog.decode_flakes(entries)
+        flake = flakes[("versioned", "0.3", "github:o/versioned/0.3")]
+        self.assertIs(NixFlake, type(flake))
+        self.assertEqual("0.3", flake.version)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
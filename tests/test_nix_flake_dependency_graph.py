@@ -0,0 +1,202 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_dependency_graph.py
+
+This file tests the NixFlakeDependencyGraphTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake.nix_flake_dependency_graph import (
+    NixFlakeDependencyGraph,
+)
+import types
+import unittest
+
+
+def flake(name: str, version: str = "1.0", inputs: list = None):
+    """
+    Builds a stand-in for a flake.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :param inputs: The flake inputs.
+    :type inputs: list
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(
+        name=name, version=version, url=None, inputs=inputs or []
+    )
+
+
+class LatestRepo:
+    """
+    A stand-in repository answering latest() from a dictionary.
+
+    Class name: LatestRepo
+
+    Responsibilities:
+        - Retrieves the latest flake of each package, recording lookups.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, flakes: dict):
+        """
+        Creates a new LatestRepo instance.
+        :param flakes: The latest flake of each package.
+        :type flakes: dict
+        """
+        self.flakes = flakes
+        self.calls = []
+
+    def latest(self, name: str):
+        """
+        Retrieves the latest flake of given package.
+        :param name: The package.
+        :type name: str
+        :return: Such flake, or None if unknown.
+        :rtype: types.SimpleNamespace
+        """
+        self.calls.append(name)
+        return self.flakes.get(name)
+
+
+class NixFlakeDependencyGraphTest(unittest.TestCase):
+    """
+    Tests NixFlakeDependencyGraph.
+
+    Class name: NixFlakeDependencyGraphTest
+
+    Responsibilities:
+        - Checks closures follow declared dependencies, resolving each once.
+        - Checks subgraphs are remembered across closures.
+        - Checks cycles are skipped instead of failing.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeDependencyGraph
+    """
+
+    def names(self, flakes) -> list:
+        """
+        Retrieves the names of given flakes.
+        :param flakes: The flakes.
+        :type flakes: list
+        :return: Their names.
+        :rtype: list
+        """
+        return sorted(item.name for item in flakes)
+
+    def test_without_declarations_closure_is_the_roots(self):
+        """
+        Checks roots are returned as they are, one per name.
+        """
+        graph = NixFlakeDependencyGraph()
+        repo = LatestRepo({})
+        roots = [flake("a"), None, flake("b"), flake("a", "2.0")]
+        result = graph.closure(repo, roots)
+        self.assertEqual(["a", "b"], self.names(result))
+        self.assertEqual("1.0", result[0].version)
+        self.assertEqual([], repo.calls)
+
+    def test_shared_dependencies_are_resolved_once(self):
+        """
+        Checks a dependency shared by several flakes is resolved once per closure.
+        """
+        graph = NixFlakeDependencyGraph()
+        graph.declare("a", ["domain"])
+        graph.declare("b", ["domain", "banner"])
+        graph.declare("banner", ["domain"])
+        repo = LatestRepo({"domain": flake("domain"), "banner": flake("banner")})
+        result = graph.closure(repo, [flake("a"), flake("b")])
+        self.assertEqual(["a", "b", "banner", "domain"], self.names(result))
+        self.assertEqual(["domain", "banner"], repo.calls)
+
+    def test_subgraphs_are_remembered_across_closures(self):
+        """
+        Checks a second closure reuses what the first one computed.
+        """
+        graph = NixFlakeDependencyGraph()
+        graph.declare("a", ["domain"])
+        repo = LatestRepo({"domain": flake("domain")})
+        graph.closure(repo, [flake("a")])
+        result = graph.closure(repo, [flake("a")])
+        self.assertEqual(["a", "domain"], self.names(result))
+        self.assertEqual(["domain"], repo.calls)
+
+    def test_new_declarations_invalidate_subgraphs(self):
+        """
+        Checks declaring dependencies again affects later closures.
+        """
+        graph = NixFlakeDependencyGraph()
+        graph.declare("a", ["domain"])
+        repo = LatestRepo({"domain": flake("domain"), "banner": flake("banner")})
+        graph.closure(repo, [flake("a")])
+        graph.declare("a", ["banner"])
+        self.assertEqual(["a", "banner"], self.names(graph.closure(repo, [flake("a")])))
+
+    def test_unresolvable_dependencies_are_skipped(self):
+        """
+        Checks missing dependencies are left out.
+        """
+        graph = NixFlakeDependencyGraph()
+        graph.declare("a", ["missing"])
+        result = graph.closure(LatestRepo({}), [flake("a")])
+        self.assertEqual(["a"], self.names(result))
+
+    def test_declared_cycles_are_skipped(self):
+        """
+        Checks a cycle of declared dependencies is logged and skipped, and that no
+        partial subgraph is remembered.
+        """
+        graph = NixFlakeDependencyGraph()
+        graph.declare("a", ["b"])
+        graph.declare("b", ["a"])
+        repo = LatestRepo({"a": flake("a"), "b": flake("b")})
+        with self.assertLogs(level="WARNING"):
+            result = graph.closure(repo, [flake("a")])
+        self.assertEqual(["a", "b"], self.names(result))
+        with self.assertLogs(level="WARNING"):
+            result = graph.closure(repo, [flake("b")])
+        self.assertEqual(["a", "b"], self.names(result))
+
+    def test_flattened_inputs_are_followed(self):
+        """
+        Checks flattening adds the inputs of each flake, skipping input cycles.
+        """
+        graph = NixFlakeDependencyGraph(flatten=True)
+        inner = flake("inner")
+        outer = flake("outer", inputs=[inner])
+        inner.inputs = [outer]
+        with self.assertLogs(level="WARNING"):
+            result = graph.closure(LatestRepo({}), [flake("root", inputs=[outer])])
+        self.assertEqual(["inner", "outer", "root"], self.names(result))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
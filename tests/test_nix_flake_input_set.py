@@ -0,0 +1,111 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_input_set.py
+
+This file tests the NixFlakeInputSet class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import NixFlakeInputSet
+import types
+import unittest
+
+
+def flake(name: str, version: str, url: str = None):
+    """
+    Builds a stand-in for a flake, with the attributes NixFlakeInputSet reads.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :param url: The url.
+    :type url: str
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(name=name, version=version, url=url)
+
+
+class NixFlakeInputSetTest(unittest.TestCase):
+    """
+    Tests NixFlakeInputSet.
+
+    Class name: NixFlakeInputSetTest
+
+    Responsibilities:
+        - Checks duplicated names keep a single, deterministic flake.
+        - Checks sets compare, hash and merge by their flakes' identities.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeInputSet
+    """
+
+    def test_highest_version_wins(self):
+        """
+        Checks the highest version, in semver order, is kept for each name.
+        """
+        inputs = NixFlakeInputSet(
+            [flake("a", "0.0.9"), flake("a", "0.0.10"), None, flake("b", "1.0")]
+        )
+        self.assertEqual(2, len(inputs))
+        self.assertEqual("0.0.10", inputs.get("a").version)
+        self.assertEqual(["a", "b"], [item.name for item in inputs])
+
+    def test_lowest_url_wins_among_equal_versions(self):
+        """
+        Checks ties are broken by url, whatever the order of the flakes.
+        """
+        first = flake("a", "1.0", "https://b")
+        second = flake("a", "1.0", "https://a")
+        self.assertIs(second, NixFlakeInputSet([first, second]).get("a"))
+        self.assertIs(second, NixFlakeInputSet([second, first]).get("a"))
+
+    def test_equality_and_hashing(self):
+        """
+        Checks sets with the same identities are equal, regardless of order.
+        """
+        one = NixFlakeInputSet([flake("a", "1.0"), flake("b", "2.0")])
+        other = NixFlakeInputSet([flake("b", "2.0"), flake("a", "1.0")])
+        self.assertEqual(one, other)
+        self.assertEqual(hash(one), hash(other))
+        self.assertEqual((("a", "1.0", ""), ("b", "2.0", "")), one.keys())
+        self.assertIn(flake("a", "1.0"), one)
+        self.assertNotIn(flake("a", "1.1"), one)
+
+    def test_union(self):
+        """
+        Checks unions leave the original set untouched.
+        """
+        inputs = NixFlakeInputSet([flake("a", "1.0")])
+        self.assertIs(inputs, inputs.union([]))
+        merged = inputs.union([flake("a", "1.1"), flake("c", "1.0")])
+        self.assertEqual(["1.1", "1.0"], [item.version for item in merged])
+        self.assertEqual("1.0", inputs.get("a").version)
+        self.assertIs(merged, NixFlakeInputSet.of(merged))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,218 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_lockfile.py
+
+This file tests the NixFlakeLockfileTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import (
+    CatalogNixFlakeRepo,
+    NixFlakeLockfile,
+    RecordingNixFlakeRepo,
+)
+from pythoneda.shared.nix.flake import NixFlake
+import types
+import unittest
+
+
+def flake(name: str, version: str) -> NixFlake:
+    """
+    Builds a flake without inputs.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :return: The flake.
+    :rtype: pythoneda.shared.nix.flake.NixFlake
+    """
+    return NixFlake(
+        name,
+        version,
+        f"github:o/{name}/{version}",
+        [],
+        None,
+        name,
+        None,
+        [],
+        [],
+        None,
+    )
+
+
+def spec(name: str, version: str = "1.0"):
+    """
+    Builds a stand-in for a specification.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(name=name, version=version, url=None)
+
+
+class BackendRepo:
+    """
+    A stand-in backend knowing a few packages, and failing on "flaky" ones.
+
+    Class name: BackendRepo
+
+    Responsibilities:
+        - Answers version, flake and batch lookups.
+
+    Collaborators:
+        - None
+    """
+
+    LATEST = {"nixos": "23.05", "grpcio": "1.59"}
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the latest version of given package.
+        :param name: The package.
+        :type name: str
+        :return: Such version, or None if unknown.
+        :rtype: str
+        """
+        return self.__class__.LATEST.get(name, None)
+
+    def find(self, name: str, version: str) -> NixFlake:
+        """
+        Retrieves a specific version of the flake of given package.
+        :param name: The package.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: Such flake, or None if unknown.
+        :rtype: pythoneda.shared.nix.flake.NixFlake
+        """
+        if name not in self.__class__.LATEST:
+            return None
+        return flake(name, version)
+
+    def resolve_many(self, specs: list, failures: list = None) -> list:
+        """
+        Resolves given specifications.
+        :param specs: The specifications.
+        :type specs: list
+        :param failures: The list receiving the failed specifications.
+        :type failures: list
+        :return: The flakes.
+        :rtype: list
+        """
+        result = []
+        for item in specs:
+            if item.name == "flaky" and failures is not None:
+                failures.append(item)
+            result.append(self.find(item.name, item.version))
+        return result
+
+
+class NixFlakeLockfileTest(unittest.TestCase):
+    """
+    Tests NixFlakeLockfile and RecordingNixFlakeRepo.
+
+    Class name: NixFlakeLockfileTest
+
+    Responsibilities:
+        - Checks lookups are recorded, serialized and replayed.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeLockfile
+        - pythoneda.artifact.nix.flake.RecordingNixFlakeRepo
+        - pythoneda.artifact.nix.flake.CatalogNixFlakeRepo
+    """
+
+    def record(self) -> NixFlakeLockfile:
+        """
+        Records some lookups.
+        :return: The lockfile.
+        :rtype: pythoneda.artifact.nix.flake.NixFlakeLockfile
+        """
+        repo = RecordingNixFlakeRepo(BackendRepo())
+        repo.latest("nixos")
+        failures = []
+        repo.resolve_many([spec("grpcio"), spec("gone"), spec("flaky")], failures)
+        self.assertEqual(["flaky"], [item.name for item in failures])
+        return repo.lockfile
+
+    def test_lookups_are_recorded(self):
+        """
+        Checks versions, flakes and resolutions are recorded, but failures are not.
+        """
+        lockfile = self.record()
+        self.assertEqual("23.05", lockfile.latest_version("nixos"))
+        self.assertEqual(
+            flake("nixos", "23.05").url, lockfile.get("nixos", "23.05").url
+        )
+        self.assertEqual(
+            {
+                ("SimpleNamespace", "grpcio", "1.0", None),
+                ("SimpleNamespace", "gone", "1.0", None),
+            },
+            set(lockfile.resolutions().keys()),
+        )
+        self.assertIsNone(lockfile.resolve(spec("gone")))
+        with self.assertRaises(LookupError):
+            lockfile.resolve(spec("flaky"))
+
+    def test_lockfiles_replay_without_backend(self):
+        """
+        Checks a deserialized lockfile answers as recorded.
+        """
+        lockfile = NixFlakeLockfile.from_dict(self.record().to_dict())
+        repo = CatalogNixFlakeRepo(lockfile)
+        self.assertEqual("23.05", repo.latest_version("nixos"))
+        [resolved, missing] = repo.resolve_many([spec("grpcio"), spec("gone")])
+        self.assertEqual(("grpcio", "1.0"), (resolved.name, resolved.version))
+        self.assertIsNone(missing)
+        with self.assertRaises(LookupError):
+            repo.resolve(spec("unrecorded"))
+
+    def test_capture_pins_every_known_package(self):
+        """
+        Checks capture() pins the latest flake of every registered package.
+        """
+        lockfile = NixFlakeLockfile.capture(BackendRepo(), [spec("grpcio")])
+        self.assertEqual("1.59", lockfile.latest_version("grpcio"))
+        self.assertEqual("23.05", lockfile.latest_version("nixos"))
+        self.assertIsNone(lockfile.latest_version("jupyterlab"))
+        self.assertEqual("1.0", lockfile.resolve(spec("grpcio")).version)
+
+    def test_removing_a_flake_forgets_its_resolutions(self):
+        """
+        Checks resolutions to a removed flake are forgotten.
+        """
+        lockfile = self.record()
+        lockfile.remove(lockfile.resolve(spec("grpcio")))
+        with self.assertRaises(LookupError):
+            lockfile.resolve(spec("grpcio"))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,155 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_output_cache.py
+
+This file tests the NixFlakeOutputCacheTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import NixFlakeOutputCache
+import types
+import unittest
+
+
+def flake(name: str, version: str):
+    """
+    Builds a stand-in for a flake, with the attributes NixFlakeInputSet reads.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(name=name, version=version, url=None)
+
+
+def code_request(code: str, *versions: str):
+    """
+    Builds a stand-in for a code request, depending on "dep" at given versions.
+    :param code: The code.
+    :type code: str
+    :param versions: The versions of its dependencies.
+    :type versions: List[str]
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(
+        to_json=lambda: code,
+        dependencies=[
+            types.SimpleNamespace(name="dep", version=version, url=None)
+            for version in versions
+        ],
+    )
+
+
+class NixFlakeOutputCacheTest(unittest.TestCase):
+    """
+    Tests NixFlakeOutputCache.
+
+    Class name: NixFlakeOutputCacheTest
+
+    Responsibilities:
+        - Checks digests only depend on the code request and its canonical inputs.
+        - Checks flakes and code requests are cached with LRU eviction.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeOutputCache
+    """
+
+    def test_digests_ignore_the_order_of_inputs(self):
+        """
+        Checks reordered or duplicated inputs yield the same digest.
+        """
+        request = code_request("print(1)")
+        digest = NixFlakeOutputCache.digest(
+            "kind", request, [flake("a", "1.0"), flake("b", "2.0")]
+        )
+        self.assertEqual(
+            digest,
+            NixFlakeOutputCache.digest(
+                "kind",
+                request,
+                [flake("b", "2.0"), flake("a", "1.0"), flake("a", "1.0")],
+            ),
+        )
+        self.assertNotEqual(
+            digest,
+            NixFlakeOutputCache.digest(
+                "kind", request, [flake("a", "1.1"), flake("b", "2.0")]
+            ),
+        )
+        self.assertNotEqual(
+            digest,
+            NixFlakeOutputCache.digest(
+                "other", request, [flake("a", "1.0"), flake("b", "2.0")]
+            ),
+        )
+
+    def test_only_fingerprinted_exact_requests_have_request_digests(self):
+        """
+        Checks code requests without fingerprint, or depending on ranges, are not
+        identified before resolution.
+        """
+        self.assertIsNotNone(
+            NixFlakeOutputCache.request_digest("kind", code_request("x", "1.0"), [])
+        )
+        self.assertIsNone(
+            NixFlakeOutputCache.request_digest("kind", code_request("x", "^1.0"), [])
+        )
+        request = types.SimpleNamespace(dependencies=[])
+        self.assertIsNone(NixFlakeOutputCache.request_digest("kind", request, []))
+        self.assertIsNone(NixFlakeOutputCache.digest("kind", request, []))
+
+    def test_requests_map_to_their_flakes(self):
+        """
+        Checks remembered code requests retrieve their flake while it is cached.
+        """
+        cache = NixFlakeOutputCache(maxEntries=2)
+        cache.put("flake-1", "built-1")
+        cache.remember("request-1", "flake-1")
+        self.assertEqual("built-1", cache.lookup("request-1"))
+        self.assertIsNone(cache.lookup("request-2"))
+        cache.put("flake-2", "built-2")
+        cache.put("flake-3", "built-3")
+        self.assertIsNone(cache.lookup("request-1"))
+
+    def test_least_recently_used_flakes_are_evicted(self):
+        """
+        Checks reading a flake keeps it cached.
+        """
+        cache = NixFlakeOutputCache(maxEntries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual((1, None, 3), (cache.get("a"), cache.get("b"), cache.get("c")))
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,144 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_ref.py
+
+This file tests the NixFlakeRefTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import NixFlakeRef
+from pythoneda.shared.nix.flake import NixFlake
+import pickle
+import types
+import unittest
+
+
+class PinnedNixFlake(NixFlake):
+    """
+    A flake class other than NixFlake.
+
+    Class name: PinnedNixFlake
+
+    Responsibilities:
+        - Tells references to flakes of other classes apart.
+
+    Collaborators:
+        - pythoneda.shared.nix.flake.NixFlake
+    """
+
+    pass
+
+
+def flake(name: str, version: str, flakeClass: type = NixFlake) -> NixFlake:
+    """
+    Builds a flake without inputs.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :param flakeClass: The flake class.
+    :type flakeClass: type
+    :return: The flake.
+    :rtype: pythoneda.shared.nix.flake.NixFlake
+    """
+    return flakeClass(
+        name,
+        version,
+        f"github:o/{name}/{version}",
+        [],
+        None,
+        name,
+        None,
+        [],
+        [],
+        None,
+    )
+
+
+class NixFlakeRefTest(unittest.TestCase):
+    """
+    Tests NixFlakeRef.
+
+    Class name: NixFlakeRefTest
+
+    Responsibilities:
+        - Checks references identify, compare and hydrate flakes.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRef
+    """
+
+    def test_references_identify_flakes(self):
+        """
+        Checks references to the same flake are equal, and keep its class.
+        """
+        ref = NixFlakeRef.of(flake("nixos", "23.05", PinnedNixFlake))
+        same = NixFlakeRef.of(flake("nixos", "23.05", PinnedNixFlake))
+        self.assertEqual(("nixos", "23.05", "github:o/nixos/23.05"), ref.key())
+        self.assertIs(PinnedNixFlake, ref.flake_class)
+        self.assertEqual(ref, same)
+        self.assertEqual(hash(ref), hash(same))
+        self.assertIs(ref.name, same.name)
+        self.assertNotEqual(ref, NixFlakeRef.of(flake("nixos", "23.05")))
+        self.assertNotEqual(ref, NixFlakeRef.of(flake("nixos", "23.11")))
+        self.assertIs(NixFlake, NixFlakeRef("nixos", "23.05").flake_class)
+
+    def test_references_survive_pickling(self):
+        """
+        Checks unpickled references keep their flake class.
+        """
+        ref = NixFlakeRef.of(flake("grpcio", "1.59", PinnedNixFlake))
+        restored = pickle.loads(pickle.dumps(ref))
+        self.assertEqual(ref, restored)
+        self.assertIs(PinnedNixFlake, restored.flake_class)
+
+    def test_hydration(self):
+        """
+        Checks references hydrate by primary key when supported, and by name and
+        version otherwise.
+        """
+        full = flake("grpcio", "1.59")
+        ref = NixFlakeRef.of(full)
+        asked = []
+
+        def find_by_pk(key):
+            asked.append(key)
+            return full
+
+        def unsupported(key):
+            raise NotImplementedError()
+
+        repo = types.SimpleNamespace(find_by_pk=find_by_pk, find=None)
+        self.assertIs(full, ref.hydrate(repo))
+        self.assertEqual([ref.key()], asked)
+        repo = types.SimpleNamespace(
+            find_by_pk=unsupported, find=lambda name, version: (name, version)
+        )
+        self.assertEqual(("grpcio", "1.59"), ref.hydrate(repo))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,124 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_repo.py
+
+This file tests the NixFlakeRepo class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import NixFlakeRegistry, NixFlakeRepo
+import types
+import unittest
+
+
+class NixFlakeRepoTest(unittest.TestCase):
+    """
+    Tests NixFlakeRepo.
+
+    Class name: NixFlakeRepoTest
+
+    Responsibilities:
+        - Checks every latest_[key] alias retrieves the package registered with that key.
+        - Checks every per-package version method relies on latest_version() and find().
+        - Checks ranges are resolved through the version index.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRegistry
+        - pythoneda.artifact.nix.flake.NixFlakeRepo
+    """
+
+    def test_latest_aliases_match_the_registry(self):
+        """
+        Checks each latest_[key] method asks for the flake registered under [key].
+        """
+        for entry in NixFlakeRegistry.entries():
+            with self.subTest(method=entry.latest_method):
+                requested = []
+                repo = types.SimpleNamespace(latest=requested.append)
+                getattr(NixFlakeRepo, entry.latest_method)(repo)
+                self.assertEqual([entry.name], requested)
+
+    def test_version_methods_rely_on_latest_version_and_find(self):
+        """
+        Checks each latest_[key]_version and find_[key]_version method asks
+        latest_version() and find() for the flake registered under [key].
+        """
+        for entry in NixFlakeRegistry.entries():
+            with self.subTest(key=entry.key):
+                requested = []
+                repo = types.SimpleNamespace(
+                    latest_version=lambda name: requested.append(name),
+                    find=lambda name, version: requested.append((name, version)),
+                )
+                getattr(NixFlakeRepo, entry.latest_version_method)(repo)
+                getattr(NixFlakeRepo, entry.find_version_method)(repo, "1.0")
+                self.assertEqual([entry.name, (entry.name, "1.0")], requested)
+
+    def test_adapters_only_implement_the_generic_lookups(self):
+        """
+        Checks no per-package method is abstract.
+        """
+        self.assertEqual(
+            {
+                "find",
+                "latest_Jupyterlab_for_code_requests",
+                "latest_code_execution",
+                "latest_version",
+                "resolve_exact",
+            },
+            set(NixFlakeRepo.__abstractmethods__),
+        )
+
+    def test_ranges_resolve_to_the_highest_compatible_version(self):
+        """
+        Checks resolve() answers ranges of registered packages via find_compatible(),
+        and anything else via resolve_exact().
+        """
+        calls = []
+        repo = types.SimpleNamespace(
+            find_compatible=lambda name, constraint: calls.append(
+                ("compatible", name, constraint)
+            ),
+            resolve_exact=lambda spec: calls.append(("exact", spec.name, spec.version)),
+        )
+        for version in (">=0.0.3,<0.1", "latest", None, "0.0.5"):
+            spec = types.SimpleNamespace(name="nixos", version=version, url=None)
+            NixFlakeRepo.resolve(repo, spec)
+        spec = types.SimpleNamespace(name="unregistered", version="^1.0", url=None)
+        NixFlakeRepo.resolve(repo, spec)
+        self.assertEqual(
+            [
+                ("compatible", "nixos", ">=0.0.3,<0.1"),
+                ("compatible", "nixos", "latest"),
+                ("compatible", "nixos", ""),
+                ("exact", "nixos", "0.0.5"),
+                ("exact", "unregistered", "^1.0"),
+            ],
+            calls,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
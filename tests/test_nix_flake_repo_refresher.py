@@ -0,0 +1,155 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_repo_refresher.py
+
+This file tests the NixFlakeRepoRefresherTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import CachingNixFlakeRepo, NixFlakeRepoRefresher
+import threading
+import unittest
+
+
+class ReleasingRepo:
+    """
+    A stand-in repository whose latest versions can change, and fail.
+
+    Class name: ReleasingRepo
+
+    Responsibilities:
+        - Answers version and flake lookups from a dictionary of latest versions.
+        - Fails the lookups of packages without a known version.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, latest: dict):
+        """
+        Creates a new ReleasingRepo instance.
+        :param latest: The latest version of each package.
+        :type latest: dict
+        """
+        self.latest = latest
+        self.refreshed = threading.Event()
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the latest version of given package.
+        :param name: The package.
+        :type name: str
+        :return: Such version.
+        :rtype: str
+        """
+        self.refreshed.set()
+        if name not in self.latest:
+            raise RuntimeError(f"{name} is unavailable")
+        return self.latest[name]
+
+    def find(self, name: str, version: str) -> str:
+        """
+        Retrieves a stand-in for the flake of given package and version.
+        :param name: The package.
+        :type name: str
+        :param version: The version.
+        :type version: str
+        :return: The stand-in.
+        :rtype: str
+        """
+        return f"{name}-{version}"
+
+
+class NixFlakeRepoRefresherTest(unittest.TestCase):
+    """
+    Tests NixFlakeRepoRefresher.
+
+    Class name: NixFlakeRepoRefresherTest
+
+    Responsibilities:
+        - Checks refreshes keep the cache up to date, despite failing packages.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeRepoRefresher
+        - pythoneda.artifact.nix.flake.CachingNixFlakeRepo
+    """
+
+    def test_refresh_all_updates_the_cache(self):
+        """
+        Checks new releases reach the cache, and failures are reported as None.
+        """
+        delegate = ReleasingRepo({"nixos": "23.05", "grpcio": "1.0"})
+        repo = CachingNixFlakeRepo(delegate)
+        refresher = NixFlakeRepoRefresher(
+            repo, packages=["nixos", "grpcio", "broken"]
+        )
+        repo.latest_version("nixos")
+        delegate.latest["nixos"] = "23.11"
+        self.assertEqual(
+            {"nixos": "23.11", "grpcio": "1.0", "broken": None},
+            refresher.refresh_all(),
+        )
+        self.assertEqual("23.11", repo.latest_version("nixos"))
+        self.assertEqual(
+            (True, "nixos-23.11"), repo.cache.lookup(("find", "nixos", "23.11"))
+        )
+
+    def test_background_refreshes(self):
+        """
+        Checks the background thread refreshes right away, and stops on demand.
+        """
+        delegate = ReleasingRepo({"nixos": "23.05"})
+        refresher = NixFlakeRepoRefresher(
+            CachingNixFlakeRepo(delegate), interval=60.0, packages=["nixos"]
+        )
+        refresher.start()
+        self.assertTrue(refresher.running)
+        self.assertTrue(delegate.refreshed.wait(5))
+        refresher.stop()
+        self.assertFalse(refresher.running)
+
+    def test_invalid_settings_are_rejected(self):
+        """
+        Checks non-positive concurrency and out-of-range jitter are rejected.
+        """
+        repo = CachingNixFlakeRepo(ReleasingRepo({}))
+        with self.assertRaises(ValueError):
+            NixFlakeRepoRefresher(repo, maxConcurrency=0)
+        with self.assertRaises(ValueError):
+            NixFlakeRepoRefresher(repo, jitter=1.0)
+
+    def test_intervals_stay_within_the_jitter(self):
+        """
+        Checks each interval deviates from the average by at most the jitter.
+        """
+        repo = CachingNixFlakeRepo(ReleasingRepo({}), ttl=None)
+        refresher = NixFlakeRepoRefresher(repo, interval=10.0, jitter=0.2)
+        for _ in range(100):
+            self.assertTrue(8.0 <= refresher.next_interval() <= 12.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
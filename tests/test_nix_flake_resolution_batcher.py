@@ -0,0 +1,164 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_resolution_batcher.py
+
+This file tests the NixFlakeResolutionBatcher class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+from pythoneda.artifact.nix.flake.nix_flake_resolution_batcher import (
+    NixFlakeResolutionBatcher,
+)
+import types
+import unittest
+
+
+def spec(name: str, version: str = "1.0"):
+    """
+    Builds a stand-in for a specification.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(name=name, version=version, url=None)
+
+
+class NixFlakeResolutionBatcherTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests NixFlakeResolutionBatcher.
+
+    Class name: NixFlakeResolutionBatcherTest
+
+    Responsibilities:
+        - Checks concurrent resolutions share a single, deduplicated batch.
+        - Checks every caller is answered when a batch fails.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeResolutionBatcher
+    """
+
+    async def test_resolutions_are_batched(self):
+        """
+        Checks each distinct specification is resolved once, in a single call.
+        """
+        batches = []
+
+        async def resolve_many(specs):
+            batches.append([item.name for item in specs])
+            return [f"{item.name}-{item.version}" for item in specs]
+
+        batcher = NixFlakeResolutionBatcher(resolve_many, maxBatchSize=10)
+        results = await asyncio.gather(
+            batcher.resolve(spec("a")),
+            batcher.resolve(spec("b")),
+            batcher.resolve(spec("a")),
+        )
+        self.assertEqual(["a-1.0", "b-1.0", "a-1.0"], results)
+        self.assertEqual([["a", "b"]], batches)
+        self.assertEqual(0, batcher.pending)
+
+    async def test_full_batches_are_flushed_at_once(self):
+        """
+        Checks a batch reaching its maximum size does not wait for its window.
+        """
+
+        async def resolve_many(specs):
+            return [item.name for item in specs]
+
+        batcher = NixFlakeResolutionBatcher(resolve_many, maxBatchSize=2, maxDelay=60)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.resolve(spec("a")), batcher.resolve(spec("b"))), 1
+        )
+        self.assertEqual(["a", "b"], results)
+
+    async def test_failing_batches_answer_every_caller(self):
+        """
+        Checks a failing resolution reaches every caller of the batch.
+        """
+
+        async def resolve_many(specs):
+            raise RuntimeError("backend down")
+
+        batcher = NixFlakeResolutionBatcher(resolve_many)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.resolve(spec("a")),
+                batcher.resolve(spec("b")),
+                return_exceptions=True,
+            ),
+            1,
+        )
+        self.assertEqual(2, len(results))
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+
+    async def test_unidentifiable_specs_fail_the_batch(self):
+        """
+        Checks a specification without name, version or url does not hang the batch.
+        """
+
+        async def resolve_many(specs):
+            return [item.name for item in specs]
+
+        batcher = NixFlakeResolutionBatcher(resolve_many)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.resolve(spec("a")),
+                batcher.resolve(types.SimpleNamespace()),
+                return_exceptions=True,
+            ),
+            1,
+        )
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    async def test_short_results_fail_the_batch(self):
+        """
+        Checks fewer results than specifications do not leave callers waiting.
+        """
+
+        async def resolve_many(specs):
+            return specs[:1]
+
+        batcher = NixFlakeResolutionBatcher(resolve_many)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.resolve(spec("a")),
+                batcher.resolve(spec("b")),
+                return_exceptions=True,
+            ),
+            1,
+        )
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,101 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_version_index.py
+
+This file tests the NixFlakeVersionIndexTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake.nix_flake_version_index import NixFlakeVersionIndex
+import types
+import unittest
+
+
+class NixFlakeVersionIndexTest(unittest.TestCase):
+    """
+    Tests NixFlakeVersionIndex.
+
+    Class name: NixFlakeVersionIndexTest
+
+    Responsibilities:
+        - Checks versions are kept sorted, and queried by range.
+        - Checks refreshes only ask for newer versions.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeVersionIndex
+    """
+
+    def test_versions_are_sorted_by_precedence(self):
+        """
+        Checks versions are sorted semantically, ignoring invalid and repeated ones.
+        """
+        index = NixFlakeVersionIndex()
+        added = index.add("a", ["0.10", "0.9", "bogus", "0.9", "1.0-rc.1", "0.2"])
+        self.assertEqual(4, added)
+        self.assertEqual(["0.2", "0.9", "0.10", "1.0-rc.1"], index.versions("a"))
+        self.assertEqual("1.0-rc.1", index.highest("a"))
+        self.assertIsNone(index.highest("b"))
+
+    def test_equivalent_spellings_are_all_kept(self):
+        """
+        Checks "1.0" and "1.0.0" are both indexed, and found by range queries.
+        """
+        index = NixFlakeVersionIndex()
+        self.assertEqual(3, index.add("a", ["1.0.0", "1.0", "1", "1.0"]))
+        self.assertEqual(["1", "1.0", "1.0.0"], index.versions("a"))
+        self.assertEqual(["1", "1.0", "1.0.0"], index.matching("a", "==1.0"))
+        self.assertEqual([], index.matching("a", ">1.0"))
+
+    def test_range_queries(self):
+        """
+        Checks matching versions, and the highest compatible one.
+        """
+        index = NixFlakeVersionIndex()
+        index.add("a", ["0.0.2", "0.0.3", "0.0.10", "0.1.0", "1.0"])
+        self.assertEqual(["0.0.3", "0.0.10"], index.matching("a", ">=0.0.3,<0.1"))
+        self.assertEqual("0.0.10", index.highest_compatible("a", "~0.0.3"))
+        self.assertEqual("1.0", index.highest_compatible("a", "latest"))
+        self.assertIsNone(index.highest_compatible("a", ">1.0"))
+
+    def test_refresh_asks_only_for_newer_versions(self):
+        """
+        Checks a refresh passes the highest indexed version to the repository.
+        """
+        requests = []
+
+        def versions(name, newerThan=None):
+            requests.append(newerThan)
+            return ["0.2", "0.3"]
+
+        index = NixFlakeVersionIndex()
+        repo = types.SimpleNamespace(versions=versions)
+        self.assertEqual(2, index.refresh(repo, "a"))
+        self.assertEqual(0, index.refresh(repo, "a"))
+        self.assertEqual([None, "0.3"], requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
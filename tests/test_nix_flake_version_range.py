@@ -0,0 +1,183 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_version_range.py
+
+This file tests the NixFlakeVersionRange class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import NixFlakeVersionRange
+import unittest
+
+
+class NixFlakeVersionRangeTest(unittest.TestCase):
+    """
+    Tests NixFlakeVersionRange.
+
+    Class name: NixFlakeVersionRangeTest
+
+    Responsibilities:
+        - Checks the constraints each supported operator accepts and rejects.
+        - Checks partial, "v"-prefixed and pre-release versions.
+        - Checks which texts are considered ranges.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeVersionRange
+    """
+
+    def assertMatches(self, text: str, accepted: list, rejected: list):
+        """
+        Checks given constraints accept and reject given versions.
+        :param text: The constraints.
+        :type text: str
+        :param accepted: The versions that must satisfy them.
+        :type accepted: List[str]
+        :param rejected: The versions that must not satisfy them.
+        :type rejected: List[str]
+        """
+        version_range = NixFlakeVersionRange(text)
+        for version in accepted:
+            with self.subTest(range=text, version=version):
+                self.assertIn(version, version_range)
+        for version in rejected:
+            with self.subTest(range=text, version=version):
+                self.assertNotIn(version, version_range)
+
+    def test_comparators(self):
+        """
+        Checks the basic comparison operators, alone and combined.
+        """
+        self.assertMatches(">=0.0.3", ["0.0.3", "0.1", "2.0"], ["0.0.2"])
+        self.assertMatches(">0.0.3", ["0.0.4"], ["0.0.3"])
+        self.assertMatches("<=1.2", ["1.2.0", "1.1.9"], ["1.2.1"])
+        self.assertMatches("<1.2", ["1.1.9"], ["1.2"])
+        self.assertMatches("==1.2", ["1.2", "1.2.0"], ["1.2.1"])
+        self.assertMatches("=1.2", ["1.2.0"], ["1.3"])
+        self.assertMatches("1.2", ["1.2.0"], ["1.2.1"])
+        self.assertMatches("!=1.2", ["1.2.1"], ["1.2.0"])
+        self.assertMatches(
+            ">=0.0.3, <0.1", ["0.0.3", "0.0.10"], ["0.0.2", "0.1.0", "1.0"]
+        )
+
+    def test_caret(self):
+        """
+        Checks ^ allows changes that do not modify the leftmost non-zero component.
+        """
+        self.assertMatches("^1.2.3", ["1.2.3", "1.9"], ["1.2.2", "2.0"])
+        self.assertMatches("^0.2.3", ["0.2.3", "0.2.9"], ["0.3.0"])
+        self.assertMatches("^0.0.3", ["0.0.3"], ["0.0.4", "0.0.2"])
+        self.assertMatches("^1.0", ["1.0.0", "1.9"], ["2.0"])
+        self.assertMatches("^0.0", ["0.0.0", "0.0.9"], ["0.1"])
+
+    def test_tilde(self):
+        """
+        Checks ~ allows patch-level changes.
+        """
+        self.assertMatches("~1.2.3", ["1.2.3", "1.2.9"], ["1.3.0", "1.2.2"])
+        self.assertMatches("~1.2", ["1.2.0", "1.2.9"], ["1.3"])
+        self.assertMatches("~0.0.3", ["0.0.3", "0.0.9"], ["0.1"])
+        self.assertMatches("~1", ["1.0", "1.9.9"], ["2.0", "0.9"])
+        self.assertMatches("~1.0", ["1.0.0", "1.0.9"], ["1.1"])
+
+    def test_partial_versions(self):
+        """
+        Checks x and * components match any value.
+        """
+        self.assertMatches("^0.0.x", ["0.0.0", "0.0.9"], ["0.1.0"])
+        self.assertMatches("^0.x", ["0.0.1", "0.9"], ["1.0"])
+        self.assertMatches("^1.2.x", ["1.2.0", "1.9"], ["1.1.9", "2.0"])
+        self.assertMatches("~1.2.x", ["1.2.0", "1.2.9"], ["1.3"])
+        self.assertMatches("~1.x", ["1.0", "1.9"], ["2.0"])
+        self.assertMatches("1.x", ["1.0", "1.9.9"], ["0.9", "2.0"])
+        self.assertMatches("1.2.*", ["1.2.0", "1.2.7"], ["1.3"])
+        self.assertMatches(">=1.x", ["1.0", "3.0"], ["0.9"])
+        self.assertMatches(">1.x", ["2.0"], ["1.9"])
+        self.assertMatches("<1.x", ["0.9"], ["1.0"])
+        self.assertMatches("<=1.x", ["1.9"], ["2.0"])
+        self.assertMatches("x", ["0.0.1", "9.9"], [])
+
+    def test_invalid_constraints(self):
+        """
+        Checks malformed constraints are rejected.
+        """
+        for text in ("!=1.x", ">x", "1.x1", ">=abc"):
+            with self.subTest(range=text):
+                with self.assertRaises(ValueError):
+                    NixFlakeVersionRange(text)
+
+    def test_v_prefix(self):
+        """
+        Checks "v"-prefixed versions, in constraints and candidates.
+        """
+        self.assertMatches(">=v1.2", ["1.2", "v1.3"], ["v1.1"])
+        self.assertMatches("v1.2.x", ["1.2.1", "v1.2.3"], ["v1.3"])
+        self.assertMatches("^v0.0.3", ["v0.0.3"], ["v0.0.4"])
+
+    def test_prereleases(self):
+        """
+        Checks pre-releases only match constraints mentioning one.
+        """
+        self.assertMatches(">=1.0", ["1.1"], ["1.1.0-beta", "2.0.0-rc.1"])
+        self.assertMatches(
+            "^1.0.0-rc.1",
+            ["1.0.0-rc.1", "1.0.0-rc.2", "1.0.0", "1.5"],
+            ["1.0.0-beta", "1.0.0-rc.0", "2.0.0"],
+        )
+        self.assertMatches(">=1.0.0-alpha, <1.0.0", ["1.0.0-beta"], ["1.0.0"])
+
+    def test_wildcards(self):
+        """
+        Checks empty, * and latest constraints accept any release.
+        """
+        for text in ("", "*", "latest", None):
+            with self.subTest(range=text):
+                self.assertIn("0.0.1", NixFlakeVersionRange(text))
+
+    def test_is_range(self):
+        """
+        Checks which texts denote ranges rather than exact versions.
+        """
+        for text in (None, "", "*", "latest", ">=1", "^0.0.3", "~1.2", "1.x", "x"):
+            with self.subTest(text=text):
+                self.assertTrue(NixFlakeVersionRange.is_range(text))
+        for text in ("1.2", "v1.2.3", "1.0.0-rc.1", "0.0.x1"):
+            with self.subTest(text=text):
+                self.assertFalse(NixFlakeVersionRange.is_range(text))
+
+    def test_bounds(self):
+        """
+        Checks the lower and upper bounds narrow down searches.
+        """
+        version_range = NixFlakeVersionRange(">=0.0.3,<0.1")
+        self.assertEqual("0.0.3", version_range.lower[0].text)
+        self.assertTrue(version_range.lower[1])
+        self.assertEqual("0.1", version_range.upper[0].text)
+        self.assertFalse(version_range.upper[1])
+        self.assertEqual((None, True), NixFlakeVersionRange("*").upper)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
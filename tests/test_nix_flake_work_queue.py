@@ -0,0 +1,151 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_nix_flake_work_queue.py
+
+This file tests the NixFlakeWorkQueueTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import asyncio
+from pythoneda.artifact.nix.flake import NixFlakeMetrics, NixFlakeWorkQueue
+import unittest
+
+
+class NixFlakeWorkQueueTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests NixFlakeWorkQueue.
+
+    Class name: NixFlakeWorkQueueTest
+
+    Responsibilities:
+        - Checks work runs with bounded concurrency, and full queues shed work.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.NixFlakeWorkQueue
+        - pythoneda.artifact.nix.flake.NixFlakeMetrics
+    """
+
+    async def test_workers_bound_concurrency(self):
+        """
+        Checks no more items run at once than there are workers.
+        """
+        queue = NixFlakeWorkQueue(workers=2, metrics=NixFlakeMetrics())
+        running = []
+        peak = []
+
+        async def work(value):
+            running.append(value)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+            return value * 2
+
+        results = await asyncio.gather(*[queue.submit(work, n) for n in range(6)])
+        await queue.close()
+        self.assertEqual([0, 2, 4, 6, 8, 10], results)
+        self.assertEqual(2, max(peak))
+
+    async def test_errors_reach_the_submitter(self):
+        """
+        Checks the error of an item is raised to its submitter only.
+        """
+        queue = NixFlakeWorkQueue(workers=1, metrics=NixFlakeMetrics())
+
+        async def fail():
+            raise RuntimeError("broken")
+
+        async def succeed():
+            return "ok"
+
+        with self.assertRaises(RuntimeError):
+            await queue.submit(fail)
+        self.assertEqual("ok", await queue.submit(succeed))
+        await queue.close()
+
+    async def test_full_queues_shed_work(self):
+        """
+        Checks the shed policy rejects items once the queue is full, and records it.
+        """
+        metrics = NixFlakeMetrics(enabled=True)
+        queue = NixFlakeWorkQueue(
+            "shedding",
+            maxSize=1,
+            workers=1,
+            policy=NixFlakeWorkQueue.SHED,
+            metrics=metrics,
+        )
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(queue.submit(work))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(queue.submit(work))
+        await asyncio.sleep(0.01)
+        self.assertEqual(1, queue.depth)
+        with self.assertRaises(asyncio.QueueFull):
+            await queue.submit(work)
+        release.set()
+        self.assertEqual(["done", "done"], await asyncio.gather(first, second))
+        await queue.close()
+        self.assertEqual(1, metrics.snapshot()["queues"]["shedding"]["shed"])
+
+    async def test_closing_cancels_queued_items(self):
+        """
+        Checks items still queued when closing are cancelled.
+        """
+        queue = NixFlakeWorkQueue(workers=1, metrics=NixFlakeMetrics())
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        running = asyncio.ensure_future(queue.submit(work))
+        await asyncio.sleep(0.01)
+        queued = asyncio.ensure_future(queue.submit(work))
+        await asyncio.sleep(0.01)
+        await queue.close()
+        with self.assertRaises(asyncio.CancelledError):
+            await queued
+        with self.assertRaises(asyncio.CancelledError):
+            await running
+
+    def test_invalid_settings_are_rejected(self):
+        """
+        Checks non-positive sizes and unknown policies are rejected.
+        """
+        with self.assertRaises(ValueError):
+            NixFlakeWorkQueue(maxSize=0)
+        with self.assertRaises(ValueError):
+            NixFlakeWorkQueue(workers=0)
+        with self.assertRaises(ValueError):
+            NixFlakeWorkQueue(policy="drop")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
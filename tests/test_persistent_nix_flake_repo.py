@@ -0,0 +1,223 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_persistent_nix_flake_repo.py
+
+This file tests the PersistentNixFlakeRepoTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import (
+    NixFlakeResolutionStore,
+    PersistentNixFlakeRepo,
+)
+from pythoneda.shared.nix.flake import NixFlake
+import os
+import sqlite3
+import tempfile
+import types
+import unittest
+
+
+def flake(name: str, version: str) -> NixFlake:
+    """
+    Builds a flake without inputs.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :return: The flake.
+    :rtype: pythoneda.shared.nix.flake.NixFlake
+    """
+    return NixFlake(
+        name,
+        version,
+        f"github:o/{name}/{version}",
+        [],
+        None,
+        name,
+        None,
+        [],
+        [],
+        None,
+    )
+
+
+def spec(name: str, version: str = "1.0"):
+    """
+    Builds a stand-in for a specification.
+    :param name: The flake name.
+    :type name: str
+    :param version: The version.
+    :type version: str
+    :return: The stand-in.
+    :rtype: types.SimpleNamespace
+    """
+    return types.SimpleNamespace(name=name, version=version, url=None)
+
+
+class CountingRepo:
+    """
+    A stand-in repository counting the specifications it resolves.
+
+    Class name: CountingRepo
+
+    Responsibilities:
+        - Resolves every specification to a flake.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self):
+        """
+        Creates a new CountingRepo instance.
+        """
+        self.resolved = []
+
+    def resolve_many(self, specs: list, failures: list = None) -> list:
+        """
+        Resolves given specifications.
+        :param specs: The specifications.
+        :type specs: list
+        :param failures: The list receiving the failed specifications.
+        :type failures: list
+        :return: The flakes.
+        :rtype: list
+        """
+        self.resolved.extend(item.name for item in specs)
+        return [flake(item.name, item.version) for item in specs]
+
+
+class PersistentNixFlakeRepoTest(unittest.TestCase):
+    """
+    Tests PersistentNixFlakeRepo and NixFlakeResolutionStore.
+
+    Class name: PersistentNixFlakeRepoTest
+
+    Responsibilities:
+        - Checks resolutions survive restarts, and both caches stay bounded.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.PersistentNixFlakeRepo
+        - pythoneda.artifact.nix.flake.NixFlakeResolutionStore
+    """
+
+    def setUp(self):
+        """
+        Creates a temporary SQLite file.
+        """
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(handle)
+
+    def tearDown(self):
+        """
+        Removes the temporary SQLite file.
+        """
+        os.remove(self.path)
+
+    def test_store_round_trips_versions_and_flakes_as_json(self):
+        """
+        Checks the store writes JSON, and reads back what it wrote.
+        """
+        store = NixFlakeResolutionStore(self.path)
+        store.save(("latest", "pkg"), "1.2.3")
+        store.save(("find", "pkg", "1.0"), flake("pkg", "1.0"))
+        store.close()
+        store = NixFlakeResolutionStore(self.path)
+        entries = store.load()
+        store.close()
+        self.assertEqual("1.2.3", entries[("latest", "pkg")][0])
+        restored = entries[("find", "pkg", "1.0")][0]
+        self.assertEqual(
+            ("pkg", "1.0", "github:o/pkg/1.0"),
+            (restored.name, restored.version, restored.url),
+        )
+        with sqlite3.connect(self.path) as connection:
+            payloads = [
+                row[0]
+                for row in connection.execute("SELECT payload FROM resolutions")
+            ]
+        for payload in payloads:
+            self.assertTrue(bytes(payload).startswith(b"{"))
+
+    def test_store_discards_tampered_entries(self):
+        """
+        Checks entries whose checksum does not match are not loaded.
+        """
+        store = NixFlakeResolutionStore(self.path)
+        store.save(("latest", "pkg"), "1.0")
+        with sqlite3.connect(self.path) as connection:
+            connection.execute(
+                "UPDATE resolutions SET payload = ?", (b'{"version":"6.6.6"}',)
+            )
+        self.assertEqual({}, store.load())
+        store.close()
+
+    def test_store_keeps_the_newest_entries(self):
+        """
+        Checks the store discards the oldest entries beyond its maximum.
+        """
+        store = NixFlakeResolutionStore(self.path, maxEntries=2)
+        for name in ["a", "b", "c"]:
+            store.save(("latest", name), "1.0")
+        self.assertEqual(
+            {("latest", "b"), ("latest", "c")}, set(store.load().keys())
+        )
+        store.close()
+
+    def test_resolutions_survive_restarts(self):
+        """
+        Checks a new repository answers from the store, without the delegate.
+        """
+        store = NixFlakeResolutionStore(self.path)
+        PersistentNixFlakeRepo(CountingRepo(), store).resolve_many([spec("pkg")])
+        store.close()
+        delegate = CountingRepo()
+        store = NixFlakeResolutionStore(self.path)
+        repo = PersistentNixFlakeRepo(delegate, store)
+        [restored] = repo.resolve_many([spec("pkg")])
+        store.close()
+        self.assertEqual(("pkg", "1.0"), (restored.name, restored.version))
+        self.assertEqual([], delegate.resolved)
+
+    def test_memory_keeps_the_most_recently_used_entries(self):
+        """
+        Checks the least recently used entries are evicted from memory.
+        """
+        delegate = CountingRepo()
+        store = NixFlakeResolutionStore(self.path)
+        repo = PersistentNixFlakeRepo(delegate, store, maxEntries=2)
+        repo.resolve_many([spec("a"), spec("b")])
+        repo.resolve_many([spec("a")])
+        repo.resolve_many([spec("c")])
+        self.assertEqual(2, len(repo))
+        repo.resolve_many([spec("a"), spec("b")])
+        store.close()
+        self.assertEqual(["a", "b", "c", "b"], delegate.resolved)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
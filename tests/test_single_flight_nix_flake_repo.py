@@ -0,0 +1,150 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_single_flight_nix_flake_repo.py
+
+This file tests the SingleFlightNixFlakeRepoTest class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import SingleFlightNixFlakeRepo
+import threading
+import time
+import unittest
+
+
+class SlowRepo:
+    """
+    A stand-in repository whose lookups wait for a signal.
+
+    Class name: SlowRepo
+
+    Responsibilities:
+        - Counts lookups, and answers them once released.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, error: Exception = None):
+        """
+        Creates a new SlowRepo instance.
+        :param error: If given, the error every lookup raises.
+        :type error: Exception
+        """
+        self.release = threading.Event()
+        self.lookups = 0
+        self.error = error
+
+    def latest_version(self, name: str) -> str:
+        """
+        Retrieves the latest version of given package, once released.
+        :param name: The package.
+        :type name: str
+        :return: Such version.
+        :rtype: str
+        """
+        self.lookups += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return "1.0"
+
+
+class SingleFlightNixFlakeRepoTest(unittest.TestCase):
+    """
+    Tests SingleFlightNixFlakeRepo.
+
+    Class name: SingleFlightNixFlakeRepoTest
+
+    Responsibilities:
+        - Checks concurrent identical lookups share a single call.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.SingleFlightNixFlakeRepo
+    """
+
+    def concurrently(self, repo: SingleFlightNixFlakeRepo, delegate: SlowRepo) -> list:
+        """
+        Looks up the latest version of a package from several threads at once.
+        :param repo: The repository.
+        :type repo: pythoneda.artifact.nix.flake.SingleFlightNixFlakeRepo
+        :param delegate: The decorated repository.
+        :type delegate: SlowRepo
+        :return: The outcome of each thread.
+        :rtype: list
+        """
+        outcomes = []
+
+        def run():
+            try:
+                outcomes.append(repo.latest_version("nixos"))
+            except Exception as error:
+                outcomes.append(error)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        self.assertEqual(1, repo.in_flight)
+        delegate.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(0, repo.in_flight)
+        return outcomes
+
+    def test_concurrent_lookups_are_coalesced(self):
+        """
+        Checks concurrent callers share the outcome of a single lookup.
+        """
+        delegate = SlowRepo()
+        repo = SingleFlightNixFlakeRepo(delegate)
+        self.assertEqual(["1.0"] * 4, self.concurrently(repo, delegate))
+        self.assertEqual(1, delegate.lookups)
+
+    def test_errors_are_shared(self):
+        """
+        Checks concurrent callers all see the error of the shared lookup.
+        """
+        error = RuntimeError("unavailable")
+        delegate = SlowRepo(error)
+        repo = SingleFlightNixFlakeRepo(delegate)
+        self.assertEqual([error] * 4, self.concurrently(repo, delegate))
+        self.assertEqual(1, delegate.lookups)
+
+    def test_sequential_lookups_are_not_coalesced(self):
+        """
+        Checks results are not remembered once the lookup finishes.
+        """
+        delegate = SlowRepo()
+        delegate.release.set()
+        repo = SingleFlightNixFlakeRepo(delegate)
+        repo.latest_version("nixos")
+        repo.latest_version("nixos")
+        self.assertEqual(2, delegate.lookups)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End:
@@ -0,0 +1,115 @@
+# vim: set fileencoding=utf-8
+"""
+tests/test_ttl_lru_cache.py
+
+This file tests the TtlLruCache class.
+
+Copyright (C) 2023-today rydnr's pythoneda-artifact/nix-flake
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.artifact.nix.flake import TtlLruCache
+import unittest
+
+
+class TtlLruCacheTest(unittest.TestCase):
+    """
+    Tests TtlLruCache.
+
+    Class name: TtlLruCacheTest
+
+    Responsibilities:
+        - Checks entries expire after their time-to-live.
+        - Checks the least recently used entries are evicted first.
+
+    Collaborators:
+        - pythoneda.artifact.nix.flake.TtlLruCache
+    """
+
+    def setUp(self):
+        """
+        Builds a cache driven by a manual clock.
+        """
+        self.now = 0.0
+        self.cache = TtlLruCache(10.0, 2, clock=lambda: self.now)
+
+    def test_entries_expire(self):
+        """
+        Checks entries are forgotten once their time-to-live elapses.
+        """
+        self.cache.put("a", 1)
+        self.cache.put("b", 2, ttl=20.0)
+        self.now = 9.9
+        self.assertEqual((True, 1), self.cache.lookup("a"))
+        self.now = 10.0
+        self.assertEqual((False, None), self.cache.lookup("a"))
+        self.assertEqual(2, self.cache.get("b"))
+        self.assertEqual("missing", self.cache.get("a", "missing"))
+
+    def test_none_values_are_found(self):
+        """
+        Checks None can be cached, and told apart from a missing entry.
+        """
+        self.cache.put("a", None)
+        self.assertEqual((True, None), self.cache.lookup("a"))
+        self.assertEqual((False, None), self.cache.lookup("b"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """
+        Checks lookups refresh recency, so the untouched entry is evicted.
+        """
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.lookup("a")
+        self.cache.put("c", 3)
+        self.assertEqual(2, len(self.cache))
+        self.assertEqual((False, None), self.cache.lookup("b"))
+        self.assertEqual(1, self.cache.get("a"))
+        self.assertEqual(3, self.cache.get("c"))
+
+    def test_invalidation(self):
+        """
+        Checks entries can be removed one by one, by predicate, or all at once.
+        """
+        cache = TtlLruCache(None, 10, clock=lambda: self.now)
+        for key in ("a1", "a2", "b1"):
+            cache.put(key, key)
+        self.assertTrue(cache.invalidate("b1"))
+        self.assertFalse(cache.invalidate("b1"))
+        self.assertEqual(2, cache.invalidate_matching(lambda key: key[0] == "a"))
+        self.assertEqual(0, len(cache))
+        cache.put("c", 1)
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+    def test_max_entries_must_be_positive(self):
+        """
+        Checks empty caches are rejected.
+        """
+        with self.assertRaises(ValueError):
+            TtlLruCache(1.0, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+# vim: syntax=python ts=4 sw=4 sts=4 tw=79 sr et
+# Local Variables:
+# mode: python
+# python-indent-offset: 4
+# tab-width: 4
+# indent-tabs-mode: nil
+# fill-column: 79
+# End: